@@ -1,8 +1,8 @@
-from django.db.models import Count, Avg
+from django.db.models import Sum
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from reviews_app.models import Review
+from reviews_app.models import BusinessRatingSummary
 from offers_app.models import Offer
 from profile_app.models import BusinessProfile
 
@@ -11,8 +11,13 @@ class BaseInfoView(APIView):
     permission_classes = [AllowAny]
     
     def get(self, request):
-        review_count = Review.objects.count()
-        average_rating = Review.objects.aggregate(Avg('rating'))['rating__avg'] or 0
+        # Totals over the per-business rating summaries instead of all reviews
+        totals = BusinessRatingSummary.objects.aggregate(
+            review_count=Sum('review_count'),
+            rating_sum=Sum('rating_sum')
+        )
+        review_count = totals['review_count'] or 0
+        average_rating = totals['rating_sum'] / review_count if review_count else 0
         business_profile_count = BusinessProfile.objects.count()
         offer_count = Offer.objects.count()
 
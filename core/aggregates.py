@@ -0,0 +1,111 @@
+"""
+Materialized aggregates kept up to date by model signals.
+
+An aggregate model holds one row per key, e.g. per business profile, with
+integer fields that the signals of the source model adjust with
+``field = field + delta``. The pieces shared by those aggregates live
+here: remembering which key a stored row counts towards, applying deltas
+to the aggregate rows, and a management command that recomputes all rows
+and reports the ones that drifted.
+"""
+from abc import ABCMeta, abstractmethod
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+def remember_loaded_values(instance, attr, fields):
+    """
+    Store the values of ``fields`` on ``instance`` as ``attr`` if they were
+    all loaded from the database. Call it from ``Model.from_db()``, so a
+    later save knows what the stored row counted towards without a query.
+    """
+    if not set(fields) & instance.get_deferred_fields():
+        setattr(instance, attr, tuple(getattr(instance, field) for field in fields))
+
+
+def remember_stored_values(instance, attr, fields):
+    """Look up the stored values of ``fields`` before a save if the instance did not load them."""
+    if instance._state.adding or hasattr(instance, attr):
+        return
+    rows = type(instance)._default_manager.filter(pk=instance.pk)
+    setattr(instance, attr, rows.values_list(*fields).first())
+
+
+def apply_deltas(model, key_fields, deltas):
+    """
+    Add ``deltas``, a mapping of key tuples to ``{field: delta}``, to the
+    rows of ``model`` identified by ``key_fields``. Missing rows are
+    created when they are incremented for the first time; keys with an
+    empty value are skipped. ``auto_now`` fields are set as well, which
+    ``QuerySet.update()`` does not do on its own.
+    """
+    touched = [field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+    for key, fields in deltas.items():
+        if any(value is None for value in key):
+            continue
+        changes = {name: F(name) + delta for name, delta in fields.items() if delta}
+        if not changes:
+            continue
+        now = timezone.now()
+        changes.update({name: now for name in touched})
+
+        lookup = dict(zip(key_fields, key))
+        rows = model._default_manager.filter(**lookup)
+        if rows.update(**changes) or all(delta <= 0 for delta in fields.values()):
+            continue
+        # Another transaction may create the row at the same time
+        model._default_manager.bulk_create([model(**lookup)], ignore_conflicts=True)
+        rows.update(**changes)
+
+
+class ReconcileCommand(BaseCommand, metaclass=ABCMeta):
+    """
+    Recompute an aggregate model from its source rows, e.g. after writes
+    that bypassed the signals. All rows are recomputed at once and
+    rewritten in one transaction. Subclasses set the model, its key and
+    value fields, and implement ``compute_expected()`` and ``describe()``.
+    """
+    model = None
+    key_fields = ()
+    value_fields = ()
+    # Plural name of the aggregate rows in the output
+    noun = 'rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help=f"Only report {self.noun} that drifted.")
+
+    @abstractmethod
+    def compute_expected(self):
+        """Return ``{key tuple: {value field: value}}`` computed from the source rows."""
+
+    @abstractmethod
+    def describe(self, key, stored, expected):
+        """Return one output line for a drifted row."""
+
+    def handle(self, *args, **options):
+        empty = dict.fromkeys(self.value_fields, 0)
+        with transaction.atomic():
+            expected = self.compute_expected()
+            stored = {
+                tuple(row[field] for field in self.key_fields): {field: row[field] for field in self.value_fields}
+                for row in self.model._default_manager.select_for_update()
+                .values(*self.key_fields, *self.value_fields)
+            }
+            drifted = sorted(
+                key for key in expected.keys() | stored.keys()
+                if expected.get(key, empty) != stored.get(key, empty)
+            )
+            for key in drifted:
+                self.stdout.write(self.describe(key, stored.get(key, empty), expected.get(key, empty)))
+
+            if drifted and not options['dry_run']:
+                self.model._default_manager.all().delete()
+                self.model._default_manager.bulk_create([
+                    self.model(**dict(zip(self.key_fields, key)), **values)
+                    for key, values in expected.items()
+                ], batch_size=1000)
+
+        verb = "Found" if options['dry_run'] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {len(drifted)} drifted {self.noun}."))
@@ -0,0 +1,47 @@
+"""
+Helpers for management commands that benchmark endpoints against large,
+generated data sets without touching the configured database.
+"""
+import os
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from django.db import connection
+
+
+@contextmanager
+def isolated_database():
+    """
+    Create a throwaway copy of the schema, like the test runner does, and
+    route the default connection to it for the duration of the block. On
+    SQLite the database is a temporary file rather than in memory, so large
+    data sets do not have to fit into RAM.
+    """
+    original_test_name = connection.settings_dict['TEST'].get('NAME')
+    with tempfile.TemporaryDirectory() as directory:
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'benchmark.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            yield connection
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            connection.settings_dict['TEST']['NAME'] = original_test_name
+
+
+def measure(function, repeat):
+    """Call ``function`` ``repeat`` times and return the durations in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def summarize(durations):
+    """Return median, 95th percentile and maximum of the durations."""
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return {'p50': statistics.median(ordered), 'p95': p95, 'max': ordered[-1]}
@@ -0,0 +1,44 @@
+"""
+Conditional GET support for detail endpoints.
+
+Views compute an ETag and a Last-Modified timestamp from a cheap query and
+let ``conditional_response`` answer ``If-None-Match``/``If-Modified-Since``
+with 304 Not Modified before the full object is loaded and serialized.
+"""
+import hashlib
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Return a strong ETag value derived from the given parts."""
+    raw = json.dumps(parts, cls=DjangoJSONEncoder)
+    return quote_etag(hashlib.sha256(raw.encode('utf-8')).hexdigest())
+
+
+def latest(*timestamps):
+    """Return the most recent of the given timestamps, ignoring None."""
+    return max((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+
+
+def conditional_response(request, etag, last_modified, build_response):
+    """
+    Return 304 Not Modified if the client's validators still match,
+    otherwise build the response. Both carry ``ETag`` and, when known,
+    ``Last-Modified``.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``, whose
+    resolution is limited to whole seconds.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = build_response()
+
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+    return response
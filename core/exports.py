@@ -0,0 +1,161 @@
+"""
+Streaming exports of whole tables for the analytics warehouse.
+
+An ``Exporter`` describes one data set as a queryset and a list of
+``values()`` fields. Rows are read with a chunked ``.iterator()`` and
+encoded as NDJSON or CSV while they are streamed, so memory use does not
+grow with the size of the table. The same exporters back the export
+endpoints (``ExportView``) and the export management commands
+(``ExportCommand``).
+"""
+import csv
+import json
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from core.params import parse_datetime_param, parse_moment
+
+OUTPUT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class _Line:
+    """File-like object that hands back what csv.writer writes."""
+
+    def write(self, value):
+        return value
+
+
+class Exporter:
+    """
+    One exportable data set. Subclasses set ``fields`` (``values()`` lookups,
+    used as column names) and either ``model`` or ``get_queryset()``.
+    ``updated_field`` is the lookup the ``updated_since`` cutoff applies to.
+    """
+    name = None
+    model = None
+    fields = []
+    updated_field = 'updated_at'
+    chunk_size = 2000
+    # Rows per chunk handed to the response or file
+    rows_per_write = 500
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def iter_rows(self, updated_since=None):
+        queryset = self.get_queryset()
+        if updated_since is not None:
+            queryset = queryset.filter(**{f'{self.updated_field}__gte': updated_since})
+        return queryset.order_by('pk').values_list(*self.fields).iterator(chunk_size=self.chunk_size)
+
+    def encode_ndjson(self, rows):
+        encoder = DjangoJSONEncoder(separators=(',', ':'))
+        for row in rows:
+            yield encoder.encode(dict(zip(self.fields, row))) + '\n'
+
+    def encode_csv(self, rows):
+        writer = csv.writer(_Line())
+        yield writer.writerow(self.fields)
+        for row in rows:
+            yield writer.writerow([
+                json.dumps(value, cls=DjangoJSONEncoder) if isinstance(value, (list, dict)) else value
+                for value in row
+            ])
+
+    def stream(self, output='ndjson', updated_since=None):
+        """Yield the encoded export in chunks of ``rows_per_write`` lines."""
+        encode = getattr(self, f'encode_{output}')
+        lines = []
+        for line in encode(self.iter_rows(updated_since)):
+            lines.append(line)
+            if len(lines) >= self.rows_per_write:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+
+class ExportView(APIView):
+    """
+    Stream an exporter's rows. Query parameters: ``output`` (``ndjson`` or
+    ``csv``; ``format`` is taken by DRF's content negotiation) and
+    ``updated_since`` (ISO 8601 date or datetime). Staff only.
+    """
+    permission_classes = [IsAdminUser]
+    exporter_class = None
+
+    def get(self, request, *args, **kwargs):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in OUTPUT_FORMATS:
+            raise ValidationError({'output': f"Choose one of: {', '.join(OUTPUT_FORMATS)}."})
+
+        updated_since = request.query_params.get('updated_since')
+        if updated_since:
+            updated_since = parse_datetime_param('updated_since', updated_since)
+
+        exporter = self.exporter_class()
+        response = StreamingHttpResponse(
+            exporter.stream(output, updated_since or None),
+            content_type=OUTPUT_FORMATS[output]
+        )
+        response['Content-Disposition'] = f'attachment; filename="{exporter.name}.{output}"'
+        return response
+
+
+class ExportCommand(BaseCommand):
+    """
+    Base for the export management commands. Subclasses list their
+    exporters in ``exporters``; the first one is the default data set.
+    """
+    exporters = []
+
+    def add_arguments(self, parser):
+        names = [exporter.name for exporter in self.exporters]
+        parser.add_argument('--dataset', choices=names, default=names[0])
+        parser.add_argument('--output', choices=list(OUTPUT_FORMATS), default='ndjson')
+        parser.add_argument('--updated-since', help="Only rows updated at or after this ISO 8601 date/datetime.")
+        parser.add_argument('--file', help="Write to this file instead of stdout.")
+        parser.add_argument('--benchmark', action='store_true',
+                            help="Discard the output and report rows per second and peak memory.")
+
+    def handle(self, *args, **options):
+        exporter = next(exporter() for exporter in self.exporters if exporter.name == options['dataset'])
+        updated_since = None
+        if options['updated_since']:
+            try:
+                updated_since = parse_moment(options['updated_since'])
+            except ValueError as error:
+                raise CommandError(str(error))
+
+        if options['benchmark']:
+            self.benchmark(exporter, options['output'], updated_since)
+        elif options['file']:
+            with open(options['file'], 'w', encoding='utf-8', newline='') as file:
+                file.writelines(exporter.stream(options['output'], updated_since))
+        else:
+            for chunk in exporter.stream(options['output'], updated_since):
+                self.stdout.write(chunk, ending='')
+
+    def benchmark(self, exporter, output, updated_since):
+        tracemalloc.start()
+        start = time.perf_counter()
+        rows = sum(chunk.count('\n') for chunk in exporter.stream(output, updated_since))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if output == 'csv':
+            rows -= 1
+        rate = rows / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{exporter.name}: {rows} rows in {elapsed:.2f} s, {rate:,.0f} rows/s, "
+            f"peak memory {peak / 1024 / 1024:.1f} MiB"
+        )
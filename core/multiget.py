@@ -0,0 +1,48 @@
+"""
+Multi-get mode for list endpoints: ``?ids=3,1,2`` returns exactly those
+objects, fetched with one query, in the requested order.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+
+class MultiGetMixin:
+    """
+    Let a list view answer ``?ids=...`` with ``{"results": [...], "missing": [...]}``.
+    ``results`` keep the order of the requested ids, ``missing`` lists the
+    ids that do not exist. At most ``max_multi_get_ids`` ids are accepted.
+    """
+    multi_get_param = 'ids'
+    max_multi_get_ids = 100
+
+    def is_multi_get(self):
+        return self.multi_get_param in self.request.query_params
+
+    def get_multi_get_ids(self):
+        """Parse the requested ids, dropping repeats but keeping their order."""
+        raw = self.request.query_params.get(self.multi_get_param)
+        if not raw:
+            raise ValidationError({self.multi_get_param: "This parameter is required."})
+        try:
+            ids = list(dict.fromkeys(int(value) for value in raw.split(',')))
+        except ValueError:
+            raise ValidationError({self.multi_get_param: "Expected a comma-separated list of integers."})
+        if len(ids) > self.max_multi_get_ids:
+            raise ValidationError({
+                self.multi_get_param: f"At most {self.max_multi_get_ids} ids can be requested at once."
+            })
+        return ids
+
+    def multi_get_response(self, queryset):
+        ids = self.get_multi_get_ids()
+        objects = queryset.in_bulk(ids)
+        serializer = self.get_serializer([objects[pk] for pk in ids if pk in objects], many=True)
+        return Response({
+            'results': serializer.data,
+            'missing': [pk for pk in ids if pk not in objects],
+        })
+
+    def list(self, request, *args, **kwargs):
+        if self.is_multi_get():
+            return self.multi_get_response(self.get_queryset())
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,265 @@
+"""
+Keyset (cursor) pagination shared by the list endpoints.
+
+Instead of ``COUNT(*)`` plus ``LIMIT/OFFSET`` every page is fetched with a
+``WHERE (ordering columns) > (values of the last row seen)`` condition, so
+page N costs the same as page 1 as long as the ordering is indexed.
+"""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, time
+from decimal import Decimal
+from django.core.exceptions import ImproperlyConfigured, ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in cursor pagination. Clients enable it with ``?pagination=cursor``
+    and then follow the ``next``/``previous`` links, which carry a
+    ``cursor`` parameter alongside the original filters.
+
+    The ordering is taken from the queryset itself, so existing
+    ``ordering`` query parameters keep working, and ``id`` is always
+    appended as a tie-breaker to make the order total and stable.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    mode_query_param = 'pagination'
+    mode = 'cursor'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    @classmethod
+    def is_requested(cls, request):
+        """Return True if the client asked for keyset pagination."""
+        params = request.query_params
+        return params.get(cls.mode_query_param) == cls.mode or cls.cursor_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self.reverse_ordering(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.annotate(**{
+            alias: F(field) for alias, field, _ in self.ordering if alias != 'pk'
+        }).order_by(*self.build_order_by(ordering))
+
+        if position is None:
+            segments = [queryset]
+        else:
+            try:
+                segments = [
+                    queryset.filter(condition)
+                    for condition in self.build_seek_segments(ordering, position)
+                ]
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = []
+        for segment in segments:
+            results += segment[:self.page_size + 1 - len(results)]
+            if len(results) > self.page_size:
+                break
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    # --- Ordering ------------------------------------------------------------
+
+    def get_ordering(self, queryset):
+        """
+        Return the ordering as ``(alias, field, descending)`` triples with
+        ``pk`` appended as the final tie-breaker.
+        """
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        keys = []
+        for index, item in enumerate(ordering):
+            if not isinstance(item, str) or item == '?':
+                raise ImproperlyConfigured(
+                    'KeysetPagination only supports ordering by field names.'
+                )
+            descending = item.startswith('-')
+            field = item.lstrip('-')
+            if field in ('pk', 'id'):
+                keys.append(('pk', 'pk', descending))
+                break
+            keys.append((f'keyset_{index}', field, descending))
+        else:
+            keys.append(('pk', 'pk', keys[-1][2] if keys else False))
+        return keys
+
+    @staticmethod
+    def reverse_ordering(ordering):
+        return [(alias, field, not descending) for alias, field, descending in ordering]
+
+    @staticmethod
+    def build_order_by(ordering):
+        # NULLs sort first ascending and last descending, which is SQLite's
+        # native behaviour, so indexes on the ordering columns stay usable.
+        return [
+            F(alias).desc(nulls_last=True) if descending else F(alias).asc(nulls_first=True)
+            for alias, _, descending in ordering
+        ]
+
+    @classmethod
+    def build_seek_segments(cls, ordering, position):
+        """
+        Split the seek condition into conditions that each map onto a single
+        index range, in the order their rows follow the cursor. A combined
+        ``a < x OR a IS NULL`` would make SQLite scan the index from the
+        start, so crossing the NULL boundary of the leading column is
+        answered by a second range instead.
+        """
+        (alias, _, descending), *rest_ordering = ordering
+        value, *rest_position = position
+        if not rest_ordering:
+            return [Q(**{f"{alias}__{'lt' if descending else 'gt'}": value})]
+
+        same_value = cls.build_seek_condition(rest_ordering, rest_position)
+        if value is None:
+            nulls = Q(**{f'{alias}__isnull': True}) & same_value
+            return [nulls] if descending else [nulls, Q(**{f'{alias}__isnull': False})]
+
+        after = Q(**{f"{alias}__{'lt' if descending else 'gt'}": value})
+        segment = after | (Q(**{alias: value}) & same_value)
+        return [segment, Q(**{f'{alias}__isnull': True})] if descending else [segment]
+
+    @staticmethod
+    def build_seek_condition(ordering, position):
+        """
+        Build ``(a, b, pk) > (x, y, z)`` as
+        ``a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)``,
+        honouring each column's direction and NULL placement.
+        """
+        condition = Q()
+        equal_so_far = Q()
+        for (alias, _, descending), value in zip(ordering, position):
+            if value is None:
+                # NULL is the smallest value: nothing follows it descending.
+                after = None if descending else Q(**{f'{alias}__isnull': False})
+                equal = Q(**{f'{alias}__isnull': True})
+            elif descending:
+                after = Q(**{f'{alias}__lt': value}) | Q(**{f'{alias}__isnull': True})
+                equal = Q(**{alias: value})
+            else:
+                after = Q(**{f'{alias}__gt': value})
+                equal = Q(**{alias: value})
+            if after is not None:
+                condition |= equal_so_far & after
+            equal_so_far &= equal
+        return condition
+
+    # --- Cursor encoding -----------------------------------------------------
+
+    def get_position(self, obj):
+        return [self.encode_value(getattr(obj, alias)) for alias, _, _ in self.ordering]
+
+    @staticmethod
+    def encode_value(value):
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, float):
+            return repr(value)
+        return value
+
+    def get_ordering_signature(self):
+        return [('-' if descending else '') + field for _, field, descending in self.ordering]
+
+    def encode_cursor(self, position, reverse):
+        payload = {'p': position, 'r': reverse, 'o': self.get_ordering_signature()}
+        encoded = urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        url = replace_query_param(url, self.mode_query_param, self.mode)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """Return ``(position, reverse)``; ``(None, False)`` for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            position, reverse, signature = payload['p'], bool(payload['r']), payload['o']
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        # A cursor is only meaningful for the ordering it was created with.
+        if signature != self.get_ordering_signature() or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+
+class KeysetPaginationMixin:
+    """
+    Let a list view switch to ``KeysetPagination`` when the client asks for
+    it, falling back to the view's regular ``pagination_class`` otherwise.
+    """
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.keyset_pagination_class.is_requested(self.request):
+                self._paginator = self.keyset_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
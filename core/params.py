@@ -0,0 +1,31 @@
+"""
+Parsing of query parameters and command options shared by several apps.
+"""
+from datetime import datetime
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def parse_moment(value):
+    """
+    Parse an ISO 8601 datetime, or a date meaning the start of that day.
+    Naive values use the current time zone. Raises ValueError.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date or datetime '{value}'.")
+        moment = datetime.combine(day, datetime.min.time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_datetime_param(name, value):
+    """Parse the query parameter ``name`` with ``parse_moment()``, as a 400 on errors."""
+    try:
+        return parse_moment(value)
+    except ValueError:
+        raise ValidationError({name: f"Invalid date or datetime '{value}'."})
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     'orders_app',
     'reviews_app',
     'base_info_app',
+    'idempotency_app',
     'corsheaders'
 ]
 
@@ -126,6 +127,21 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Stream uploads to a temporary file instead of buffering them in memory
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+# Offer image variants (see offers_app/image_pipeline.py). Set
+# OFFER_IMAGE_VARIANT_SIZES to override the default sizes. With
+# OFFER_IMAGE_PROCESS_INLINE the variants are rendered in the committing
+# process instead of the worker pool.
+OFFER_IMAGE_WORKERS = 2
+OFFER_IMAGE_PROCESS_INLINE = False
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -145,5 +161,42 @@ CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:5500"
 ]
 
+# Caching
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# The local-memory cache is per process and only fits development and the
+# tests. The offers list cache (offers_app/cache.py) invalidates pages
+# through a version key that all processes must see, so deployments with
+# more than one worker need a shared backend, e.g.
+#   'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#   'LOCATION': 'redis://127.0.0.1:6379',
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds a page of GET /api/offers/ stays cached. Entries are invalidated
+# on every offer write anyway, see offers_app/cache.py
+OFFERS_LIST_CACHE_TIMEOUT = 300
+
+# Feature text -> id entries kept per process, see orders_app/features.py
+ORDER_FEATURE_CACHE_SIZE = 1024
+
+# Completed or cancelled orders untouched for this many days are moved to
+# the archive by the archive_orders command
+ORDER_ARCHIVE_AFTER_DAYS = 365
+
+# Idempotency-Key handling, see idempotency_app/mixins.py: how long a stored
+# response is replayed, how long a retry waits for the first request, and
+# after how long an unfinished first request is presumed dead and re-run
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60
+IDEMPOTENCY_WAIT_SECONDS = 10
+IDEMPOTENCY_LOCK_SECONDS = 60
+
+# Largest page a client may request from GET /api/reviews/ with ?page_size=
+REVIEWS_MAX_PAGE_SIZE = 100
+
 # Custom User Model
 AUTH_USER_MODEL = 'auth_app.CustomUser'
\ No newline at end of file
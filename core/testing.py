@@ -0,0 +1,22 @@
+"""
+Helpers shared by the test suites of several apps.
+"""
+from django.db import connection
+
+
+def explain(queryset):
+    """Return the EXPLAIN QUERY PLAN detail lines for a queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[3] for row in cursor.fetchall()]
+
+
+def statements(queries, verb, table):
+    """
+    Return the captured ``INSERT``, ``UPDATE`` or ``DELETE`` statements that
+    write to ``table`` itself, not those that only read it in a subquery.
+    ``queries`` are the ``captured_queries`` of a ``CaptureQueriesContext``.
+    """
+    prefix = {'INSERT': 'INSERT INTO', 'DELETE': 'DELETE FROM'}.get(verb, verb)
+    return [query['sql'] for query in queries if query['sql'].startswith(f'{prefix} "{table}"')]
@@ -0,0 +1,181 @@
+"""
+``Idempotency-Key`` support for POST endpoints.
+
+The first request with a key claims it by inserting an IdempotencyKey row,
+unique per user, endpoint and key, and stores its response there once it
+is done. Retries with the same key get that response replayed instead of
+running the view again. A retry that arrives while the first request is
+still running waits for it and replays its result, so concurrent
+duplicates are coalesced into one execution. Requests that fail with an
+exception release the key so the client can try again.
+
+A claim is a lease that runs out after ``IDEMPOTENCY_LOCK_SECONDS``. If the
+worker dies before storing its response, a retry after that takes the key
+over and runs the request again instead of being locked out until the key
+expires. A request that only finishes after losing its lease does not
+overwrite the new owner's response.
+"""
+import hashlib
+import json
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+from .models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+# Response headers stored along with the body
+STORED_HEADERS = ('Location',)
+POLL_INTERVAL = 0.05
+MAX_CLAIM_ATTEMPTS = 3
+
+
+class IdempotencyKeyInUse(APIException):
+    status_code = 409
+    default_detail = 'A request with this Idempotency-Key is still being processed. Retry later.'
+    default_code = 'idempotency_key_in_use'
+
+
+class IdempotencyKeyMismatch(APIException):
+    status_code = 422
+    default_detail = 'This Idempotency-Key was already used for a different request.'
+    default_code = 'idempotency_key_mismatch'
+
+
+def get_request_hash(request):
+    """Hash the parsed payload; uploaded files count with their name and size."""
+    data = request.data
+    if hasattr(data, 'lists'):
+        data = {name: values for name, values in data.lists()}
+    payload = json.dumps(
+        data,
+        sort_keys=True,
+        default=lambda value: [getattr(value, 'name', None), getattr(value, 'size', None)]
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get_lease_end(now):
+    return now + timedelta(seconds=getattr(settings, 'IDEMPOTENCY_LOCK_SECONDS', 60))
+
+
+def is_lease_expired(record, now=None):
+    """Return True if ``record`` is unfinished and its owner is presumed dead."""
+    now = now or timezone.now()
+    return record.status_code is None and (record.locked_until is None or record.locked_until <= now)
+
+
+def take_over(record):
+    """
+    Claim an unfinished key whose lease ran out. Returns False if it was
+    finished or taken over by another request in the meantime.
+    """
+    now = timezone.now()
+    if not is_lease_expired(record, now):
+        return False
+    locked_until = get_lease_end(now)
+    taken = IdempotencyKey.objects.filter(
+        pk=record.pk, status_code__isnull=True, locked_until=record.locked_until
+    ).update(locked_until=locked_until)
+    if taken:
+        record.locked_until = locked_until
+    return bool(taken)
+
+
+def claim_key(user, endpoint, key, request_hash):
+    """
+    Try to claim ``key``. Returns ``(record, True)`` if this request owns it
+    now, otherwise ``(existing record or None, False)``. An expired record
+    is deleted and reported as None, so the caller can claim it again.
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=user,
+                endpoint=endpoint,
+                key=key,
+                request_hash=request_hash,
+                locked_until=get_lease_end(now),
+                expires_at=now + timedelta(seconds=getattr(settings, 'IDEMPOTENCY_KEY_TTL', 24 * 60 * 60))
+            )
+            return record, True
+    except IntegrityError:
+        record = IdempotencyKey.objects.filter(user=user, endpoint=endpoint, key=key).first()
+    if record is not None and record.expires_at <= now:
+        IdempotencyKey.objects.filter(pk=record.pk, expires_at__lte=now).delete()
+        record = None
+    return record, False
+
+
+def wait_for_response(record):
+    """
+    Wait until the request owning ``record`` stored its response and return
+    the updated record, or None if that request failed and released the key.
+    Returns the still unfinished record once its lease ran out.
+    """
+    deadline = time.monotonic() + getattr(settings, 'IDEMPOTENCY_WAIT_SECONDS', 10)
+    while record is not None and record.status_code is None:
+        if is_lease_expired(record):
+            return record
+        if time.monotonic() >= deadline:
+            raise IdempotencyKeyInUse()
+        time.sleep(POLL_INTERVAL)
+        record = IdempotencyKey.objects.filter(pk=record.pk).first()
+    return record
+
+
+def replay_response(record):
+    headers = {**record.response_headers, REPLAYED_HEADER: 'true'}
+    return Response(record.response_data, status=record.status_code, headers=headers)
+
+
+class IdempotentCreateMixin:
+    """
+    Honor an ``Idempotency-Key`` header on POST. Requests without the header
+    or without an authenticated user are handled as before.
+    """
+
+    def post(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key or not request.user.is_authenticated:
+            return super().post(request, *args, **kwargs)
+        if len(key) > IdempotencyKey._meta.get_field('key').max_length:
+            raise ValidationError({IDEMPOTENCY_HEADER: "The key must be at most 255 characters long."})
+
+        endpoint = f'{request.method} {request.path}'
+        request_hash = get_request_hash(request)
+        for _ in range(MAX_CLAIM_ATTEMPTS):
+            record, claimed = claim_key(request.user, endpoint, key, request_hash)
+            if claimed:
+                break
+            if record is None:
+                continue
+            if record.request_hash != request_hash:
+                raise IdempotencyKeyMismatch()
+            if take_over(record):
+                break
+            record = wait_for_response(record)
+            if record is not None and record.status_code is not None:
+                return replay_response(record)
+        else:
+            raise IdempotencyKeyInUse()
+
+        # Only touch the key while this request still holds the lease
+        owned = IdempotencyKey.objects.filter(pk=record.pk, locked_until=record.locked_until)
+        try:
+            response = super().post(request, *args, **kwargs)
+        except Exception:
+            owned.filter(status_code__isnull=True).delete()
+            raise
+
+        owned.update(
+            status_code=response.status_code,
+            response_data=response.data,
+            response_headers={name: response[name] for name in STORED_HEADERS if response.has_header(name)}
+        )
+        return response
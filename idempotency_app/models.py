@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+class IdempotencyKey(models.Model):
+    """
+    A client supplied ``Idempotency-Key`` and the first response sent for
+    it. ``status_code`` is empty while that first request is still running;
+    ``locked_until`` is when another request may take over an unfinished
+    key whose owner died.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys'
+    )
+    endpoint = models.CharField(max_length=255)
+    key = models.CharField(max_length=255)
+    # Hash of the request payload; reusing a key for a different payload is an error
+    request_hash = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_data = models.JSONField(encoder=DjangoJSONEncoder, null=True, blank=True)
+    response_headers = models.JSONField(default=dict, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'endpoint', 'key'], name='idempotency_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='idempotency_key_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.endpoint} {self.key}"
@@ -0,0 +1,173 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.test import APITestCase
+from rest_framework import status
+from idempotency_app.models import IdempotencyKey
+from orders_app.models import Order
+from offers_app.models import Offer, OfferDetail
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class IdempotencyKeyTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.customer_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="customer"
+        )
+        BusinessProfile.objects.create(user=self.business_user)
+        CustomerProfile.objects.create(user=self.customer_user)
+        offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=2, delivery_time_in_days=5, price=100,
+            features=["Logo Design"], offer_type="basic"
+        )
+        self.client.force_authenticate(user=self.customer_user)
+
+    def create_order(self, key, offer_detail_id=None):
+        return self.client.post(
+            reverse('orders-list'),
+            {'offer_detail_id': offer_detail_id or self.offer_detail.pk},
+            format='json',
+            headers={'Idempotency-Key': key} if key else {}
+        )
+
+    def test_retry_replays_the_first_response(self):
+        first = self.create_order("order-1")
+        retry = self.create_order("order-1")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_requests_without_a_key_are_not_deduplicated(self):
+        self.create_order(None)
+        self.create_order(None)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_keys_are_scoped_per_user(self):
+        self.create_order("shared")
+        other_customer = CustomUser.objects.create_user(username="erika", password="password24!", type="customer")
+        CustomerProfile.objects.create(user=other_customer)
+        self.client.force_authenticate(user=other_customer)
+        self.create_order("shared")
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_reusing_a_key_for_another_payload_is_rejected(self):
+        self.create_order("order-1")
+        other = OfferDetail.objects.create(offer=self.offer_detail.offer, title="Premium", revisions=1, price=300)
+
+        response = self.create_order("order-1", other.pk)
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Order.objects.count(), 1)
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0)
+    def test_key_still_in_progress_is_a_conflict(self):
+        self.create_order("order-1")
+        IdempotencyKey.objects.update(status_code=None, response_data=None)
+
+        response = self.create_order("order-1")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_unfinished_key_past_its_lease_is_run_again(self):
+        # The first request died after claiming the key
+        self.create_order("order-1")
+        IdempotencyKey.objects.update(
+            status_code=None, response_data=None, locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        response = self.create_order("order-1")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Order.objects.count(), 2)
+
+        replayed = self.create_order("order-1")
+        self.assertEqual(replayed['Idempotent-Replayed'], 'true')
+        self.assertEqual(replayed.data, response.data)
+
+    def test_waiting_retry_takes_over_once_the_lease_runs_out(self):
+        self.create_order("order-1")
+        IdempotencyKey.objects.update(status_code=None, response_data=None)
+
+        def lease_runs_out(seconds):
+            IdempotencyKey.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        with mock.patch('idempotency_app.mixins.time.sleep', side_effect=lease_runs_out):
+            response = self.create_order("order-1")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.get().status_code, status.HTTP_201_CREATED)
+
+    def test_request_that_lost_its_lease_keeps_the_new_response(self):
+        original_post = generics.ListCreateAPIView.post
+
+        def post_while_being_taken_over(view, request, *args, **kwargs):
+            response = original_post(view, request, *args, **kwargs)
+            # Another request took the key over in the meantime
+            IdempotencyKey.objects.update(locked_until=timezone.now() + timedelta(minutes=5))
+            return response
+
+        with mock.patch.object(generics.ListCreateAPIView, 'post', post_while_being_taken_over):
+            self.create_order("order-1")
+
+        self.assertIsNone(IdempotencyKey.objects.get().status_code)
+
+    def test_concurrent_duplicate_waits_for_the_first_response(self):
+        first = self.create_order("order-1")
+        stored = IdempotencyKey.objects.values('status_code', 'response_data').get()
+        IdempotencyKey.objects.update(status_code=None, response_data=None)
+
+        def first_request_finishes(seconds):
+            IdempotencyKey.objects.update(**stored)
+
+        with mock.patch('idempotency_app.mixins.time.sleep', side_effect=first_request_finishes) as sleep:
+            retry = self.create_order("order-1")
+
+        sleep.assert_called_once()
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_expired_key_runs_the_request_again(self):
+        self.create_order("order-1")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = self.create_order("order-1")
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_failed_request_releases_the_key(self):
+        self.client.force_authenticate(user=self.business_user)
+        headers = {'Idempotency-Key': "offer-1"}
+
+        response = self.client.post(reverse('offers-list'), {"title": "Offer", "details": []}, format='json', headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_purge_deletes_expired_keys_in_batches(self):
+        for index in range(5):
+            self.create_order(f"order-{index}")
+        IdempotencyKey.objects.filter(key__in=["order-0", "order-1", "order-2"]).update(
+            expires_at=timezone.now() - timedelta(hours=1)
+        )
+
+        stdout = StringIO()
+        call_command('purge_idempotency_keys', batch_size=2, stdout=stdout)
+
+        self.assertIn("Deleted 3", stdout.getvalue())
+        self.assertEqual(sorted(IdempotencyKey.objects.values_list('key', flat=True)), ["order-3", "order-4"])
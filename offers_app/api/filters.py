@@ -0,0 +1,28 @@
+from offers_app.search import search_offers
+
+def filter_offers(queryset, params):
+    """
+    Apply the offer filters shared by the list and the facets endpoint:
+    creator_id, min_price, max_delivery_time and the full-text search.
+    """
+    # Filter by creator_id
+    creator_id = params.get('creator_id')
+    if creator_id is not None:
+        queryset = queryset.filter(user_id=creator_id)
+
+    # Filter by min_price
+    min_price = params.get('min_price')
+    if min_price:
+        queryset = queryset.filter(min_price__gte=min_price)
+
+    # Filter by max_delivery_time
+    max_delivery_time = params.get('max_delivery_time')
+    if max_delivery_time:
+        queryset = queryset.filter(min_delivery_time__lte=max_delivery_time)
+
+    # Apply full-text search, ranked by relevance unless ordering is given
+    search = params.get('search')
+    if search:
+        queryset = search_offers(queryset, search)
+
+    return queryset
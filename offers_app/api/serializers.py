@@ -1,11 +1,33 @@
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from offers_app.models import Offer, OfferDetail
+from offers_app.cache import invalidate_offers
+from offers_app.image_pipeline import schedule_offer_image
+from offers_app.models import Offer, OfferDetail, get_offer_type_flags
+from profile_app.loaders import ProfileLoader, ProfilePrimingListSerializer
 from profile_app.models import CustomerProfile, BusinessProfile
 
 class ProfileUpdateSerializer(serializers.Serializer):
     first_name = serializers.CharField(required=False)
     last_name = serializers.CharField(required=False)
 
+class ImageVariantsField(serializers.ReadOnlyField):
+    """
+    URLs of the resized image variants as {size: {format: url}}, absolute
+    when the request is available like those of the image field itself.
+    """
+    def to_representation(self, value):
+        request = self.context.get('request')
+        return {
+            size: {
+                image_format: request.build_absolute_uri(default_storage.url(name)) if request else default_storage.url(name)
+                for image_format, name in formats.items()
+            }
+            for size, formats in value.items()
+        }
+
+
 class OfferDetailListSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
 
@@ -38,11 +60,62 @@ class OfferDetailCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+def get_detail_aggregates(details_data):
+    """
+    Compute min_price, min_delivery_time and offer_types from validated
+    detail payloads, skipping empty values, so no query is needed to
+    derive them.
+    """
+    min_price = min((detail['price'] for detail in details_data if detail.get('price')), default=None)
+    min_delivery_time = min(
+        (detail['delivery_time_in_days'] for detail in details_data if detail.get('delivery_time_in_days')),
+        default=None
+    )
+    return {
+        'min_price': min_price,
+        'min_delivery_time': min_delivery_time,
+        'offer_types': get_offer_type_flags(detail.get('offer_type') for detail in details_data),
+    }
+
+
+class OfferBulkCreateSerializer(serializers.ListSerializer):
+    """
+    Create a whole batch of offers with one INSERT for all offers and one
+    for all of their details, inside a single transaction.
+    """
+    batch_size = 500
+
+    @transaction.atomic
+    def create(self, validated_data):
+        offers = []
+        details_per_offer = []
+        for offer_data in validated_data:
+            details_data = offer_data.pop('offer_details', [])
+            offers.append(Offer(**get_detail_aggregates(details_data), **offer_data))
+            details_per_offer.append(details_data)
+
+        Offer.objects.bulk_create(offers, batch_size=self.batch_size)
+        OfferDetail.objects.bulk_create(
+            [
+                OfferDetail(offer=offer, **detail_data)
+                for offer, details_data in zip(offers, details_per_offer)
+                for detail_data in details_data
+            ],
+            batch_size=self.batch_size
+        )
+        # bulk_create sends no signals
+        invalidate_offers()
+        for offer in offers:
+            schedule_offer_image(offer)
+        return offers
+
+
 class OfferCreateSerializer(serializers.ModelSerializer):
     details = OfferDetailCreateSerializer(source='offer_details', many=True)
 
     class Meta:
         model = Offer
+        list_serializer_class = OfferBulkCreateSerializer
         fields = [
             'id', 
             'title', 
@@ -60,21 +133,13 @@ class OfferCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("At least three offer details are required.")
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
         details_data = validated_data.pop('offer_details', [])
-        offer = Offer.objects.create(**validated_data)
-        
-        for detail_data in details_data:
-            features = detail_data.pop('features', [])
-            offer_detail = OfferDetail.objects.create(offer=offer, **detail_data)
-            offer_detail.features = features
-            offer_detail.save()
-        
-        if offer.offer_details.exists():
-            offer.min_price = min((detail.price for detail in offer.offer_details.all() if detail.price), default=None)
-            offer.min_delivery_time = min((detail.delivery_time_in_days for detail in offer.offer_details.all() if detail.delivery_time_in_days), default=None)
-            offer.save()
-        
+        offer = Offer.objects.create(**get_detail_aggregates(details_data), **validated_data)
+        OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **detail_data) for detail_data in details_data]
+        )
         return offer
 
 class UserDetailsSerializer(serializers.Serializer):
@@ -84,6 +149,7 @@ class UserDetailsSerializer(serializers.Serializer):
 
 class OfferListSerializer(serializers.ModelSerializer):
     details = OfferDetailListSerializer(source='offer_details', many=True, read_only=True)
+    image_variants = ImageVariantsField()
     user_details = UserDetailsSerializer(source='user', read_only=True)
 
     class Meta:
@@ -93,6 +159,7 @@ class OfferListSerializer(serializers.ModelSerializer):
             'user', 
             'title', 
             'image', 
+            'image_variants', 
             'description', 
             'created_at', 
             'updated_at', 
@@ -114,14 +181,17 @@ class OfferListSerializer(serializers.ModelSerializer):
 
 class SingleOfferSerializer(serializers.ModelSerializer):
     details = OfferDetailListSerializer(source='offer_details', many=True, read_only=True)
+    image_variants = ImageVariantsField()
     user_details = serializers.SerializerMethodField()
 
     class Meta:
         model = Offer
+        list_serializer_class = ProfilePrimingListSerializer
         fields = [
             'id', 
             'title', 
             'image', 
+            'image_variants', 
             'description', 
             'created_at', 
             'updated_at', 
@@ -142,11 +212,8 @@ class SingleOfferSerializer(serializers.ModelSerializer):
 
     def get_user_details(self, obj):
         if obj.user:
-            if obj.user.type == 'business':
-                profile = obj.user.business_profile
-            elif obj.user.type == 'customer':
-                profile = obj.user.customer_profile
-            else:
+            profile = ProfileLoader.for_context(self.context).get(obj.user)
+            if profile is None:
                 return None
             return {
                 'first_name': profile.first_name,
@@ -155,8 +222,16 @@ class SingleOfferSerializer(serializers.ModelSerializer):
             }
         return None
 
+class OfferDetailUpdateSerializer(OfferDetailCreateSerializer):
+    """
+    Details in a PATCH payload: with an id they update that detail,
+    without one they are added to the offer.
+    """
+    id = serializers.IntegerField(required=False)
+
+
 class SingleOfferUpdateSerializer(serializers.ModelSerializer):
-    details = OfferDetailCreateSerializer(source='offer_details', many=True, required=False)
+    details = OfferDetailUpdateSerializer(source='offer_details', many=True, required=False)
     user_details = ProfileUpdateSerializer(required=False)
 
     class Meta:
@@ -183,35 +258,67 @@ class SingleOfferUpdateSerializer(serializers.ModelSerializer):
         representation.pop('min_delivery_time', None)
         return representation
     
+    @transaction.atomic
     def update(self, instance, validated_data):
+        details_data = validated_data.pop('offer_details', None)
+        # Resolve the referenced details before anything is written
+        details_by_id = self.get_existing_details(instance, details_data or [])
+
         # Update basic offer fields
         for attr, value in validated_data.items():
-            if attr != 'offer_details':
-                setattr(instance, attr, value)
+            setattr(instance, attr, value)
         instance.save()
 
-        # Handle offer details
-        details_data = validated_data.get('offer_details')
         if details_data:
-            for detail_data in details_data:
-                detail_id = detail_data.get('id')
-                if detail_id:
-                    # Update existing detail
-                    detail = instance.offer_details.get(id=detail_id)
-                    for attr, value in detail_data.items():
-                        if attr != 'id':
-                            setattr(detail, attr, value)
-                    detail.save()
-                else:
-                    # Create new detail
-                    OfferDetail.objects.create(offer=instance, **detail_data)
-            
-            # Recalculate min_price and min_delivery_time
-            instance.min_price = min((d.price for d in instance.offer_details.all() if d.price), default=None)
-            instance.min_delivery_time = min((d.delivery_time_in_days for d in instance.offer_details.all() if d.delivery_time_in_days), default=None)
-            instance.save()
+            self.update_details(instance, details_data, details_by_id)
         return instance
 
+    def get_existing_details(self, instance, details_data):
+        """
+        Fetch all details referenced by id in one query. Ids that are unknown,
+        belong to another offer or appear twice are rejected.
+        """
+        detail_ids = [detail_data['id'] for detail_data in details_data if 'id' in detail_data]
+        duplicates = sorted({detail_id for detail_id in detail_ids if detail_ids.count(detail_id) > 1})
+        if duplicates:
+            raise serializers.ValidationError({'details': f"Duplicate detail ids: {duplicates}"})
+        if not detail_ids:
+            return {}
+
+        details_by_id = instance.offer_details.in_bulk(detail_ids)
+        unknown = sorted(set(detail_ids) - set(details_by_id))
+        if unknown:
+            raise serializers.ValidationError({'details': f"Unknown detail ids for this offer: {unknown}"})
+        return details_by_id
+
+    def update_details(self, instance, details_data, details_by_id):
+        """
+        Apply changed details with one bulk UPDATE, insert new ones with one
+        bulk INSERT and recompute the offer's aggregates in one statement.
+        """
+        changed_details = []
+        changed_fields = set()
+        new_details = []
+        for detail_data in details_data:
+            detail_id = detail_data.pop('id', None)
+            if detail_id is None:
+                new_details.append(OfferDetail(offer=instance, **detail_data))
+                continue
+            detail = details_by_id[detail_id]
+            for attr, value in detail_data.items():
+                setattr(detail, attr, value)
+            changed_fields.update(detail_data)
+            changed_details.append(detail)
+
+        if changed_fields:
+            OfferDetail.objects.bulk_update(changed_details, sorted(changed_fields))
+        if new_details:
+            OfferDetail.objects.bulk_create(new_details)
+
+        # The bulk operations send no signals, so the aggregates are refreshed here
+        Offer.objects.filter(pk=instance.pk).refresh_detail_aggregates(updated_at=timezone.now())
+        instance.refresh_from_db(fields=['min_price', 'min_delivery_time', 'offer_types', 'updated_at'])
+
 class SingleOfferDeleteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Offer
@@ -1,8 +1,13 @@
 from django.urls import path
-from .views import OffersListView, SingleOfferView, SingleOfferDetailView
+from .views import OffersListView, OfferFacetsView, OfferBatchCreateView, SingleOfferView, OfferDetailListView, SingleOfferDetailView, OfferExportView, OfferDetailExportView
 
 urlpatterns = [
     path('offers/', OffersListView.as_view(), name='offers-list'),
+    path('offers/facets/', OfferFacetsView.as_view(), name='offers-facets'),
+    path('offers/export/', OfferExportView.as_view(), name='offers-export'),
+    path('offers/batch/', OfferBatchCreateView.as_view(), name='offers-batch'),
     path('offers/<int:pk>/', SingleOfferView.as_view(), name='single-offer'),
+    path('offerdetails/', OfferDetailListView.as_view(), name='offer-details'),
+    path('offerdetails/export/', OfferDetailExportView.as_view(), name='offer-details-export'),
     path('offerdetails/<int:pk>/', SingleOfferDetailView.as_view(), name='single-offer-detail')
 ]
\ No newline at end of file
@@ -1,60 +1,116 @@
+from django.db.models import Prefetch, prefetch_related_objects
+from django.shortcuts import get_object_or_404
 from offers_app.models import Offer, OfferDetail
-from rest_framework import generics
+from offers_app.cache import cached_list_response
+from offers_app.exports import OfferExporter, OfferDetailExporter
+from offers_app.facets import compute_facets
+from core.conditional import conditional_response, latest, make_etag
+from core.exports import ExportView
+from core.multiget import MultiGetMixin
+from core.pagination import KeysetPaginationMixin
+from idempotency_app.mixins import IdempotentCreateMixin
+from profile_app.loaders import ProfileLoader
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from .serializers import OfferCreateSerializer, OfferListSerializer, SingleOfferSerializer, SingleOfferUpdateSerializer, SingleOfferDeleteSerializer, SingleOfferDetailSerializer
+from .filters import filter_offers
 from .permissions import IsBusinessUser, SingleOfferPermission, SingleOfferDetailPermission
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
 
-class OffersListView(generics.ListCreateAPIView):
+class OffersListView(IdempotentCreateMixin, MultiGetMixin, KeysetPaginationMixin, generics.ListCreateAPIView):
     permission_classes = [IsBusinessUser]
     pagination_class = CustomPageNumberPagination
+    # Only orderings backed by an index on Offer may be requested
+    ordering_fields = ['min_price', 'min_delivery_time', 'updated_at']
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return OfferCreateSerializer
         return OfferListSerializer
 
+    def list(self, request, *args, **kwargs):
+        return cached_list_response(request, lambda: super(OffersListView, self).list(request, *args, **kwargs))
+
     def get_queryset(self):
-        queryset = Offer.objects.all()
-        
-        # Filter by creator_id
-        creator_id = self.request.query_params.get('creator_id')
-        if creator_id is not None:
-            queryset = queryset.filter(user_id=creator_id)
-
-        # Filter by min_price
-        min_price = self.request.query_params.get('min_price')
-        if min_price:
-            queryset = queryset.filter(min_price__gte=min_price)
-
-        # Filter by max_delivery_time
-        max_delivery_time = self.request.query_params.get('max_delivery_time')
-        if max_delivery_time:
-            queryset = queryset.filter(min_delivery_time__lte=max_delivery_time)
-
-        # Apply search
-        search = self.request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(title__icontains=search) | queryset.filter(description__icontains=search)
+        # Load the creator with a join and all details of the page in one
+        # batched query, so the number of queries does not grow with page_size.
+        queryset = Offer.objects.select_related('user').prefetch_related(
+            Prefetch('offer_details', queryset=OfferDetail.objects.only('id', 'offer_id'))
+        )
+        if self.is_multi_get():
+            # ?ids= fetches exactly the requested offers, filters do not apply
+            return queryset
+
+        queryset = filter_offers(queryset, self.request.query_params)
 
         # Apply ordering
         ordering = self.request.query_params.get('ordering')
         if ordering:
-            queryset = queryset.order_by(ordering)
+            queryset = queryset.order_by(self.validate_ordering(ordering))
 
         return queryset
+
+    def validate_ordering(self, ordering):
+        if ordering.lstrip('-') not in self.ordering_fields:
+            allowed = ', '.join(self.ordering_fields)
+            raise ValidationError({'ordering': f"Invalid ordering '{ordering}'. Allowed fields: {allowed}."})
+        return ordering
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user if self.request.user.is_authenticated else None)
 
+class OfferFacetsView(generics.GenericAPIView):
+    """
+    Counts for the offer filter sidebar: a price histogram, offers per
+    delivery time threshold and offers per detail offer_type. Accepts the
+    same filters as the offers list and is cached like it.
+    """
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        return filter_offers(Offer.objects.all(), self.request.query_params)
+
+    def get(self, request, *args, **kwargs):
+        return cached_list_response(request, lambda: Response(compute_facets(self.get_queryset())))
+
+class OfferBatchCreateView(IdempotentCreateMixin, generics.CreateAPIView):
+    """
+    Create many offers in one request and one transaction.
+    Expects a JSON list of offers shaped like the POST /api/offers/ payload.
+    """
+    serializer_class = OfferCreateSerializer
+    permission_classes = [IsBusinessUser]
+    max_batch_size = 1000
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.max_batch_size
+        )
+        serializer.is_valid(raise_exception=True)
+        offers = serializer.save(user=request.user)
+
+        # Re-read the batch with its details in two queries for the response
+        created = Offer.objects.filter(pk__in=[offer.pk for offer in offers]).prefetch_related('offer_details').order_by('pk')
+        return Response(self.get_serializer(created, many=True).data, status=status.HTTP_201_CREATED)
+
 class SingleOfferView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Offer.objects.all()
     permission_classes = [SingleOfferPermission]
 
+    def get_queryset(self):
+        # The creator's profile comes along for the ETag and user_details
+        return Offer.objects.select_related(
+            'user', 'user__businessprofile_profile', 'user__customerprofile_profile'
+        )
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return SingleOfferSerializer
@@ -62,7 +118,29 @@ class SingleOfferView(generics.RetrieveUpdateDestroyAPIView):
             return SingleOfferUpdateSerializer
         elif self.request.method == 'DELETE':
             return SingleOfferDeleteSerializer
-        
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        The offer row alone decides between 304 and a full response. Detail
+        writes touch the offer's updated_at, so the ETag covers them too;
+        the details themselves are only loaded for a full response.
+        """
+        offer = self.get_object()
+        profile = ProfileLoader.for_request(request).get(offer.user)
+        profile_updated_at = profile.updated_at if profile else None
+        user = offer.user
+        etag = make_etag(
+            offer.pk, offer.updated_at, user and user.username, user and user.type, profile_updated_at
+        )
+
+        def build_response():
+            prefetch_related_objects(
+                [offer], Prefetch('offer_details', queryset=OfferDetail.objects.only('id', 'offer_id'))
+            )
+            return Response(self.get_serializer(offer).data)
+
+        return conditional_response(request, etag, latest(offer.updated_at, profile_updated_at), build_response)
+
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -73,7 +151,38 @@ class SingleOfferView(generics.RetrieveUpdateDestroyAPIView):
         # Use the same serializer for the response to ensure consistency
         return Response(serializer.data)
     
+class OfferDetailListView(MultiGetMixin, generics.ListAPIView):
+    """
+    Multi-get for offer details: ``?ids=1,2,3`` is required and returns the
+    details in that order, e.g. all tiers of a checkout or compare page.
+    """
+    queryset = OfferDetail.objects.all()
+    serializer_class = SingleOfferDetailSerializer
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request, *args, **kwargs):
+        return self.multi_get_response(self.get_queryset())
+
 class SingleOfferDetailView(generics.RetrieveAPIView):
     queryset = OfferDetail.objects.all()
     serializer_class = SingleOfferDetailSerializer
-    permission_classes = [SingleOfferDetailPermission]
\ No newline at end of file
+    permission_classes = [SingleOfferDetailPermission]
+
+    def retrieve(self, request, *args, **kwargs):
+        # Every detail write touches its offer's updated_at. One query loads
+        # the serialized fields and that timestamp for both outcomes.
+        queryset = self.get_queryset().select_related('offer').only(
+            *self.get_serializer_class().Meta.fields, 'offer__updated_at'
+        )
+        detail = get_object_or_404(queryset, pk=self.kwargs['pk'])
+        self.check_object_permissions(request, detail)
+        return conditional_response(
+            request, make_etag(detail.pk, detail.offer.updated_at), detail.offer.updated_at,
+            lambda: Response(self.get_serializer(detail).data)
+        )
+
+class OfferExportView(ExportView):
+    exporter_class = OfferExporter
+
+class OfferDetailExportView(ExportView):
+    exporter_class = OfferDetailExporter
@@ -0,0 +1,113 @@
+"""
+Versioned response cache for GET /api/offers/ and /api/offers/facets/.
+
+Cached pages are keyed on the path, the normalized query parameters and a
+global "offers version". Any write to an Offer or OfferDetail bumps that
+version, which invalidates every cached page at once without having to
+find or delete them; stale entries simply expire.
+
+The version and the pages must live in a cache that every server process
+shares, such as Redis or Memcached. With the local-memory backend each
+process keeps its own version, so a write only invalidates the pages of
+the process that handled it and the others keep serving stale pages
+until they expire. That backend is only fit for development and tests,
+which run in one process. Hit and miss counters are kept in the same
+cache.
+"""
+import hashlib
+import json
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+VERSION_KEY = 'offers:version'
+HITS_KEY = 'offers:list:hits'
+MISSES_KEY = 'offers:list:misses'
+
+
+def get_cache():
+    return caches[getattr(settings, 'OFFERS_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'OFFERS_LIST_CACHE_TIMEOUT', 300)
+
+
+def _increment(key, initial):
+    cache = get_cache()
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Missing key: start it, or increment if another process just did
+        if cache.add(key, initial, timeout=None):
+            return initial
+        return cache.incr(key)
+
+
+def get_offers_version():
+    version = get_cache().get(VERSION_KEY)
+    if version is None:
+        # Seed from the clock so an evicted version never rewinds to a
+        # number that cached pages were already stored under.
+        get_cache().add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = get_cache().get(VERSION_KEY)
+    return version
+
+
+def bump_offers_version():
+    return _increment(VERSION_KEY, time.time_ns())
+
+
+def invalidate_offers():
+    """
+    Invalidate all cached offer responses. The version is bumped right away
+    and again once the surrounding transaction commits, so a page rendered
+    from not yet committed data can never be served afterwards.
+    """
+    bump_offers_version()
+    transaction.on_commit(bump_offers_version)
+
+
+def get_cache_stats():
+    cache = get_cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    return {'hits': hits, 'misses': misses, 'version': cache.get(VERSION_KEY)}
+
+
+def reset_cache_stats():
+    get_cache().delete_many([HITS_KEY, MISSES_KEY])
+
+
+def list_cache_key(request, version):
+    """Build the cache key from the URL and the sorted query parameters."""
+    params = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    )
+    raw = json.dumps([request.build_absolute_uri(request.path), params])
+    return f'offers:list:{version}:{hashlib.sha256(raw.encode("utf-8")).hexdigest()}'
+
+
+def cached_list_response(request, build_response):
+    """
+    Return the cached response for this request, or build, store and
+    return it. Adds an ``X-Cache: HIT``/``MISS`` header.
+    """
+    cache = get_cache()
+    key = list_cache_key(request, get_offers_version())
+
+    data = cache.get(key)
+    if data is not None:
+        _increment(HITS_KEY, 1)
+        return Response(data, headers={'X-Cache': 'HIT'})
+
+    response = build_response()
+    if response.status_code == 200:
+        cache.set(key, response.data, get_timeout())
+    _increment(MISSES_KEY, 1)
+    response['X-Cache'] = 'MISS'
+    return response
@@ -0,0 +1,17 @@
+from core.exports import Exporter
+from .models import Offer, OfferDetail
+
+class OfferExporter(Exporter):
+    name = 'offers'
+    model = Offer
+    fields = [
+        'id', 'user_id', 'title', 'description', 'image', 'image_variants',
+        'min_price', 'min_delivery_time', 'created_at', 'updated_at'
+    ]
+
+class OfferDetailExporter(Exporter):
+    """Details have no timestamp of their own; detail writes touch the offer."""
+    name = 'offer_details'
+    model = OfferDetail
+    fields = ['id', 'offer_id', 'title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+    updated_field = 'offer__updated_at'
@@ -0,0 +1,63 @@
+"""
+Facet counts for the offers filter sidebar.
+
+All three facets come from one grouped query over the filtered offers:
+``GROUP BY min_price, min_delivery_time, offer_types``. The grouping
+columns are exactly those of ``offer_facets_idx``, so SQLite answers it
+from the index in order, without a temporary B-tree, and returns one row
+per distinct combination. The rows are then folded into buckets here.
+"""
+from bisect import bisect_right
+from django.db.models import Count
+from offers_app.models import OFFER_TYPE_FLAGS
+
+# Lower bounds of the price histogram; each bucket runs up to the next bound
+PRICE_BUCKETS = [0, 50, 100, 250, 500, 1000, 2500]
+
+# Delivery time thresholds in days, counted like the max_delivery_time filter
+DELIVERY_TIME_BUCKETS = [1, 3, 7, 14, 30]
+
+
+def count_groups(queryset):
+    """Offer counts per distinct (min_price, min_delivery_time, offer_types)."""
+    return (
+        queryset
+        .order_by()
+        .values_list('min_price', 'min_delivery_time', 'offer_types')
+        .annotate(count=Count('pk'))
+    )
+
+
+def compute_facets(queryset):
+    """Return all facet counts for the offers in ``queryset``."""
+    total = 0
+    price_counts = [0] * len(PRICE_BUCKETS)
+    delivery_counts = [0] * len(DELIVERY_TIME_BUCKETS)
+    type_counts = dict.fromkeys(OFFER_TYPE_FLAGS, 0)
+
+    for min_price, min_delivery_time, offer_types, count in count_groups(queryset):
+        total += count
+        if min_price is not None and min_price >= PRICE_BUCKETS[0]:
+            price_counts[bisect_right(PRICE_BUCKETS, min_price) - 1] += count
+        if min_delivery_time is not None:
+            # Counts are cumulative: an offer is within every larger threshold
+            for index, days in enumerate(DELIVERY_TIME_BUCKETS):
+                if min_delivery_time <= days:
+                    delivery_counts[index] += count
+        for offer_type, flag in OFFER_TYPE_FLAGS.items():
+            if offer_types & flag:
+                type_counts[offer_type] += count
+
+    bounds = zip(PRICE_BUCKETS, PRICE_BUCKETS[1:] + [None])
+    return {
+        'count': total,
+        'price': [
+            {'min': low, 'max': high, 'count': count}
+            for (low, high), count in zip(bounds, price_counts)
+        ],
+        'delivery_time': [
+            {'max_delivery_time': days, 'count': count}
+            for days, count in zip(DELIVERY_TIME_BUCKETS, delivery_counts)
+        ],
+        'offer_type': type_counts,
+    }
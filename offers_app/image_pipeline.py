@@ -0,0 +1,96 @@
+"""
+Schedules the generation of offer image variants off the request path.
+
+Variants are rendered by a shared process pool once the transaction that
+stored the upload has committed. The results are written back to
+``Offer.image_variants`` from the pool's callback thread. Variants of
+images that no offer uses any more are deleted once the replacing or
+deleting transaction has committed.
+"""
+import atexit
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.utils import timezone
+from offers_app.cache import invalidate_offers
+from offers_app.images import DEFAULT_VARIANT_SIZES, delete_variants, render_variants
+from offers_app.models import Offer
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def get_variant_sizes():
+    return getattr(settings, 'OFFER_IMAGE_VARIANT_SIZES', DEFAULT_VARIANT_SIZES)
+
+
+def get_executor():
+    """Return the process pool shared by all requests, starting it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=getattr(settings, 'OFFER_IMAGE_WORKERS', 2))
+        atexit.register(_executor.shutdown)
+    return _executor
+
+
+def render_arguments(image_name):
+    """Positional arguments of ``render_variants`` for a stored image."""
+    return (default_storage.path(image_name), str(settings.MEDIA_ROOT), image_name, get_variant_sizes())
+
+
+def delete_unused_variants(image_name):
+    """Delete the variants of ``image_name`` unless an offer still uses that image."""
+    if not Offer.objects.filter(image=image_name).exists():
+        delete_variants(str(settings.MEDIA_ROOT), image_name)
+
+
+def schedule_variant_cleanup(image_name):
+    """Delete the variants of a replaced or deleted image once the current transaction commits."""
+    transaction.on_commit(lambda: delete_unused_variants(image_name))
+
+
+def store_variants(offer_id, image_name, variants):
+    """
+    Save the rendered variants, unless the offer got a different image or
+    was deleted in the meantime; the rendered files are removed again then.
+    Returns True if the offer was updated.
+    """
+    updated = Offer.objects.filter(pk=offer_id, image=image_name).update(
+        image_variants=variants,
+        updated_at=timezone.now()
+    )
+    if updated:
+        invalidate_offers()
+    else:
+        delete_unused_variants(image_name)
+    return bool(updated)
+
+
+def _store_result(offer_id, image_name, future):
+    try:
+        store_variants(offer_id, image_name, future.result())
+    except Exception:
+        logger.exception("Could not generate image variants for offer %s", offer_id)
+    finally:
+        # Runs in the pool's callback thread, which owns its own connection
+        connections.close_all()
+
+
+def process_offer_image(offer_id, image_name):
+    """Render and store the variants, in the pool or inline if configured."""
+    if getattr(settings, 'OFFER_IMAGE_PROCESS_INLINE', False):
+        store_variants(offer_id, image_name, render_variants(*render_arguments(image_name)))
+        return
+
+    future = get_executor().submit(render_variants, *render_arguments(image_name))
+    future.add_done_callback(lambda future: _store_result(offer_id, image_name, future))
+
+
+def schedule_offer_image(offer):
+    """Process the offer's image once the current transaction commits."""
+    if offer.image:
+        offer_id, image_name = offer.pk, offer.image.name
+        transaction.on_commit(lambda: process_offer_image(offer_id, image_name))
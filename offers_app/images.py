@@ -0,0 +1,78 @@
+"""
+Resized variants of offer images.
+
+Every uploaded image gets a WebP and a JPEG copy per configured size,
+stored next to the originals under ``offers/variants/<stored name>/``.
+The functions in this module only touch the file system, so they can
+run in worker processes that never set up Django.
+"""
+import os
+import posixpath
+import shutil
+from PIL import Image, ImageOps
+
+VARIANT_DIR = 'offers/variants'
+
+# Longest edge in pixels per variant
+DEFAULT_VARIANT_SIZES = {
+    'thumbnail': 160,
+    'small': 480,
+    'medium': 960,
+}
+
+# Variant key -> (Pillow format, file extension)
+VARIANT_FORMATS = {
+    'webp': ('WEBP', 'webp'),
+    'jpeg': ('JPEG', 'jpg'),
+}
+
+VARIANT_QUALITY = 80
+
+
+def variant_dir(image_name):
+    """Return the storage name of the directory holding the variants of ``image_name``."""
+    return posixpath.join(VARIANT_DIR, image_name)
+
+
+def variant_name(image_name, size_name, extension):
+    """
+    Return the storage name of one variant of ``image_name``. Variants live
+    in a directory named after the full stored name, which the storage
+    keeps unique, so images that only share a stem never overwrite each
+    other's variants.
+    """
+    return posixpath.join(variant_dir(image_name), f'{size_name}.{extension}')
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def render_variants(source_path, media_root, image_name, sizes):
+    """
+    Write all variants of the image at ``source_path`` below ``media_root``
+    and return their storage names as ``{size: {format: name}}``.
+    """
+    variants = {}
+    with Image.open(source_path) as original:
+        original = ImageOps.exif_transpose(original)
+        webp_mode = 'RGBA' if _has_alpha(original) else 'RGB'
+
+        for size_name, edge in sizes.items():
+            resized = original.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+
+            for key, (image_format, extension) in VARIANT_FORMATS.items():
+                name = variant_name(image_name, size_name, extension)
+                path = os.path.join(media_root, *name.split('/'))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                mode = webp_mode if image_format == 'WEBP' else 'RGB'
+                resized.convert(mode).save(path, image_format, quality=VARIANT_QUALITY)
+                variants.setdefault(size_name, {})[key] = name
+    return variants
+
+
+def delete_variants(media_root, image_name):
+    """Remove all variants of ``image_name`` below ``media_root``, if there are any."""
+    shutil.rmtree(os.path.join(media_root, *variant_dir(image_name).split('/')), ignore_errors=True)
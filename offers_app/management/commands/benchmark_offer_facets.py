@@ -0,0 +1,114 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from auth_app.models import CustomUser
+from core.benchmarks import isolated_database, measure, summarize
+from offers_app.api.views import OfferFacetsView
+from offers_app.cache import bump_offers_version
+
+# The creator scenario gets the id of a seeded user, see build_scenarios()
+SCENARIOS = {
+    'unfiltered': {},
+    'creator': {'creator_id': None},
+    'min_price': {'min_price': 500},
+    'max_delivery_time': {'max_delivery_time': 7},
+    'search': {'search': 'design'},
+    'combined': {'min_price': 100, 'max_delivery_time': 14, 'search': 'design'},
+}
+
+SEED_OFFERS_SQL = """
+    INSERT INTO offers_app_offer (
+        title, image, description, created_at, updated_at,
+        min_price, min_delivery_time, offer_types, user_id, image_variants
+    )
+    WITH RECURSIVE seq(n) AS (
+        SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s
+    )
+    SELECT
+        CASE n %% 4 WHEN 0 THEN 'Logo design ' ELSE 'Website build ' END || n,
+        '', 'Offer description ' || n, %s, %s,
+        (n * 7919) %% 3000, 1 + (n * 31) %% 30, 7, %s + n %% %s, '{}'
+    FROM seq
+"""
+
+SEED_DETAILS_SQL = """
+    INSERT INTO offers_app_offerdetail (
+        offer_id, title, revisions, delivery_time_in_days, price, features, offer_type
+    )
+    SELECT offer.id, types.name, 1, offer.min_delivery_time, offer.min_price, '[]', types.name
+    FROM offers_app_offer AS offer
+    CROSS JOIN (SELECT 'basic' AS name UNION ALL SELECT 'standard' UNION ALL SELECT 'premium') AS types
+"""
+
+def build_scenarios(creator_id):
+    """Return a copy of SCENARIOS for one run, filtering on ``creator_id``."""
+    scenarios = {name: dict(params) for name, params in SCENARIOS.items()}
+    scenarios['creator']['creator_id'] = creator_id
+    return scenarios
+
+class Command(BaseCommand):
+    """
+    Benchmark GET /api/offers/facets/ on a generated data set in a
+    throwaway database. Fails if the uncached p95 latency of any filter
+    combination exceeds the budget.
+    """
+    help = "Measure the latency of the offer facets endpoint at a large number of offers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=1_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--budget-ms', type=float, default=500,
+                            help="Allowed p95 latency of an uncached request.")
+
+    def handle(self, *args, **options):
+        with isolated_database() as connection:
+            if connection.vendor != 'sqlite':
+                raise CommandError("The data set generator only supports SQLite.")
+            first_user_id = self.seed(connection, options['offers'], options['users'])
+            over_budget = self.run_scenarios(build_scenarios(first_user_id), options['repeat'], options['budget_ms'])
+
+        if over_budget:
+            raise CommandError(f"Over the {options['budget_ms']:.0f} ms budget: {', '.join(over_budget)}")
+        self.stdout.write(self.style.SUCCESS("All scenarios within budget."))
+
+    def seed(self, connection, offer_count, user_count):
+        self.stdout.write(f"Generating {offer_count} offers...")
+        users = CustomUser.objects.bulk_create([
+            CustomUser(username=f"benchmark_{index}", type='business') for index in range(user_count)
+        ])
+        first_user_id = min(user.pk for user in users)
+        now = timezone.now().isoformat()
+        with connection.cursor() as cursor:
+            cursor.execute(SEED_OFFERS_SQL, [offer_count, now, now, first_user_id, user_count])
+            cursor.execute(SEED_DETAILS_SQL)
+            cursor.execute("ANALYZE")
+        return first_user_id
+
+    def run_scenarios(self, scenarios, repeat, budget_ms):
+        factory = APIRequestFactory()
+        view = OfferFacetsView.as_view()
+        over_budget = []
+
+        # Requests are dispatched in-process with APIRequestFactory's host
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            for name, params in scenarios.items():
+                if self.run_scenario(factory, view, name, params, repeat) > budget_ms:
+                    over_budget.append(name)
+        return over_budget
+
+    def run_scenario(self, factory, view, name, params, repeat):
+        """Print the latencies of one filter combination and return the uncached p95."""
+        def cold():
+            # A new offers version makes every request a cache miss
+            bump_offers_version()
+            view(factory.get('/api/offers/facets/', params))
+
+        cold_stats = summarize(measure(cold, repeat))
+        warm_stats = summarize(measure(lambda: view(factory.get('/api/offers/facets/', params)), repeat))
+        self.stdout.write(
+            f"{name:<18} uncached p50 {cold_stats['p50']:8.1f} ms  p95 {cold_stats['p95']:8.1f} ms"
+            f"   cached p50 {warm_stats['p50']:6.2f} ms"
+        )
+        return cold_stats['p95']
@@ -0,0 +1,9 @@
+from core.exports import ExportCommand
+from offers_app.exports import OfferExporter, OfferDetailExporter
+
+class Command(ExportCommand):
+    """
+    Stream offers or offer details as NDJSON or CSV.
+    """
+    help = "Export offers or offer details as NDJSON or CSV."
+    exporters = [OfferExporter, OfferDetailExporter]
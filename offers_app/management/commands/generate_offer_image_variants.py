@@ -0,0 +1,43 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from offers_app.image_pipeline import render_arguments, store_variants
+from offers_app.images import render_variants
+from offers_app.models import Offer
+
+class Command(BaseCommand):
+    """
+    Backfill the resized variants of existing offer images using a pool of
+    worker processes. Offers that already have variants are skipped unless
+    --force is given.
+    """
+    help = "Generate thumbnail and WebP variants for existing offer images."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'OFFER_IMAGE_WORKERS', 2),
+                            help="Number of worker processes.")
+        parser.add_argument('--force', action='store_true',
+                            help="Regenerate variants that already exist.")
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.exclude(image='').exclude(image__isnull=True)
+        if not options['force']:
+            offers = offers.filter(image_variants={})
+        pending = offers.values_list('pk', 'image').order_by('pk')
+
+        done = failed = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            futures = {
+                executor.submit(render_variants, *render_arguments(image_name)): (offer_id, image_name)
+                for offer_id, image_name in pending.iterator()
+            }
+            for future in as_completed(futures):
+                offer_id, image_name = futures[future]
+                try:
+                    store_variants(offer_id, image_name, future.result())
+                    done += 1
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f"Offer {offer_id}: {error}")
+
+        self.stdout.write(self.style.SUCCESS(f"Generated variants for {done} offers, {failed} failed."))
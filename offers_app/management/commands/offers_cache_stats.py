@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from offers_app.cache import get_cache_stats, reset_cache_stats
+
+class Command(BaseCommand):
+    """
+    Report hit and miss counters of the offers list response cache.
+    """
+    help = "Show hit and miss counters of the offers list cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Reset the counters afterwards.")
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        lookups = stats['hits'] + stats['misses']
+        ratio = stats['hits'] / lookups if lookups else 0
+
+        self.stdout.write(f"hits: {stats['hits']}")
+        self.stdout.write(f"misses: {stats['misses']}")
+        self.stdout.write(f"hit ratio: {ratio:.1%}")
+        self.stdout.write(f"version: {stats['version']}")
+
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from offers_app.cache import invalidate_offers
+from offers_app.models import Offer
+from offers_app.search import rebuild_search_index, supports_full_text_search
+
+class Command(BaseCommand):
+    """
+    Rebuild the full-text search index for offers from scratch.
+    Also restores the sync triggers should they have been dropped.
+    """
+    help = "Rebuild the FTS5 search index over offer titles and descriptions."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if not supports_full_text_search(connection):
+            raise CommandError("Full-text search is only available on SQLite.")
+
+        with transaction.atomic(using=connection.alias):
+            rebuild_search_index(connection)
+            invalidate_offers()
+
+        offer_count = Offer.objects.using(connection.alias).count()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {offer_count} offers."))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+from offers_app.cache import invalidate_offers
+from offers_app.models import Offer
+
+class Command(BaseCommand):
+    """
+    Recompute Offer.min_price, Offer.min_delivery_time and Offer.offer_types
+    for the whole table.
+    Works through primary key ranges, one set-based UPDATE and transaction
+    per chunk, so it can run against a live database and be restarted.
+    Only drifted offers are written and get a new updated_at, so the ETags
+    of all other offers stay valid.
+    """
+    help = "Repair drifted offer minimums with chunked, set-based UPDATEs."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=10000)
+        parser.add_argument('--start-id', type=int, default=None,
+                            help="Resume from this offer id.")
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        bounds = Offer.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        if bounds['low'] is None:
+            self.stdout.write("No offers to recompute.")
+            return
+
+        start = max(bounds['low'], options['start_id'] or bounds['low'])
+        updated = 0
+        while start <= bounds['high']:
+            end = start + chunk_size
+            with transaction.atomic():
+                chunk = Offer.objects.filter(pk__gte=start, pk__lt=end).select_for_update()
+                drifted = chunk.drifted_detail_aggregates()
+                if drifted:
+                    updated += Offer.objects.filter(pk__in=drifted).refresh_detail_aggregates(
+                        updated_at=timezone.now()
+                    )
+            self.stdout.write(f"Recomputed offers {start} to {end - 1}")
+            start = end
+
+        if updated:
+            invalidate_offers()
+        self.stdout.write(self.style.SUCCESS(f"Repaired minimums of {updated} drifted offers."))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:55
+
+import django.db.models.deletion
+import offers_app.search
+from django.db import migrations, models
+
+
+def create_search_index(apps, schema_editor):
+    offers_app.search.install_search_index(schema_editor.connection)
+    if offers_app.search.supports_full_text_search(schema_editor.connection):
+        schema_editor.execute(offers_app.search.REBUILD_SEARCH_INDEX_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    offers_app.search.uninstall_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0004_remove_offerdetail_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferSearchIndex',
+            fields=[
+                ('offer', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='offers_app.offer')),
+                ('title', models.TextField(null=True)),
+                ('description', models.TextField(null=True)),
+                ('document', offers_app.search.SearchDocumentField(db_column='offers_app_offer_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'offers_app_offer_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:18
+
+import offers_app.search
+from django.db import migrations, models
+
+
+def reinstall_search_index(apps, schema_editor):
+    # SQLite adds the column by rebuilding offers_app_offer, which drops the
+    # full-text index triggers along with the old table.
+    offers_app.search.install_search_index(schema_editor.connection)
+    if offers_app.search.supports_full_text_search(schema_editor.connection):
+        schema_editor.execute(offers_app.search.REBUILD_SEARCH_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0006_offer_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search_index),
+        migrations.AddField(
+            model_name='offer',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:37
+
+import offers_app.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+def reinstall_search_index(apps, schema_editor):
+    # SQLite adds the column by rebuilding offers_app_offer, which drops the
+    # full-text index triggers along with the old table.
+    offers_app.search.install_search_index(schema_editor.connection)
+    if offers_app.search.supports_full_text_search(schema_editor.connection):
+        schema_editor.execute(offers_app.search.REBUILD_SEARCH_INDEX_SQL)
+
+
+BACKFILL_OFFER_TYPES_SQL = """
+    UPDATE offers_app_offer SET offer_types = COALESCE((
+        SELECT SUM(DISTINCT CASE offer_type
+            WHEN 'basic' THEN 1 WHEN 'standard' THEN 2 WHEN 'premium' THEN 4 ELSE 0 END)
+        FROM offers_app_offerdetail
+        WHERE offers_app_offerdetail.offer_id = offers_app_offer.id
+    ), 0)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0007_offer_image_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search_index),
+        migrations.AddField(
+            model_name='offer',
+            name='offer_types',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+        migrations.RunSQL(BACKFILL_OFFER_TYPES_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_price', 'min_delivery_time', 'offer_types'], name='offer_facets_idx'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.db import models
+from django.db.models import Case, IntegerField, Min, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
 from auth_app.models import CustomUser
+from offers_app.search import SEARCH_TABLE, SearchDocumentField
 
 class UserDetails(models.Model):
     user = models.OneToOneField(
@@ -16,6 +19,67 @@ class UserDetails(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
     
+# Bit per OfferDetail.offer_type in Offer.offer_types
+OFFER_TYPE_FLAGS = {
+    'basic': 1,
+    'standard': 2,
+    'premium': 4,
+}
+
+def get_offer_type_flags(offer_types):
+    """Combine the flags of the given offer types into one bitmask."""
+    flags = 0
+    for offer_type in offer_types:
+        flags |= OFFER_TYPE_FLAGS.get(offer_type, 0)
+    return flags
+
+class OfferQuerySet(models.QuerySet):
+    def refresh_detail_aggregates(self, **extra_fields):
+        """
+        Recompute min_price, min_delivery_time and offer_types of the
+        selected offers from their details with a single set-based UPDATE.
+        Empty and zero values are ignored for the minimums, as they always
+        have been.
+        """
+        return self.update(
+            min_price=self._detail_minimum('price'),
+            min_delivery_time=self._detail_minimum('delivery_time_in_days'),
+            offer_types=self._detail_offer_types(),
+            **extra_fields
+        )
+
+    def drifted_detail_aggregates(self):
+        """
+        Return the pks of the selected offers whose stored min_price,
+        min_delivery_time or offer_types differ from their details.
+        """
+        rows = self.annotate(
+            expected_min_price=self._detail_minimum('price'),
+            expected_min_delivery_time=self._detail_minimum('delivery_time_in_days'),
+            expected_offer_types=self._detail_offer_types(),
+        ).values_list(
+            'pk', 'min_price', 'min_delivery_time', 'offer_types',
+            'expected_min_price', 'expected_min_delivery_time', 'expected_offer_types'
+        )
+        return [pk for pk, *values in rows if values[:3] != values[3:]]
+
+    @staticmethod
+    def _detail_minimum(field):
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).exclude(**{field: 0})
+        return Subquery(details.values('offer').annotate(minimum=Min(field)).values('minimum'))
+
+    @staticmethod
+    def _detail_offer_types():
+        # The flags are distinct powers of two, so their distinct sum is their bitwise OR
+        flag = Case(
+            *[When(offer_type=offer_type, then=Value(bit)) for offer_type, bit in OFFER_TYPE_FLAGS.items()],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+        details = OfferDetail.objects.filter(offer=OuterRef('pk'))
+        types = details.values('offer').annotate(flags=Sum(flag, distinct=True)).values('flags')
+        return Coalesce(Subquery(types), Value(0))
+
 class Offer(models.Model):
     user = models.ForeignKey(
         CustomUser, 
@@ -26,14 +90,66 @@ class Offer(models.Model):
     )
     title = models.CharField(max_length=255, null=True, blank=True)
     image = models.ImageField(upload_to='offers/', null=True, blank=True)
+    # Resized copies of the image as {size: {format: storage name}}, filled
+    # in the background, see offers_app/image_pipeline.py
+    image_variants = models.JSONField(default=dict, blank=True)
     description = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
     min_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     min_delivery_time = models.IntegerField(null=True, blank=True)
+    # OFFER_TYPE_FLAGS of all detail offer types, for the facet counts
+    offer_types = models.PositiveSmallIntegerField(default=0)
+
+    objects = OfferQuerySet.as_manager()
+
+    class Meta:
+        # Every ordering accepted by the offers list, alone and behind the
+        # creator filter. The primary key is implicitly part of each index,
+        # which covers the id tie-breaker of keyset pagination.
+        indexes = [
+            models.Index(fields=['min_price'], name='offer_min_price_idx'),
+            models.Index(fields=['min_delivery_time'], name='offer_min_delivery_idx'),
+            models.Index(fields=['updated_at'], name='offer_updated_at_idx'),
+            models.Index(fields=['user', 'min_price'], name='offer_user_min_price_idx'),
+            models.Index(fields=['user', 'min_delivery_time'], name='offer_user_delivery_idx'),
+            models.Index(fields=['user', 'updated_at'], name='offer_user_updated_at_idx'),
+            # Covers the grouped facet count, see offers_app/facets.py
+            models.Index(fields=['min_price', 'min_delivery_time', 'offer_types'], name='offer_facets_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored image, so replacing it can clean up its
+        # variants without an extra query (see offers_app/signals.py)
+        if 'image' not in instance.get_deferred_fields():
+            instance._stored_image = instance.image.name
+        return instance
 
     def __str__(self):
         return self.title
+
+class OfferSearchIndex(models.Model):
+    """
+    Read-only mapping of the FTS5 index over Offer.title and Offer.description.
+    The table and its sync triggers are created in offers_app.search.
+    """
+    offer = models.OneToOneField(
+        Offer,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        related_name='search_index'
+    )
+    title = models.TextField(null=True)
+    description = models.TextField(null=True)
+    document = SearchDocumentField(db_column=SEARCH_TABLE)
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = SEARCH_TABLE
     
 class OfferDetail(models.Model):
     offer = models.ForeignKey(
@@ -0,0 +1,125 @@
+"""
+Full-text search over ``Offer.title`` and ``Offer.description``.
+
+On SQLite the offers table is mirrored into an FTS5 virtual table that is
+kept in sync by triggers, so inserts, updates and deletes (including bulk
+operations that bypass model signals) always reach the index.
+"""
+import re
+from django.db import connections, models
+from django.db.models import Q
+
+SEARCH_TABLE = 'offers_app_offer_fts'
+
+CREATE_SEARCH_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        title,
+        description,
+        content='offers_app_offer',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF title, description ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+DROP_SEARCH_INDEX_SQL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+REBUILD_SEARCH_INDEX_SQL = f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+
+
+class SearchDocumentField(models.TextField):
+    """
+    Maps the hidden FTS5 column that carries the table's name, which is the
+    column a ``MATCH`` has to run against to search all indexed columns.
+    """
+
+
+@SearchDocumentField.register_lookup
+class FullTextMatch(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", [*lhs_params, *rhs_params]
+
+
+def supports_full_text_search(connection) -> bool:
+    """Return True if the FTS5 index can be used on this connection."""
+    return connection.vendor == 'sqlite'
+
+
+def install_search_index(connection):
+    """Create the FTS5 table and its sync triggers if they are missing."""
+    if not supports_full_text_search(connection):
+        return
+    with connection.cursor() as cursor:
+        for statement in CREATE_SEARCH_INDEX_SQL:
+            cursor.execute(statement)
+
+
+def uninstall_search_index(connection):
+    if not supports_full_text_search(connection):
+        return
+    with connection.cursor() as cursor:
+        for statement in DROP_SEARCH_INDEX_SQL:
+            cursor.execute(statement)
+
+
+def rebuild_search_index(connection):
+    """Re-read every offer into the index in a single bulk statement."""
+    install_search_index(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(REBUILD_SEARCH_INDEX_SQL)
+
+
+def build_match_query(text):
+    """
+    Turn free user input into a safe FTS5 query.
+
+    Every word becomes a quoted prefix term, so FTS5 operators and stray
+    quotes in the input can never produce a syntax error. Terms are ANDed.
+    """
+    terms = re.findall(r'\w+', text or '')
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search_offers(queryset, text):
+    """
+    Restrict ``queryset`` to offers matching ``text``, best matches first.
+
+    Falls back to a case-insensitive ``LIKE`` on databases without FTS5.
+    """
+    if not supports_full_text_search(connections[queryset.db]):
+        return queryset.filter(Q(title__icontains=text) | Q(description__icontains=text))
+
+    match_query = build_match_query(text)
+    if not match_query:
+        return queryset.none()
+    return queryset.filter(search_index__document__match=match_query).order_by('search_index__rank')
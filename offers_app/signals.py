@@ -0,0 +1,70 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from auth_app.models import CustomUser
+from offers_app.cache import invalidate_offers
+from offers_app.image_pipeline import schedule_offer_image, schedule_variant_cleanup
+from offers_app.models import Offer, OfferDetail
+
+def _is_deleting_offer(origin) -> bool:
+    """Return True if the deletion was started by deleting the offer itself."""
+    return isinstance(origin, Offer) or getattr(origin, 'model', None) is Offer
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_minimums(sender, instance, origin=None, **kwargs):
+    """
+    Keep the denormalized minimums and offer types of the parent offer in
+    sync whenever one of its details is written. Only the details of that
+    one offer are aggregated, inside the database.
+    """
+    if _is_deleting_offer(origin):
+        return
+    Offer.objects.filter(pk=instance.offer_id).refresh_detail_aggregates(updated_at=timezone.now())
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_cached_offers(sender, **kwargs):
+    invalidate_offers()
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_cached_offers_on_user_change(sender, update_fields=None, **kwargs):
+    """The offers list embeds the creator's name, so user edits invalidate it too."""
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_offers()
+
+@receiver(pre_save, sender=Offer)
+def detect_new_offer_image(sender, instance, **kwargs):
+    """
+    A freshly uploaded file is not committed to storage until the field's
+    own pre_save, so it can still be told apart from the stored image here.
+    """
+    instance._image_uploaded = bool(instance.image) and not instance.image._committed
+    instance._replaced_image = None
+    if instance._image_uploaded or not instance.image:
+        instance.image_variants = {}
+        if not instance._state.adding:
+            if hasattr(instance, '_stored_image'):
+                stored = instance._stored_image
+            else:
+                stored = Offer.objects.filter(pk=instance.pk).values_list('image', flat=True).first()
+            # Its variants are deleted once the new image is saved
+            if stored and stored != instance.image.name:
+                instance._replaced_image = stored
+
+@receiver(post_save, sender=Offer)
+def process_new_offer_image(sender, instance, update_fields=None, **kwargs):
+    if getattr(instance, '_image_uploaded', False):
+        schedule_offer_image(instance)
+    if update_fields is None or 'image' in update_fields:
+        if getattr(instance, '_replaced_image', None):
+            schedule_variant_cleanup(instance._replaced_image)
+        instance._stored_image = instance.image.name
+
+@receiver(post_delete, sender=Offer)
+def delete_offer_image_variants(sender, instance, **kwargs):
+    if instance.image:
+        schedule_variant_cleanup(instance.image.name)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+from profile_app.models import BusinessProfile
+
+class OfferConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.profile = BusinessProfile.objects.create(user=self.business_user, first_name="Jane")
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title="Basic", price=100, delivery_time_in_days=7, offer_type="basic"
+        )
+        self.client.force_authenticate(user=self.business_user)
+        self.offer_url = reverse('single-offer', kwargs={'pk': self.offer.pk})
+        self.detail_url = reverse('single-offer-detail', kwargs={'pk': self.detail.pk})
+
+    def test_detail_sends_validators(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', response)
+
+    def test_matching_etag_returns_304_with_one_query(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(response.content)
+
+    def test_full_detail_response_takes_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], "Basic")
+        self.assertEqual(response.data['price'], '100.00')
+
+    def test_detail_write_changes_the_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.detail.price = 80
+        self.detail.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['price'], '80.00')
+
+    def test_if_modified_since(self):
+        future = http_date((timezone.now() + timedelta(minutes=5)).timestamp())
+        past = http_date((timezone.now() - timedelta(days=1)).timestamp())
+
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=future).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=past).status_code, status.HTTP_200_OK)
+
+    def test_offer_answers_304_without_serializing(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn('ETag', response)
+
+    def test_offer_etag_follows_detail_and_profile_writes(self):
+        etag = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH='*')['ETag']
+
+        self.detail.title = "Basic Plus"
+        self.detail.save()
+        detail_etag = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH='*')['ETag']
+        self.assertNotEqual(detail_etag, etag)
+
+        self.profile.first_name = "Janet"
+        self.profile.save()
+        self.assertNotEqual(self.client.get(self.offer_url, HTTP_IF_NONE_MATCH='*')['ETag'], detail_etag)
+
+    def test_minimum_repair_changes_the_etag(self):
+        etag = self.client.get(self.offer_url)['ETag']
+        # Drift introduced by a write that bypasses the signals
+        Offer.objects.filter(pk=self.offer.pk).update(min_price=999)
+
+        call_command('recompute_offer_minimums', stdout=StringIO())
+
+        response = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], '100.00')
+
+    def test_minimum_repair_keeps_the_etag_of_unchanged_offers(self):
+        etag = self.client.get(self.offer_url)['ETag']
+
+        call_command('recompute_offer_minimums', stdout=StringIO())
+
+        response = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_permissions_are_checked_before_304(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH='*')
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_missing_offer_is_404(self):
+        response = self.client.get(reverse('single-offer', kwargs={'pk': 999}), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.api.views import OfferBatchCreateView
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+from core.testing import statements
+
+def offer_payload(title, prices=(150, 100, 300), delivery_times=(7, 5, 10)):
+    return {
+        "title": title,
+        "description": f"{title} description",
+        "details": [
+            {
+                "title": f"{offer_type.title()} Design",
+                "revisions": 2,
+                "delivery_time_in_days": delivery_time,
+                "price": price,
+                "features": ["Logo Design", "Visitenkarte"],
+                "offer_type": offer_type
+            }
+            for offer_type, price, delivery_time in zip(("basic", "standard", "premium"), prices, delivery_times)
+        ]
+    }
+
+class OfferCreateTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.customer_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="customer"
+        )
+        self.client.force_authenticate(user=self.business_user)
+
+    def test_create_inserts_offer_and_details_in_bulk(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('offers-list'), offer_payload("Grafikdesign"), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(statements(context.captured_queries, 'INSERT', 'offers_app_offer')), 1)
+        self.assertEqual(len(statements(context.captured_queries, 'INSERT', 'offers_app_offerdetail')), 1)
+        self.assertEqual(statements(context.captured_queries, 'UPDATE', 'offers_app_offer'), [])
+        self.assertEqual(statements(context.captured_queries, 'UPDATE', 'offers_app_offerdetail'), [])
+
+        offer = Offer.objects.get(pk=response.data['id'])
+        self.assertEqual(offer.user, self.business_user)
+        self.assertEqual(offer.min_price, Decimal('100.00'))
+        self.assertEqual(offer.min_delivery_time, 5)
+        self.assertEqual(len(response.data['details']), 3)
+        self.assertEqual(offer.offer_details.get(offer_type='basic').features, ["Logo Design", "Visitenkarte"])
+
+    def test_batch_creates_all_offers_with_two_inserts(self):
+        payload = [offer_payload(f"Offer {index}", prices=(index + 10, index + 20, index + 30)) for index in range(40)]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('offers-batch'), payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 40)
+        self.assertEqual(len(statements(context.captured_queries, 'INSERT', 'offers_app_offer')), 1)
+        self.assertEqual(len(statements(context.captured_queries, 'INSERT', 'offers_app_offerdetail')), 1)
+
+        self.assertEqual(Offer.objects.filter(user=self.business_user).count(), 40)
+        self.assertEqual(OfferDetail.objects.count(), 120)
+        first = Offer.objects.get(title="Offer 0")
+        self.assertEqual(first.min_price, Decimal('10.00'))
+        self.assertEqual(first.min_delivery_time, 5)
+        self.assertEqual([offer['title'] for offer in response.data[:2]], ["Offer 0", "Offer 1"])
+        self.assertEqual(len(response.data[0]['details']), 3)
+
+    def test_batch_is_all_or_nothing(self):
+        payload = [offer_payload("Valid"), {**offer_payload("Invalid"), "details": []}]
+        response = self.client.post(reverse('offers-batch'), payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Offer.objects.exists())
+
+    def test_batch_size_is_capped(self):
+        payload = [offer_payload("Offer")] * (OfferBatchCreateView.max_batch_size + 1)
+        response = self.client.post(reverse('offers-batch'), payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Offer.objects.exists())
+
+    def test_batch_requires_a_list(self):
+        response = self.client.post(reverse('offers-batch'), offer_payload("Offer"), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_as_customer_forbidden(self):
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.post(reverse('offers-batch'), [offer_payload("Offer")], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+
+def read_stream(response):
+    return b''.join(response.streaming_content).decode('utf-8')
+
+class OfferExportTestCase(APITestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            username="admin",
+            password="password24!",
+            type="business",
+            is_staff=True
+        )
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.offers = [
+            Offer.objects.create(title=f"Offer {index}", description="Design", user=self.business_user)
+            for index in range(5)
+        ]
+        for offer in self.offers:
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", price=100, delivery_time_in_days=3,
+                features=["Logo Design"], offer_type="basic"
+            )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_ndjson_export_streams_one_object_per_offer(self):
+        response = self.client.get(reverse('offers-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [offer.pk for offer in self.offers])
+        self.assertEqual(rows[0]['title'], "Offer 0")
+        self.assertEqual(rows[0]['user_id'], self.business_user.pk)
+        self.assertEqual(rows[0]['min_price'], "100.00")
+
+    def test_csv_export_has_a_header_and_json_encoded_lists(self):
+        response = self.client.get(reverse('offer-details-export'), {'output': 'csv'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('offer_details.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['offer_id'], str(self.offers[0].pk))
+        self.assertEqual(json.loads(rows[0]['features']), ["Logo Design"])
+
+    def test_updated_since_limits_the_rows(self):
+        cutoff = timezone.now() + timedelta(minutes=1)
+        Offer.objects.filter(pk=self.offers[2].pk).update(updated_at=cutoff + timedelta(minutes=1))
+
+        response = self.client.get(reverse('offers-export'), {'updated_since': cutoff.isoformat()})
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.offers[2].pk])
+
+        response = self.client.get(reverse('offer-details-export'), {'updated_since': cutoff.isoformat()})
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['offer_id'] for row in rows], [self.offers[2].pk])
+
+    def test_invalid_parameters_are_rejected(self):
+        for params in ({'output': 'xml'}, {'updated_since': 'yesterday'}):
+            with self.subTest(**params):
+                response = self.client.get(reverse('offers-export'), params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_is_staff_only(self):
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.get(reverse('offers-export'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_command(self):
+        stdout = io.StringIO()
+        call_command('export_offers', dataset='offer_details', stdout=stdout)
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['offer_type'], "basic")
+
+        stdout = io.StringIO()
+        call_command('export_offers', benchmark=True, stdout=stdout)
+        self.assertIn("offers: 5 rows", stdout.getvalue())
@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.facets import count_groups
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.offer_query_plan_test import explain
+from auth_app.models import CustomUser
+
+class OfferFacetsTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.other_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="business"
+        )
+        self.create_offer(self.business_user, "Logo Design", [("basic", 40, 2), ("premium", 400, 1)])
+        self.create_offer(self.business_user, "Webseite", [("basic", 120, 10), ("standard", 300, 5)])
+        self.create_offer(self.other_user, "Flyer", [("standard", 3000, 40)])
+        self.create_offer(self.other_user, "Leer", [])
+
+    def create_offer(self, user, title, details):
+        offer = Offer.objects.create(title=title, user=user)
+        for offer_type, price, days in details:
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type, price=price, delivery_time_in_days=days, offer_type=offer_type
+            )
+        return offer
+
+    def get_facets(self, params=None):
+        response = self.client.get(reverse('offers-facets'), params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_unfiltered_counts(self):
+        facets = self.get_facets().data
+
+        self.assertEqual(facets['count'], 4)
+        self.assertEqual(
+            {(bucket['min'], bucket['max']): bucket['count'] for bucket in facets['price'] if bucket['count']},
+            {(0, 50): 1, (100, 250): 1, (2500, None): 1}
+        )
+        self.assertEqual(
+            [bucket['count'] for bucket in facets['delivery_time']],
+            [1, 1, 2, 2, 2]
+        )
+        self.assertEqual(facets['offer_type'], {'basic': 2, 'standard': 2, 'premium': 1})
+
+    def test_counts_follow_the_list_filters(self):
+        facets = self.get_facets({'creator_id': self.other_user.pk}).data
+        self.assertEqual(facets['count'], 2)
+        self.assertEqual(facets['offer_type'], {'basic': 0, 'standard': 1, 'premium': 0})
+
+        facets = self.get_facets({'min_price': 100, 'max_delivery_time': 7}).data
+        self.assertEqual(facets['count'], 1)
+        self.assertEqual(facets['offer_type'], {'basic': 1, 'standard': 1, 'premium': 0})
+
+        self.assertEqual(self.get_facets({'search': 'logo'}).data['count'], 1)
+
+    def test_facets_are_cached_and_invalidated(self):
+        self.assertEqual(self.get_facets()['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_facets()['X-Cache'], 'HIT')
+
+        self.create_offer(self.other_user, "Banner", [("premium", 80, 3)])
+        facets = self.get_facets()
+        self.assertEqual(facets['X-Cache'], 'MISS')
+        self.assertEqual(facets.data['offer_type']['premium'], 2)
+
+    def test_offer_types_follow_detail_writes(self):
+        offer = Offer.objects.get(title="Logo Design")
+        self.assertEqual(offer.offer_types, 1 | 4)
+
+        offer.offer_details.get(offer_type="premium").delete()
+        offer.refresh_from_db()
+        self.assertEqual(offer.offer_types, 1)
+
+    def test_grouped_query_reads_the_covering_index(self):
+        plan = explain(count_groups(Offer.objects.all()))
+        self.assertTrue(any('COVERING INDEX offer_facets_idx' in step for step in plan), plan)
+        self.assertNotIn('USE TEMP B-TREE FOR GROUP BY', plan)
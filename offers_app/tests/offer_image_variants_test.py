@@ -0,0 +1,145 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from offers_app.images import render_variants
+from offers_app.models import Offer
+from auth_app.models import CustomUser
+
+SIZES = {'thumbnail': 40, 'small': 80}
+
+def image_upload(name="offer.png", size=(200, 100), mode='RGBA'):
+    buffer = BytesIO()
+    Image.new(mode, size, (255, 0, 0, 128) if mode == 'RGBA' else (255, 0, 0)).save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+class MediaRootMixin:
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(
+            MEDIA_ROOT=self.media_root,
+            OFFER_IMAGE_VARIANT_SIZES=SIZES,
+            OFFER_IMAGE_PROCESS_INLINE=True
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+
+    def create_offer(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Offer.objects.create(title="Webseite Design", user=self.business_user, **kwargs)
+
+    def media_path(self, name):
+        return os.path.join(self.media_root, *name.split('/'))
+
+class RenderVariantsTestCase(MediaRootMixin, TestCase):
+    def test_renders_every_size_and_format(self):
+        source = os.path.join(self.media_root, 'source.png')
+        with open(source, 'wb') as file:
+            file.write(image_upload().read())
+
+        variants = render_variants(source, self.media_root, 'offers/source.png', SIZES)
+
+        self.assertEqual(set(variants), {'thumbnail', 'small'})
+        with Image.open(self.media_path(variants['thumbnail']['webp'])) as image:
+            self.assertEqual((image.format, image.size, image.mode), ('WEBP', (40, 20), 'RGBA'))
+        with Image.open(self.media_path(variants['small']['jpeg'])) as image:
+            self.assertEqual((image.format, image.size, image.mode), ('JPEG', (80, 40), 'RGB'))
+
+class OfferImageVariantsTestCase(MediaRootMixin, APITestCase):
+    def test_upload_generates_variants_after_commit(self):
+        offer = self.create_offer(image=image_upload())
+        offer.refresh_from_db()
+
+        self.assertEqual(set(offer.image_variants), {'thumbnail', 'small'})
+        for formats in offer.image_variants.values():
+            self.assertEqual(set(formats), {'webp', 'jpeg'})
+            for name in formats.values():
+                self.assertTrue(os.path.exists(self.media_path(name)))
+
+    def test_offer_without_image_has_no_variants(self):
+        offer = self.create_offer()
+        offer.refresh_from_db()
+        self.assertEqual(offer.image_variants, {})
+
+    def test_replacing_the_image_replaces_the_variants(self):
+        offer = self.create_offer(image=image_upload("first.png"))
+        offer.refresh_from_db()
+        offer.image = image_upload("second.png")
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.save()
+
+        offer.refresh_from_db()
+        self.assertIn('second', offer.image_variants['thumbnail']['webp'])
+
+    def test_replacing_the_image_deletes_the_old_variants(self):
+        offer = self.create_offer(image=image_upload("first.png"))
+        offer.refresh_from_db()
+        old_dir = os.path.dirname(self.media_path(offer.image_variants['thumbnail']['webp']))
+
+        offer.image = image_upload("second.png")
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.save()
+        self.assertFalse(os.path.exists(old_dir))
+
+        offer.refresh_from_db()
+        self.assertTrue(os.path.exists(self.media_path(offer.image_variants['thumbnail']['webp'])))
+
+    def test_deleting_the_offer_deletes_the_variants(self):
+        offer = self.create_offer(image=image_upload())
+        offer = Offer.objects.get(pk=offer.pk)
+        variant_dir = os.path.dirname(self.media_path(offer.image_variants['small']['jpeg']))
+        self.assertTrue(os.path.exists(variant_dir))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.delete()
+        self.assertFalse(os.path.exists(variant_dir))
+
+    def test_list_exposes_variant_urls(self):
+        offer = self.create_offer(image=image_upload())
+        offer.refresh_from_db()
+
+        listed = self.client.get(reverse('offers-list')).data['results'][0]
+        url = listed['image_variants']['thumbnail']['webp']
+        self.assertTrue(url.startswith(f'http://testserver/media/offers/variants/{offer.image.name}/'))
+        self.assertTrue(url.endswith('/thumbnail.webp'))
+
+    def test_images_sharing_a_stem_get_their_own_variants(self):
+        first = self.create_offer(image=image_upload("logo.png", size=(200, 100)))
+        second = self.create_offer(image=image_upload("logo.jpg", size=(100, 200)))
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        first_name = first.image_variants['thumbnail']['webp']
+        second_name = second.image_variants['thumbnail']['webp']
+        self.assertNotEqual(first_name, second_name)
+        with Image.open(self.media_path(first_name)) as image:
+            self.assertEqual(image.size, (40, 20))
+        with Image.open(self.media_path(second_name)) as image:
+            self.assertEqual(image.size, (20, 40))
+
+    def test_backfill_command(self):
+        offer = self.create_offer(image=image_upload())
+        Offer.objects.filter(pk=offer.pk).update(image_variants={})
+        shutil.rmtree(os.path.join(self.media_root, 'offers', 'variants'))
+
+        out = StringIO()
+        call_command('generate_offer_image_variants', workers=1, stdout=out)
+
+        offer.refresh_from_db()
+        self.assertIn("Generated variants for 1 offers, 0 failed.", out.getvalue())
+        self.assertTrue(os.path.exists(self.media_path(offer.image_variants['small']['jpeg'])))
+
+        call_command('generate_offer_image_variants', workers=1, stdout=out)
+        self.assertIn("Generated variants for 0 offers", out.getvalue())
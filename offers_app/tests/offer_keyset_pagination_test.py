@@ -0,0 +1,108 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer
+from auth_app.models import CustomUser
+
+class OfferKeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.other_business_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="business"
+        )
+
+        # Repeated prices and missing prices exercise the id tie-breaker
+        # and the NULL handling of the seek condition.
+        prices = [300, 100, None, 200, 100, 300, None, 100, 250, 200, 150, 100, None]
+        Offer.objects.bulk_create([
+            Offer(
+                title=f"Offer {index}",
+                min_price=price,
+                min_delivery_time=index % 4 + 1,
+                user=self.business_user if index % 3 else self.other_business_user
+            )
+            for index, price in enumerate(prices)
+        ])
+
+    def walk(self, params, page_size=4):
+        """Follow all next links and return the visited ids page by page."""
+        url = reverse('offers-list')
+        response = self.client.get(url, {**params, 'pagination': 'cursor', 'page_size': page_size})
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            pages.append([offer['id'] for offer in response.data['results']])
+            if not response.data['next']:
+                return pages, response
+            response = self.client.get(response.data['next'])
+
+    def expected_ids(self, queryset, *ordering):
+        return list(queryset.order_by(*ordering).values_list('id', flat=True))
+
+    def test_walk_without_ordering_uses_id(self):
+        pages, _ = self.walk({})
+        self.assertEqual(sum(pages, []), self.expected_ids(Offer.objects.all(), 'id'))
+        self.assertEqual([len(page) for page in pages], [4, 4, 4, 1])
+
+    def test_walk_ascending_with_ties_and_nulls(self):
+        pages, _ = self.walk({'ordering': 'min_price'})
+        expected = self.expected_ids(
+            Offer.objects.all(), 'min_price', 'id'
+        )
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_walk_descending_with_ties_and_nulls(self):
+        pages, _ = self.walk({'ordering': '-min_price'}, page_size=3)
+        ids = sum(pages, [])
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(ids, self.expected_ids(Offer.objects.all(), '-min_price', '-id'))
+
+    def test_walk_keeps_filters(self):
+        params = {'creator_id': self.business_user.id, 'max_delivery_time': 3, 'ordering': 'min_price'}
+        pages, _ = self.walk(params, page_size=2)
+        expected = self.expected_ids(
+            Offer.objects.filter(user=self.business_user, min_delivery_time__lte=3), 'min_price', 'id'
+        )
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_previous_links_walk_back(self):
+        pages, response = self.walk({'ordering': 'min_price'})
+        visited = [pages[-1]]
+        while response.data['previous']:
+            response = self.client.get(response.data['previous'])
+            visited.insert(0, [offer['id'] for offer in response.data['results']])
+        self.assertEqual(visited, pages)
+
+    def test_every_page_runs_a_single_query(self):
+        url = reverse('offers-list')
+        first = self.client.get(url, {'pagination': 'cursor', 'page_size': 2, 'ordering': 'min_price'})
+        second = self.client.get(first.data['next'])
+
+        # One query for the offers plus one batched query for their details,
+        # and no COUNT(*) however deep the page is.
+        with self.assertNumQueries(2):
+            self.client.get(second.data['next'])
+
+    def test_cursor_from_a_different_ordering_is_rejected(self):
+        url = reverse('offers-list')
+        first = self.client.get(url, {'pagination': 'cursor', 'ordering': 'min_price', 'page_size': 2})
+        cursor = first.data['next'].split('cursor=')[1]
+
+        response = self.client.get(url, {'ordering': '-min_price', 'cursor': cursor})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_malformed_cursor_is_rejected(self):
+        url = reverse('offers-list')
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_stays_the_default(self):
+        response = self.client.get(reverse('offers-list'))
+        self.assertEqual(response.data['count'], 13)
@@ -0,0 +1,111 @@
+import tempfile
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.cache import get_cache_stats
+from offers_app.models import Offer, OfferDetail
+from offers_app.tests.offer_create_test import offer_payload
+from auth_app.models import CustomUser
+
+class OfferListCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title="Basic", price=100, delivery_time_in_days=7, offer_type="basic"
+        )
+
+    def get_list(self, params=None):
+        return self.client.get(reverse('offers-list'), params or {})
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.get_list()
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):
+            second = self.get_list()
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+
+    def test_query_parameters_are_part_of_the_key(self):
+        self.get_list({'min_price': 50, 'ordering': 'min_price'})
+        self.assertEqual(self.get_list({'ordering': 'min_price', 'min_price': 50})['X-Cache'], 'HIT')
+        self.assertEqual(self.get_list({'min_price': 500})['X-Cache'], 'MISS')
+
+    def test_offer_writes_invalidate_the_list(self):
+        self.get_list()
+        self.offer.title = "Logo Design"
+        self.offer.save()
+
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], "Logo Design")
+
+    def test_detail_writes_invalidate_the_list(self):
+        self.get_list()
+        self.detail.price = 40
+        self.detail.save()
+
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['min_price'], '40.00')
+
+    def test_deleting_an_offer_invalidates_the_list(self):
+        self.get_list()
+        self.offer.delete()
+        self.assertEqual(self.get_list().data['results'], [])
+
+    def test_batch_create_invalidates_the_list(self):
+        self.get_list()
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.post(reverse('offers-batch'), [offer_payload("Neu")], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.get_list().data['count'], 2)
+
+    def test_login_does_not_invalidate_the_list(self):
+        self.get_list()
+        self.client.login(username="jane_doe", password="password24!")
+        self.assertEqual(self.get_list()['X-Cache'], 'HIT')
+
+    def test_error_responses_are_not_cached(self):
+        self.get_list({'ordering': 'description'})
+        response = self.get_list({'ordering': 'description'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_cache_stats()['hits'], 0)
+
+    def test_stats_count_hits_and_misses(self):
+        self.get_list()
+        self.get_list()
+        self.get_list()
+        stats = get_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+        out = StringIO()
+        call_command('offers_cache_stats', reset=True, stdout=out)
+        self.assertIn("hit ratio: 66.7%", out.getvalue())
+        self.assertEqual(get_cache_stats()['hits'], 0)
+
+    def test_file_based_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            caches = {'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': location,
+            }}
+            with override_settings(CACHES=caches):
+                self.assertEqual(self.get_list()['X-Cache'], 'MISS')
+                self.assertEqual(self.get_list()['X-Cache'], 'HIT')
+                self.detail.delete()
+                self.assertEqual(self.get_list()['X-Cache'], 'MISS')
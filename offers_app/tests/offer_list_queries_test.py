@@ -0,0 +1,104 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+from profile_app.models import BusinessProfile
+
+class OfferListQueryCountTestCase(APITestCase):
+    """
+    Regression tests making sure GET /api/offers/ runs a fixed number of
+    queries no matter how many offers end up on a page.
+    """
+    OFFER_COUNT = 300
+
+    def setUp(self):
+        self.business_users = [
+            CustomUser.objects.create_user(
+                username=f"business_{index}",
+                password="password24!",
+                first_name="Jane",
+                last_name=f"Doe {index}",
+                type="business"
+            )
+            for index in range(5)
+        ]
+
+        offers = Offer.objects.bulk_create([
+            Offer(
+                title=f"Offer {index}",
+                description=f"Description {index}",
+                min_price=100 + index,
+                min_delivery_time=1 + index % 14,
+                user=self.business_users[index % len(self.business_users)]
+            )
+            for index in range(self.OFFER_COUNT)
+        ])
+
+        OfferDetail.objects.bulk_create([
+            OfferDetail(
+                offer=offer,
+                title=f"{offer_type.title()} Design",
+                revisions=2,
+                delivery_time_in_days=5,
+                price=100,
+                features=["Logo Design"],
+                offer_type=offer_type
+            )
+            for offer in offers
+            for offer_type in ("basic", "standard", "premium")
+        ])
+
+    def get_offers(self, page_size):
+        url = reverse('offers-list')
+        return self.client.get(f'{url}?page_size={page_size}', format='json')
+
+    def test_query_count_is_constant_for_large_pages(self):
+        """COUNT + offers joined with their creator + one batch for all details"""
+        with self.assertNumQueries(3):
+            response = self.get_offers(self.OFFER_COUNT)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), self.OFFER_COUNT)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        with self.assertNumQueries(3):
+            self.get_offers(10)
+        with self.assertNumQueries(3):
+            self.get_offers(self.OFFER_COUNT)
+
+    def test_batched_payload_is_complete(self):
+        response = self.get_offers(self.OFFER_COUNT)
+
+        for offer in response.data['results']:
+            self.assertEqual(len(offer['details']), 3)
+            for detail in offer['details']:
+                self.assertEqual(detail['url'], f"/offerdetails/{detail['id']}/")
+            self.assertEqual(offer['user_details']['first_name'], "Jane")
+            self.assertTrue(offer['user_details']['username'].startswith("business_"))
+
+class SingleOfferQueryCountTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        BusinessProfile.objects.create(user=self.business_user, first_name="Jane", last_name="Doe")
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        for offer_type in ("basic", "standard", "premium"):
+            OfferDetail.objects.create(offer=self.offer, title=offer_type, price=100, offer_type=offer_type)
+        self.client.force_authenticate(user=self.business_user)
+
+    def test_single_offer_takes_two_queries(self):
+        """The offer joined with creator and profile + its details"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('single-offer', kwargs={'pk': self.offer.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['details']), 3)
+        self.assertEqual(response.data['user_details'], {
+            'first_name': "Jane",
+            'last_name': "Doe",
+            'username': "jane_doe"
+        })
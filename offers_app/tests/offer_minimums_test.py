@@ -0,0 +1,76 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+
+class OfferMinimumsTestCase(TestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.basic = OfferDetail.objects.create(
+            offer=self.offer, title="Basic", price=100, delivery_time_in_days=7, offer_type="basic"
+        )
+        self.premium = OfferDetail.objects.create(
+            offer=self.offer, title="Premium", price=300, delivery_time_in_days=3, offer_type="premium"
+        )
+
+    def assertMinimums(self, offer, min_price, min_delivery_time):
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, None if min_price is None else Decimal(min_price))
+        self.assertEqual(offer.min_delivery_time, min_delivery_time)
+
+    def test_creating_details_maintains_minimums(self):
+        self.assertMinimums(self.offer, '100.00', 3)
+
+    def test_updating_a_detail_outside_the_serializers(self):
+        self.basic.price = 500
+        self.basic.save()
+        self.assertMinimums(self.offer, '300.00', 3)
+
+        self.premium.delivery_time_in_days = 1
+        self.premium.save()
+        self.assertMinimums(self.offer, '300.00', 1)
+
+    def test_deleting_a_detail_maintains_minimums(self):
+        self.premium.delete()
+        self.assertMinimums(self.offer, '100.00', 7)
+
+        self.basic.delete()
+        self.assertMinimums(self.offer, None, None)
+
+    def test_empty_values_are_ignored(self):
+        OfferDetail.objects.create(offer=self.offer, title="Free", price=0, delivery_time_in_days=None)
+        self.assertMinimums(self.offer, '100.00', 3)
+
+    def test_detail_writes_touch_the_offer(self):
+        before = Offer.objects.get(pk=self.offer.pk).updated_at
+        self.basic.title = "Basic Plus"
+        self.basic.save()
+        self.assertGreater(Offer.objects.get(pk=self.offer.pk).updated_at, before)
+
+    def test_deleting_the_offer_skips_the_refresh(self):
+        with CaptureQueriesContext(connection) as context:
+            self.offer.delete()
+
+        updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(updates, [])
+
+    def test_recompute_command_repairs_drift(self):
+        other_offer = Offer.objects.create(title="Logo Design", user=self.business_user)
+        OfferDetail.objects.create(offer=other_offer, title="Basic", price=50, delivery_time_in_days=2)
+
+        # Drift introduced by writes that bypass the signals
+        Offer.objects.update(min_price=999, min_delivery_time=None)
+
+        call_command('recompute_offer_minimums', chunk_size=1, stdout=StringIO())
+
+        self.assertMinimums(self.offer, '100.00', 3)
+        self.assertMinimums(other_offer, '50.00', 2)
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from core.multiget import MultiGetMixin
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+
+def ids_param(ids):
+    return {'ids': ','.join(str(pk) for pk in ids)}
+
+class OfferMultiGetTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.offers = [Offer.objects.create(title=f"Offer {index}", user=self.business_user) for index in range(3)]
+        self.details = [
+            OfferDetail.objects.create(offer=self.offers[0], title=offer_type, price=100, offer_type=offer_type)
+            for offer_type in ("basic", "standard", "premium")
+        ]
+        self.client.force_authenticate(user=self.business_user)
+
+    def test_offer_details_in_request_order_with_one_query(self):
+        requested = [self.details[2].pk, self.details[0].pk, self.details[1].pk]
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('offer-details'), ids_param(requested))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([detail['id'] for detail in response.data['results']], requested)
+        self.assertEqual(response.data['results'][0]['offer_type'], "premium")
+        self.assertEqual(response.data['missing'], [])
+
+    def test_missing_ids_are_reported(self):
+        response = self.client.get(reverse('offer-details'), ids_param([999, self.details[0].pk, 998]))
+        self.assertEqual([detail['id'] for detail in response.data['results']], [self.details[0].pk])
+        self.assertEqual(response.data['missing'], [999, 998])
+
+    def test_offers_in_request_order(self):
+        requested = [self.offers[2].pk, self.offers[0].pk, 999]
+        response = self.client.get(reverse('offers-list'), {**ids_param(requested), 'min_price': 5000})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([offer['id'] for offer in response.data['results']], requested[:2])
+        self.assertEqual(response.data['missing'], [999])
+        self.assertEqual(len(response.data['results'][1]['details']), 3)
+
+    def test_offers_multi_get_query_count(self):
+        # Offers joined with their creator + one batch for all details
+        with self.assertNumQueries(2):
+            self.client.get(reverse('offers-list'), ids_param([offer.pk for offer in self.offers]))
+
+    def test_repeated_ids_are_returned_once(self):
+        pk = self.details[0].pk
+        response = self.client.get(reverse('offer-details'), ids_param([pk, pk]))
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_invalid_and_too_many_ids_are_rejected(self):
+        too_many = range(1, MultiGetMixin.max_multi_get_ids + 2)
+        for params in ({'ids': '1,abc'}, {'ids': ''}, {}, ids_param(too_many)):
+            with self.subTest(params=params):
+                response = self.client.get(reverse('offer-details'), params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('ids', response.data)
+
+        response = self.client.get(reverse('offers-list'), ids_param(too_many))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_offer_details_require_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('offer-details'), ids_param([self.details[0].pk]))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
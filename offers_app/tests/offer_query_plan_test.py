@@ -0,0 +1,89 @@
+import itertools
+from django.db.models import F
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from core.pagination import KeysetPagination
+from offers_app.api.views import OffersListView
+from core.testing import explain
+
+FILTERS = {'creator_id': 1, 'min_price': 100, 'max_delivery_time': 7}
+ORDERINGS = [
+    prefix + field
+    for field in OffersListView.ordering_fields
+    for prefix in ('', '-')
+]
+
+def offers_list_queryset(params):
+    view = OffersListView()
+    view.request = view.initialize_request(APIRequestFactory().get('/api/offers/', params))
+    view.format_kwarg = None
+    return view.get_queryset()
+
+def supported_combinations():
+    """Every filter subset with every ordering, except the unfiltered, unordered list."""
+    for size in range(len(FILTERS) + 1):
+        for names in itertools.combinations(FILTERS, size):
+            for ordering in [None, *ORDERINGS]:
+                if not names and ordering is None:
+                    continue
+                params = {name: FILTERS[name] for name in names}
+                if ordering:
+                    params['ordering'] = ordering
+                yield params
+
+class OfferQueryPlanTestCase(TestCase):
+    """
+    Uses EXPLAIN QUERY PLAN to check that every supported combination of
+    offer filters and orderings is answered through an index.
+    """
+
+    def assertUsesIndex(self, plan, params):
+        offer_steps = [step for step in plan if 'offers_app_offer ' in f'{step} ']
+        self.assertTrue(offer_steps, plan)
+        for step in offer_steps:
+            self.assertIn('INDEX', step, f'{params}: {plan}')
+
+    def test_every_filter_and_ordering_combination_uses_an_index(self):
+        for params in supported_combinations():
+            with self.subTest(**params):
+                self.assertUsesIndex(explain(offers_list_queryset(params)), params)
+
+    def test_ordering_alone_needs_no_sort_step(self):
+        for ordering in ORDERINGS:
+            for params in ({'ordering': ordering}, {'ordering': ordering, 'creator_id': 1}):
+                with self.subTest(**params):
+                    plan = explain(offers_list_queryset(params))
+                    self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
+
+    def test_keyset_pages_seek_through_an_index(self):
+        paginator = KeysetPagination()
+        for params in supported_combinations():
+            if 'ordering' not in params:
+                continue
+            queryset = offers_list_queryset(params)
+            ordering = paginator.get_ordering(queryset)
+            value = '2025-01-01T00:00:00+00:00' if 'updated_at' in params['ordering'] else '100'
+            queryset = queryset.annotate(**{
+                alias: F(field) for alias, field, _ in ordering if alias != 'pk'
+            }).order_by(*paginator.build_order_by(ordering))
+
+            for condition in paginator.build_seek_segments(ordering, [value, 1]):
+                with self.subTest(**params):
+                    plan = explain(queryset.filter(condition)[:11])
+                    self.assertUsesIndex(plan, params)
+
+class OfferOrderingWhitelistTestCase(APITestCase):
+    def test_unindexed_ordering_is_rejected(self):
+        for ordering in ('description', '-title', 'user__password', 'id'):
+            with self.subTest(ordering=ordering):
+                response = self.client.get(reverse('offers-list'), {'ordering': ordering})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('ordering', response.data)
+
+    def test_whitelisted_ordering_is_accepted(self):
+        for ordering in ORDERINGS:
+            with self.subTest(ordering=ordering):
+                response = self.client.get(reverse('offers-list'), {'ordering': ordering})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,81 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer
+from offers_app.search import SEARCH_TABLE, build_match_query
+from auth_app.models import CustomUser
+
+class OfferSearchTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+
+        self.logo_offer = Offer.objects.create(
+            title="Logo Design",
+            description="Ein einzigartiges Logo für Ihr Unternehmen",
+            user=self.business_user
+        )
+
+        self.website_offer = Offer.objects.create(
+            title="Webseite Design",
+            description="Professionelles Webseite-Design inklusive Logo",
+            user=self.business_user
+        )
+
+    def search(self, text):
+        url = reverse('offers-list')
+        response = self.client.get(url, {'search': text}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [offer['id'] for offer in response.data['results']]
+
+    def test_search_matches_title_and_description(self):
+        self.assertEqual(self.search("Webseite"), [self.website_offer.id])
+        self.assertEqual(self.search("einzigartiges"), [self.logo_offer.id])
+
+    def test_search_matches_word_prefixes(self):
+        self.assertEqual(self.search("Profession"), [self.website_offer.id])
+
+    def test_search_is_ranked_by_relevance(self):
+        """The offer naming 'Logo' in its title ranks above one mentioning it once"""
+        self.assertEqual(self.search("Logo"), [self.logo_offer.id, self.website_offer.id])
+
+    def test_explicit_ordering_overrides_rank(self):
+        url = reverse('offers-list')
+        response = self.client.get(url, {'search': "Logo", 'ordering': '-updated_at'}, format='json')
+        ids = [offer['id'] for offer in response.data['results']]
+        self.assertEqual(ids, [self.website_offer.id, self.logo_offer.id])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.logo_offer.title = "Visitenkarten"
+        self.logo_offer.save()
+        self.assertEqual(self.search("Visitenkarten"), [self.logo_offer.id])
+        self.assertEqual(self.search("einzigartiges"), [self.logo_offer.id])
+
+        self.website_offer.delete()
+        self.assertEqual(self.search("Webseite"), [])
+
+    def test_index_follows_bulk_writes(self):
+        Offer.objects.bulk_create([Offer(title="Flyer Druck", description="Flyer")])
+        Offer.objects.filter(pk=self.logo_offer.pk).update(title="Banner")
+
+        self.assertEqual(len(self.search("Flyer")), 1)
+        self.assertEqual(self.search("Banner"), [self.logo_offer.id])
+
+    def test_query_syntax_is_escaped(self):
+        self.assertEqual(build_match_query('Logo" OR (x'), '"Logo"* "OR"* "x"*')
+        self.assertEqual(self.search('"Logo AND'), [])
+        self.assertEqual(self.search('***'), [])
+
+    def test_rebuild_command_restores_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('delete-all')")
+        self.assertEqual(self.search("Logo"), [])
+
+        call_command('rebuild_offer_search_index', stdout=StringIO())
+        self.assertEqual(len(self.search("Logo")), 2)
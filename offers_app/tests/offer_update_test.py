@@ -0,0 +1,83 @@
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from offers_app.models import Offer, OfferDetail
+from auth_app.models import CustomUser
+from core.testing import statements
+
+class OfferUpdateTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.details = [
+            OfferDetail.objects.create(
+                offer=self.offer, title=offer_type, price=price, delivery_time_in_days=days, offer_type=offer_type
+            )
+            for offer_type, price, days in (("basic", 100, 7), ("standard", 200, 5), ("premium", 300, 3))
+        ]
+        self.client.force_authenticate(user=self.business_user)
+        self.url = reverse('single-offer', kwargs={'pk': self.offer.pk})
+
+    def patch(self, data):
+        return self.client.patch(self.url, data, format='json')
+
+    def test_details_are_updated_with_one_bulk_update(self):
+        payload = {"details": [
+            {"id": self.details[0].pk, "price": 50},
+            {"id": self.details[2].pk, "delivery_time_in_days": 1, "title": "Premium Plus"},
+        ]}
+        with CaptureQueriesContext(connection) as context:
+            response = self.patch(payload)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # One UPDATE for both details; the offer itself plus its minimums
+        self.assertEqual(len(statements(context.captured_queries, 'UPDATE', 'offers_app_offerdetail')), 1)
+        self.assertEqual(len(statements(context.captured_queries, 'UPDATE', 'offers_app_offer')), 2)
+
+        self.details[2].refresh_from_db()
+        self.assertEqual(self.details[2].title, "Premium Plus")
+        self.assertEqual(self.details[2].price, Decimal('300.00'))
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, Decimal('50.00'))
+        self.assertEqual(self.offer.min_delivery_time, 1)
+
+    def test_details_without_id_are_added(self):
+        payload = {"details": [{"title": "Extra", "price": 20, "delivery_time_in_days": 10, "offer_type": "basic"}]}
+        with CaptureQueriesContext(connection) as context:
+            response = self.patch(payload)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(statements(context.captured_queries, 'INSERT', 'offers_app_offerdetail')), 1)
+        self.assertEqual(self.offer.offer_details.count(), 4)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, Decimal('20.00'))
+
+    def test_unknown_detail_id_is_rejected_before_any_write(self):
+        other_offer = Offer.objects.create(title="Logo", user=self.business_user)
+        foreign = OfferDetail.objects.create(offer=other_offer, title="Basic", price=10)
+
+        for detail_id in (999, foreign.pk):
+            with self.subTest(detail_id=detail_id):
+                response = self.patch({
+                    "title": "Changed",
+                    "details": [{"id": self.details[0].pk, "price": 1}, {"id": detail_id, "price": 1}],
+                })
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('details', response.data)
+
+        self.offer.refresh_from_db()
+        self.details[0].refresh_from_db()
+        self.assertEqual(self.offer.title, "Webseite Design")
+        self.assertEqual(self.details[0].price, Decimal('100.00'))
+
+    def test_duplicate_detail_ids_are_rejected(self):
+        detail_id = self.details[0].pk
+        response = self.patch({"details": [{"id": detail_id, "price": 1}, {"id": detail_id, "price": 2}]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
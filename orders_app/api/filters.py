@@ -0,0 +1,33 @@
+from core.params import parse_datetime_param
+
+def scope_orders(queryset, user):
+    """
+    Limit orders to those of ``user``: as the business for business users,
+    as the customer otherwise. Joining the profile on its unique user column
+    yields a single profile id, so the (profile, ..., created_at) indexes
+    answer the scope, the filters and the ordering.
+    """
+    if user.type == 'business':
+        return queryset.filter(business_user__user=user)
+    return queryset.filter(customer_user__user=user)
+
+def filter_orders(queryset, params):
+    """
+    Apply the order list filters: status and the creation date range,
+    created_after (inclusive) and created_before (exclusive).
+    """
+    # Filter by status
+    status = params.get('status')
+    if status:
+        queryset = queryset.filter(status=status)
+
+    # Filter by creation date range
+    created_after = params.get('created_after')
+    if created_after:
+        queryset = queryset.filter(created_at__gte=parse_datetime_param('created_after', created_after))
+
+    created_before = params.get('created_before')
+    if created_before:
+        queryset = queryset.filter(created_at__lt=parse_datetime_param('created_before', created_before))
+
+    return queryset
@@ -1,10 +1,15 @@
+from django.db import transaction
 from rest_framework import serializers
-from orders_app.models import Order, OrderFeatures
+from orders_app.features import get_feature_ids
+from orders_app.models import ORDER_STATUSES, ArchivedOrder, Order, OrderFeatures
+from orders_app.transitions import update_order
 
 class SingleOrderDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = OrderFeatures
         fields = ['feature']
+        # Existing features are reused, not rejected as duplicates
+        extra_kwargs = {'feature': {'validators': []}}
 
 class OrderListSerializers(serializers.ModelSerializer):
     features = SingleOrderDetailSerializer(many=True)
@@ -31,25 +36,19 @@ class OrderListSerializers(serializers.ModelSerializer):
             "updated_at"
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         features_data = validated_data.pop('features', [])
-        offers = validated_data.pop('offers', None)
-        offer_detail = validated_data.pop('offer_detail', None)
         order = Order.objects.create(**validated_data)
-        if offers:
-            order.offers = offers
-            order.save()
-        if offer_detail:
-            order.offer_detail = offer_detail
-            order.save()
-        for feature_data in features_data:
-            feature, created = OrderFeatures.objects.get_or_create(feature=feature_data['feature'])
-            order.features.add(feature)
+        feature_ids = get_feature_ids(feature_data['feature'] for feature_data in features_data)
+        Order.features.through.objects.bulk_create([
+            Order.features.through(order_id=order.pk, orderfeatures_id=feature_id) for feature_id in feature_ids
+        ])
         return order
     
     def to_representation(self, instance):
         data = super().to_representation(instance) 
-        data['features'] = [f.feature for f in instance.features.all()]
+        data['features'] = [feature['feature'] for feature in data['features']]
         return data
     
 class SingleOrderSerializer(serializers.ModelSerializer):
@@ -73,6 +72,7 @@ class SingleOrderSerializer(serializers.ModelSerializer):
             "features", 
             "offer_type", 
             "status", 
+            "version", 
             "created_at", 
             "updated_at"
         ]
@@ -81,14 +81,42 @@ class SingleOrderSerializer(serializers.ModelSerializer):
             "created_at", 
             "updated_at"
         ]
+        # The version the client last saw, compared by update_order()
+        extra_kwargs = {"version": {"required": False}}
     
     def update(self, instance, validated_data):
         features_data = validated_data.pop("features", None)
+        version = validated_data.pop("version", None)
+        return update_order(instance, validated_data, version=version, features=features_data)
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+class OrderBulkStatusSerializer(serializers.Serializer):
+    max_ids = 100
 
-        if features_data is not None:
-            instance.features.set(features_data)
-        return instance
\ No newline at end of file
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=max_ids)
+    status = serializers.ChoiceField(choices=ORDER_STATUSES)
+
+    def validate_ids(self, ids):
+        return list(dict.fromkeys(ids))
+
+class ArchivedOrderSerializer(serializers.ModelSerializer):
+    features = serializers.SlugRelatedField(many=True, read_only=True, slug_field='feature')
+
+    class Meta:
+        model = ArchivedOrder
+        fields = [
+            "id",
+            "customer_user",
+            "business_user",
+            "title",
+            "revisions",
+            "delivery_time_in_days",
+            "price",
+            "features",
+            "offer_type",
+            "status",
+            "version",
+            "created_at",
+            "updated_at",
+            "archived_at"
+        ]
+        read_only_fields = fields
\ No newline at end of file
@@ -1,9 +1,15 @@
 from django.urls import path
-from .views import OrderListView, SingleOrderView, InProgressOrderCountView, CompletedOrderCountView
+from .views import OrderListView, SingleOrderView, OrderBulkStatusView, ArchivedOrderListView, SingleArchivedOrderView, InProgressOrderCountView, CompletedOrderCountView, OrderStatsView, OrderExportView, OrderFeatureExportView
 
 urlpatterns = [
     path('orders/', OrderListView.as_view(), name='orders-list'),
+    path('orders/export/', OrderExportView.as_view(), name='orders-export'),
+    path('orders/features/export/', OrderFeatureExportView.as_view(), name='order-features-export'),
+    path('orders/bulk-status/', OrderBulkStatusView.as_view(), name='orders-bulk-status'),
     path('orders/<int:pk>/', SingleOrderView.as_view(), name='single-order'),
+    path('archived-orders/', ArchivedOrderListView.as_view(), name='archived-orders-list'),
+    path('archived-orders/<int:pk>/', SingleArchivedOrderView.as_view(), name='single-archived-order'),
     path('order-count/<int:pk>/', InProgressOrderCountView.as_view(), name='in-progress-order-count'),
-    path('completed-order-count/<int:pk>/', CompletedOrderCountView.as_view(), name='completed-order-count')
+    path('completed-order-count/<int:pk>/', CompletedOrderCountView.as_view(), name='completed-order-count'),
+    path('order-stats/<int:pk>/', OrderStatsView.as_view(), name='order-stats')
 ]
\ No newline at end of file
@@ -1,53 +1,76 @@
-from django.db import models
-from orders_app.models import Order
+from django.db.models import Subquery
+from orders_app.counters import get_order_count, get_order_counts
+from orders_app.models import ArchivedOrder, Order
+from orders_app.transitions import bulk_transition
+from orders_app.exports import OrderExporter, OrderFeatureExporter
 from offers_app.models import OfferDetail
-from profile_app.models import CustomerProfile, BusinessProfile
+from profile_app.models import CustomerProfile
 from rest_framework import generics
 from rest_framework import status
-from .serializers import OrderListSerializers, SingleOrderSerializer
+from .serializers import OrderListSerializers, SingleOrderSerializer, OrderBulkStatusSerializer, ArchivedOrderSerializer
+from .permissions import IsUserOfTypeBusiness
+from .filters import filter_orders, scope_orders
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from core.exports import ExportView
+from core.pagination import KeysetPaginationMixin
+from idempotency_app.mixins import IdempotentCreateMixin
 
-class OrderListView(generics.ListCreateAPIView):
-    queryset = Order.objects.all()
+class OrderListView(IdempotentCreateMixin, KeysetPaginationMixin, generics.ListCreateAPIView):
+    """
+    Orders of the requesting user: as the business for business users,
+    as the customer otherwise. Newest first, filterable by status and
+    creation date.
+    """
     serializer_class = OrderListSerializers
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        queryset = scope_orders(Order.objects.all(), self.request.user)
+        queryset = filter_orders(queryset, self.request.query_params)
+        return queryset.prefetch_related('features').order_by('-created_at')
+
+    def get_offer_detail(self, offer_detail_id):
+        """
+        Load the detail with its offer, the business user and their profile,
+        plus the requesting user's customer profile id, in one query.
+        """
+        customer_profile = CustomerProfile.objects.filter(user=self.request.user).values('pk')[:1]
+        return (
+            OfferDetail.objects
+            .select_related('offer__user__businessprofile_profile')
+            .annotate(customer_profile_id=Subquery(customer_profile))
+            .filter(pk=offer_detail_id)
+            .first()
+        )
+
     def create(self, request, *args, **kwargs):
         offer_detail_id = request.data.get('offer_detail_id')
         if not offer_detail_id:
             return Response({"error": "offer_detail_id is required"}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            offer_detail_all = OfferDetail.objects.all()
-            print(f"offer_detail_all: {offer_detail_all}")
-            offer_detail = OfferDetail.objects.get(id=offer_detail_id)
-        except OfferDetail.DoesNotExist:
+            offer_detail = self.get_offer_detail(offer_detail_id)
+        except (TypeError, ValueError):
+            offer_detail = None
+        if offer_detail is None:
             return Response({"error": "Invalid offer_detail_id"}, status=status.HTTP_404_NOT_FOUND)
-        
-        # Fetch profiles
-        try:
-            customer_user = request.user
-            customer_profile = CustomerProfile.objects.get(user=customer_user)
-        except CustomerProfile.DoesNotExist: 
+
+        if offer_detail.customer_profile_id is None:
             return Response({"error": "Customer profile not found for user"}, status=status.HTTP_400_BAD_REQUEST)
-        business_user = offer_detail.user  
-        
+        business_user = offer_detail.user
+
         if not business_user:
             return Response({"error": "No user associated with this offer detail"}, status=status.HTTP_400_BAD_REQUEST)
-        
-        try:
-            business_profile = BusinessProfile.objects.get(user=business_user)
-        except BusinessProfile.DoesNotExist:
+
+        business_profile = getattr(business_user, 'businessprofile_profile', None)
+        if business_profile is None:
             return Response({"error": "Business profile not found for offer user"}, status=status.HTTP_400_BAD_REQUEST)
-        
 
-        # Derive order data from the offer (updated to include profiles and links)
+        # Derive order data from the offer; profiles and links are trusted and passed to save()
         features_data = [{'feature': feature} for feature in offer_detail.features or []]
 
         order_data = {
-            'customer_user': customer_profile.id,
-            'business_user': business_profile.id,
             'title': offer_detail.title,
             'revisions': offer_detail.revisions,
             'delivery_time_in_days': offer_detail.delivery_time_in_days,
@@ -59,9 +82,15 @@ class OrderListView(generics.ListCreateAPIView):
 
         serializer = self.get_serializer(data=order_data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+        serializer.save(
+            customer_user_id=offer_detail.customer_profile_id,
+            business_user=business_profile,
+            offers=offer_detail.offer,
+            offer_detail=offer_detail
+        )
+        data = serializer.data
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
 
 
 class SingleOrderView(generics.RetrieveUpdateDestroyAPIView):
@@ -69,13 +98,52 @@ class SingleOrderView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = SingleOrderSerializer
     permission_classes = [IsAuthenticated]       
 
+class OrderBulkStatusView(APIView):
+    """
+    Move many orders of the requesting business to one status. Takes
+    ``{"ids": [...], "status": "completed"}`` and reports the outcome for
+    every id in request order.
+    """
+    permission_classes = [IsUserOfTypeBusiness]
+
+    def post(self, request, *args, **kwargs):
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+        target = serializer.validated_data['status']
+
+        results = bulk_transition(request.user, ids, target)
+        return Response({
+            "status": target,
+            "results": [{"id": pk, "result": results[pk]} for pk in ids]
+        })
+
+class ArchivedOrderListView(KeysetPaginationMixin, generics.ListAPIView):
+    """
+    Archived orders of the requesting user, newest first. Takes the same
+    filters as the order list. Read-only.
+    """
+    serializer_class = ArchivedOrderSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = scope_orders(ArchivedOrder.objects.all(), self.request.user)
+        queryset = filter_orders(queryset, self.request.query_params)
+        return queryset.prefetch_related('features').order_by('-created_at')
+
+class SingleArchivedOrderView(generics.RetrieveAPIView):
+    serializer_class = ArchivedOrderSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return scope_orders(ArchivedOrder.objects.prefetch_related('features'), self.request.user)
+
 class InProgressOrderCountView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
         business_user_id = self.kwargs.get('pk')
-        in_progress_orders = Order.objects.filter(business_user=business_user_id, status='in_progress')
-        order_count = in_progress_orders.count()
+        order_count = get_order_count(business_user_id, 'in_progress')
         return Response({"order_count": order_count})
     
 class CompletedOrderCountView(APIView):
@@ -83,6 +151,18 @@ class CompletedOrderCountView(APIView):
 
     def get(self, request, *args, **kwargs):
         business_user_id = self.kwargs.get('pk')
-        completed_orders = Order.objects.filter(business_user = business_user_id, status='completed')
-        completed_order_count = completed_orders.count()
-        return Response({"completed_order_count": completed_order_count})
\ No newline at end of file
+        completed_order_count = get_order_count(business_user_id, 'completed')
+        return Response({"completed_order_count": completed_order_count})
+
+class OrderStatsView(APIView):
+    """Order counts of a business profile for every status, from the materialized counters."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_order_counts(self.kwargs.get('pk')))
+
+class OrderExportView(ExportView):
+    exporter_class = OrderExporter
+
+class OrderFeatureExportView(ExportView):
+    exporter_class = OrderFeatureExporter
@@ -0,0 +1,64 @@
+"""
+Moves cold orders out of the hot Order table.
+
+Completed or cancelled orders not updated for a while are copied into
+ArchivedOrder together with their feature links and then deleted from
+Order, one bounded chunk per transaction. A crash loses at most the chunk
+in progress, which is rolled back as a whole, so the command can simply be
+run again. Orders that another request changes while their chunk is being
+copied are left in place and picked up again by a later chunk or run.
+"""
+import operator
+from datetime import timedelta
+from functools import reduce
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .counters import paused_counting
+from .models import ArchivedOrder, Order
+
+ARCHIVED_STATUSES = ('completed', 'cancelled')
+
+COPIED_FIELDS = [
+    'id', 'customer_user_id', 'business_user_id', 'offers_id', 'offer_detail_id', 'title', 'revisions',
+    'delivery_time_in_days', 'price', 'offer_type', 'status', 'version', 'created_at', 'updated_at'
+]
+
+
+def get_cutoff(days=None):
+    if days is None:
+        days = getattr(settings, 'ORDER_ARCHIVE_AFTER_DAYS', 365)
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_orders(cutoff):
+    return Order.objects.filter(status__in=ARCHIVED_STATUSES, updated_at__lt=cutoff)
+
+
+@transaction.atomic
+def archive_chunk(cutoff, chunk_size):
+    """
+    Archive up to ``chunk_size`` orders, oldest ids first. Returns how many
+    were moved, which leaves out orders changed since they were copied.
+    """
+    rows = list(archivable_orders(cutoff).order_by('pk').values(*COPIED_FIELDS)[:chunk_size])
+    if not rows:
+        return 0
+    ids = [row['id'] for row in rows]
+
+    ArchivedOrder.objects.bulk_create([ArchivedOrder(**row) for row in rows], ignore_conflicts=True)
+    links = Order.features.through.objects.filter(order_id__in=ids).values_list('order_id', 'orderfeatures_id')
+    ArchivedOrder.features.through.objects.bulk_create([
+        ArchivedOrder.features.through(archivedorder_id=order_id, orderfeatures_id=feature_id)
+        for order_id, feature_id in links
+    ], ignore_conflicts=True)
+
+    # Archived orders still count, so the counters stay as they are
+    with paused_counting():
+        # Only the rows at the version that was copied; changed ones stay
+        _, deleted = archivable_orders(cutoff).filter(
+            reduce(operator.or_, (Q(pk=row['id'], version=row['version']) for row in rows))
+        ).delete()
+        ArchivedOrder.objects.filter(pk__in=Order.objects.filter(pk__in=ids).values('pk')).delete()
+    return deleted.get(Order._meta.label, 0)
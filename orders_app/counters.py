@@ -0,0 +1,85 @@
+"""
+Materialized order counts per business profile and status.
+
+OrderStatusCount holds one row per (business profile, status). Saving or
+deleting an order adjusts the affected rows with ``count = count + delta``
+through the signals in orders_app/signals.py. Writes that bypass the
+signals, like ``QuerySet.update()``, report their changes with
+``apply_count_deltas()``; ``reconcile_order_counts`` repairs any drift.
+Archived orders keep counting, so archiving pauses the signals with
+``paused_counting()``.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db.models import Count
+from core.aggregates import apply_deltas
+from .models import COUNTED_FIELDS, ORDER_STATUSES, ArchivedOrder, Order, OrderStatusCount
+
+_counting_paused = ContextVar('order_counting_paused', default=False)
+
+
+@contextmanager
+def paused_counting():
+    """Let order writes in this block leave the counters alone."""
+    token = _counting_paused.set(True)
+    try:
+        yield
+    finally:
+        _counting_paused.reset(token)
+
+
+def is_counting_paused():
+    return _counting_paused.get()
+
+
+def count_deltas(changes):
+    """
+    Turn ``(before, after)`` pairs of ``(business_user_id, status)`` keys
+    into counter deltas. ``None`` stands for no order.
+    """
+    deltas = Counter()
+    for before, after in changes:
+        if before == after:
+            continue
+        if before is not None:
+            deltas[before] -= 1
+        if after is not None:
+            deltas[after] += 1
+    return deltas
+
+
+def apply_count_deltas(deltas):
+    """Add the deltas to the counters, creating rows that are incremented for the first time."""
+    apply_deltas(OrderStatusCount, COUNTED_FIELDS, {key: {'count': delta} for key, delta in deltas.items()})
+
+
+def get_order_count(business_user_id, status):
+    """Return the number of orders of one business profile in one status."""
+    counters = OrderStatusCount.objects.filter(business_user_id=business_user_id, status=status)
+    count = counters.values_list('count', flat=True).first()
+    return count or 0
+
+
+def get_order_counts(business_user_id):
+    """Return the order count per status of one business profile, zero for unknown statuses."""
+    counts = dict.fromkeys(ORDER_STATUSES, 0)
+    counts.update(
+        OrderStatusCount.objects.filter(business_user_id=business_user_id).values_list('status', 'count')
+    )
+    return counts
+
+
+def compute_order_counts():
+    """Count all orders, archived ones included, per business profile and status."""
+    counts = Counter()
+    for model in (Order, ArchivedOrder):
+        counts.update({
+            (business_user_id, status): count
+            for business_user_id, status, count in model.objects
+            .filter(business_user__isnull=False)
+            .values_list('business_user_id', 'status')
+            .annotate(count=Count('pk'))
+            .order_by()
+        })
+    return dict(counts)
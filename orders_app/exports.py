@@ -0,0 +1,21 @@
+from django.db.models import F
+from core.exports import Exporter
+from .models import Order
+
+class OrderExporter(Exporter):
+    name = 'orders'
+    model = Order
+    fields = [
+        'id', 'customer_user_id', 'business_user_id', 'offers_id', 'offer_detail_id', 'title',
+        'revisions', 'delivery_time_in_days', 'price', 'offer_type', 'status', 'version', 'created_at', 'updated_at'
+    ]
+
+class OrderFeatureExporter(Exporter):
+    """One row per order and feature, so orders stay flat."""
+    name = 'order_features'
+    model = Order.features.through
+    fields = ['order_id', 'feature']
+    updated_field = 'order__updated_at'
+
+    def get_queryset(self):
+        return super().get_queryset().annotate(feature=F('orderfeatures__feature'))
@@ -0,0 +1,71 @@
+"""
+Interned order features.
+
+Every feature text is stored once in OrderFeatures. Each process keeps a
+bounded LRU map from feature text to id, so ordering a known feature
+needs no lookup at all. Unknown features are inserted with one
+conflict-ignoring INSERT and read back with one SELECT, which also picks
+up rows another process inserted at the same time.
+"""
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.db import transaction
+from .models import OrderFeatures
+
+
+class FeatureIdCache:
+    """Thread-safe LRU map of feature text to OrderFeatures id."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def get_many(self, names):
+        with self._lock:
+            found = {}
+            for name in names:
+                if name in self._ids:
+                    self._ids.move_to_end(name)
+                    found[name] = self._ids[name]
+            return found
+
+    def set_many(self, ids):
+        with self._lock:
+            for name, feature_id in ids.items():
+                self._ids[name] = feature_id
+                self._ids.move_to_end(name)
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+
+
+feature_id_cache = FeatureIdCache(getattr(settings, 'ORDER_FEATURE_CACHE_SIZE', 1024))
+
+
+def get_feature_ids(names):
+    """
+    Return the ids of the given feature texts in order, without duplicates,
+    inserting the ones that do not exist yet. Takes no query when all of
+    them are cached and two otherwise.
+    """
+    names = list(dict.fromkeys(names))
+    ids = feature_id_cache.get_many(names)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        OrderFeatures.objects.bulk_create(
+            [OrderFeatures(feature=name) for name in missing],
+            ignore_conflicts=True
+        )
+        loaded = dict(OrderFeatures.objects.filter(feature__in=missing).values_list('feature', 'id'))
+        ids.update(loaded)
+        # Rows inserted here are only safe to share once they are committed
+        transaction.on_commit(lambda: feature_id_cache.set_many(loaded))
+    return [ids[name] for name in names]
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from orders_app.archive import archivable_orders, archive_chunk, get_cutoff
+
+class Command(BaseCommand):
+    """
+    Move completed and cancelled orders that were not updated for a while
+    into the archive table, in chunks of one transaction each. Safe to stop
+    and run again.
+    """
+    help = "Archive old completed and cancelled orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int,
+                            help="Archive orders not updated for this many days (default: ORDER_ARCHIVE_AFTER_DAYS).")
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--max-chunks', type=int, help="Stop after this many chunks.")
+        parser.add_argument('--dry-run', action='store_true', help="Only count the orders that would be archived.")
+
+    def handle(self, *args, **options):
+        cutoff = get_cutoff(options['older_than_days'])
+        if options['dry_run']:
+            self.stdout.write(f"{archivable_orders(cutoff).count()} orders to archive (updated before {cutoff:%Y-%m-%d}).")
+            return
+
+        total = 0
+        chunks = 0
+        while options['max_chunks'] is None or chunks < options['max_chunks']:
+            moved = archive_chunk(cutoff, options['chunk_size'])
+            if not moved:
+                break
+            total += moved
+            chunks += 1
+            self.stdout.write(f"Archived {total} orders...")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} orders in {chunks} chunks."))
@@ -0,0 +1,105 @@
+import threading
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+from auth_app.models import CustomUser
+from core.benchmarks import isolated_database, summarize
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.views import OrderListView
+from profile_app.models import BusinessProfile, CustomerProfile
+
+FEATURES = ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer", "Social Media Kit"]
+
+class Command(BaseCommand):
+    """
+    Benchmark POST /api/orders/ with several customers ordering at the same
+    time, in a throwaway database. Reports orders per second and the
+    request latencies.
+    """
+    help = "Measure the throughput of concurrent order creation."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=2_000, help="Orders in total.")
+        parser.add_argument('--threads', type=int, default=8, help="Customers ordering concurrently.")
+        parser.add_argument('--offers', type=int, default=200)
+
+    def handle(self, *args, **options):
+        with isolated_database():
+            customers, detail_ids = self.seed(options['threads'], options['offers'])
+            # Every thread opens its own connection to the throwaway database
+            connections.close_all()
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                elapsed, durations, errors = self.run_threads(customers, detail_ids, options['orders'])
+
+        created = len(durations) - len(errors)
+        stats = summarize(durations)
+        self.stdout.write(
+            f"{created} orders in {elapsed:.2f} s with {len(customers)} threads: "
+            f"{created / elapsed:,.0f} orders/s, p50 {stats['p50']:.1f} ms, p95 {stats['p95']:.1f} ms"
+        )
+        if errors:
+            raise CommandError(f"{len(errors)} requests failed, first: {errors[0]}")
+
+    def seed(self, customer_count, offer_count):
+        business_users = CustomUser.objects.bulk_create([
+            CustomUser(username=f"benchmark_business_{index}", type='business') for index in range(10)
+        ])
+        BusinessProfile.objects.bulk_create([BusinessProfile(user=user) for user in business_users])
+        customers = CustomUser.objects.bulk_create([
+            CustomUser(username=f"benchmark_customer_{index}", type='customer') for index in range(customer_count)
+        ])
+        CustomerProfile.objects.bulk_create([CustomerProfile(user=user) for user in customers])
+
+        offers = Offer.objects.bulk_create([
+            Offer(title=f"Offer {index}", user=business_users[index % len(business_users)])
+            for index in range(offer_count)
+        ])
+        details = OfferDetail.objects.bulk_create([
+            OfferDetail(
+                offer=offer, title=offer_type, revisions=2, delivery_time_in_days=5, price=100,
+                features=FEATURES[:2 + index % 4], offer_type=offer_type
+            )
+            for index, offer in enumerate(offers)
+            for offer_type in ('basic', 'standard', 'premium')
+        ])
+        return customers, [detail.pk for detail in details]
+
+    def run_threads(self, customers, detail_ids, order_count):
+        durations = []
+        errors = []
+        view = OrderListView.as_view()
+        factory = APIRequestFactory()
+
+        def order(customer, count, offset):
+            try:
+                for index in range(count):
+                    request = factory.post(
+                        '/api/orders/',
+                        {'offer_detail_id': detail_ids[(offset + index) % len(detail_ids)]},
+                        format='json'
+                    )
+                    force_authenticate(request, user=customer)
+                    start = time.perf_counter()
+                    try:
+                        response = view(request)
+                        if response.status_code != 201:
+                            errors.append(response.data)
+                    except Exception as error:
+                        # e.g. SQLite giving up on a locked database
+                        errors.append(repr(error))
+                    durations.append((time.perf_counter() - start) * 1000)
+            finally:
+                connections.close_all()
+
+        threads = [
+            threading.Thread(target=order, args=(customer, order_count // len(customers), index * 7))
+            for index, customer in enumerate(customers)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start, durations, errors
@@ -0,0 +1,9 @@
+from core.exports import ExportCommand
+from orders_app.exports import OrderExporter, OrderFeatureExporter
+
+class Command(ExportCommand):
+    """
+    Stream orders or their features as NDJSON or CSV.
+    """
+    help = "Export orders or order features as NDJSON or CSV."
+    exporters = [OrderExporter, OrderFeatureExporter]
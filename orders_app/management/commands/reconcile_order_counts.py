@@ -0,0 +1,22 @@
+from core.aggregates import ReconcileCommand
+from orders_app.counters import compute_order_counts
+from orders_app.models import COUNTED_FIELDS, OrderStatusCount
+
+class Command(ReconcileCommand):
+    """
+    Recompute the materialized order counts from the orders table, e.g.
+    after writes that bypassed the signals. All counters are recomputed with
+    one GROUP BY and rewritten in one transaction.
+    """
+    help = "Recompute the per-business order counters from the orders."
+    model = OrderStatusCount
+    key_fields = COUNTED_FIELDS
+    value_fields = ('count',)
+    noun = 'counters'
+
+    def compute_expected(self):
+        return {key: {'count': count} for key, count in compute_order_counts().items()}
+
+    def describe(self, key, stored, expected):
+        business_user_id, status = key
+        return f"business profile {business_user_id}, {status}: {stored['count']} -> {expected['count']}"
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+
+def merge_duplicate_features(apps, schema_editor):
+    """Point orders at the oldest row of each feature text and drop the copies."""
+    OrderFeatures = apps.get_model('orders_app', 'OrderFeatures')
+    Order = apps.get_model('orders_app', 'Order')
+    OrderFeatureLink = Order.features.through
+
+    keepers = {}
+    duplicates = {}
+    for feature_id, feature in OrderFeatures.objects.order_by('pk').values_list('pk', 'feature'):
+        if feature in keepers:
+            duplicates[feature_id] = keepers[feature]
+        else:
+            keepers[feature] = feature_id
+    if not duplicates:
+        return
+
+    linked = set(OrderFeatureLink.objects.values_list('order_id', 'orderfeatures_id'))
+    for link in OrderFeatureLink.objects.filter(orderfeatures_id__in=duplicates):
+        keeper = duplicates[link.orderfeatures_id]
+        if (link.order_id, keeper) in linked:
+            link.delete()
+        else:
+            link.orderfeatures_id = keeper
+            link.save(update_fields=['orderfeatures'])
+            linked.add((link.order_id, keeper))
+    OrderFeatures.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0010_order_offer_detail'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_features, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='orderfeatures',
+            name='feature',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+    ]
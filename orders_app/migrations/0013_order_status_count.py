@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0012_order_role_indexes'),
+        ('profile_app', '0003_profile_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStatusCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_status_counts', to='profile_app.businessprofile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'status'), name='order_status_count_unique')],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO orders_app_orderstatuscount (business_user_id, status, count)
+            SELECT business_user_id, status, COUNT(*)
+            FROM orders_app_order
+            WHERE business_user_id IS NOT NULL
+            GROUP BY business_user_id, status
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
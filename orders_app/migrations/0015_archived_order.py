@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0008_offer_types_facets'),
+        ('orders_app', '0014_order_version_status_choices'),
+        ('profile_app', '0003_profile_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('revisions', models.IntegerField(default=0)),
+                ('delivery_time_in_days', models.IntegerField(default=0)),
+                ('price', models.IntegerField(default=0)),
+                ('offer_type', models.CharField(max_length=50)),
+                ('status', models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], max_length=50)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('business_user', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_business_orders', to='profile_app.businessprofile')),
+                ('customer_user', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_customer_orders', to='profile_app.customerprofile')),
+                ('features', models.ManyToManyField(blank=True, related_name='archived_orders', to='orders_app.orderfeatures')),
+                ('offer_detail', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to='offers_app.offerdetail')),
+                ('offers', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to='offers_app.offer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['customer_user', 'created_at'], name='archived_order_customer_idx'), models.Index(fields=['business_user', 'created_at'], name='archived_order_business_idx')],
+            },
+        ),
+    ]
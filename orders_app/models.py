@@ -1,9 +1,20 @@
 from django.db import models
+from core.aggregates import remember_loaded_values
 from profile_app.models import CustomerProfile, BusinessProfile
 from offers_app.models import Offer, OfferDetail
 
+ORDER_STATUSES = ('in_progress', 'completed', 'cancelled')
+
+# Order fields that decide which OrderStatusCount row an order counts towards
+COUNTED_FIELDS = ('business_user_id', 'status')
+
+# Allowed status changes; completed and cancelled orders are final
+ORDER_TRANSITIONS = {
+    'in_progress': ('completed', 'cancelled'),
+}
+
 class OrderFeatures(models.Model):
-    feature = models.CharField(max_length=255)
+    feature = models.CharField(max_length=255, unique=True)
 
     def __str__(self):
         return f"{self.feature}"
@@ -14,14 +25,16 @@ class Order(models.Model):
         on_delete=models.CASCADE, 
         related_name='assigned_customer_profile', 
         null=True, 
-        blank=True
+        blank=True,
+        db_index=False
     )
     business_user = models.ForeignKey(
         BusinessProfile, 
         on_delete=models.CASCADE, 
         related_name='assigned_business_profile', 
         null=True, 
-        blank=True
+        blank=True,
+        db_index=False
     )
     offers = models.ForeignKey(
         Offer, 
@@ -43,9 +56,113 @@ class Order(models.Model):
     price = models.IntegerField(default=0)
     features = models.ManyToManyField(OrderFeatures, related_name='order_features', blank=True)
     offer_type = models.CharField(max_length=50)
-    status = models.CharField(max_length=50, default='in_progress')
+    status = models.CharField(
+        max_length=50,
+        choices=[(status, status.replace('_', ' ').title()) for status in ORDER_STATUSES],
+        default='in_progress'
+    )
+    # Incremented by every update, see orders_app/transitions.py
+    version = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Role-scoped order lists sorted by date, with or without a status
+        # filter. They also serve the foreign key lookups, which therefore
+        # have no single-column index of their own.
+        indexes = [
+            models.Index(fields=['customer_user', 'status', 'created_at'], name='order_customer_status_idx'),
+            models.Index(fields=['business_user', 'status', 'created_at'], name='order_business_status_idx'),
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember which counter the stored row counts towards, so saving a
+        # status change needs no extra query (see orders_app/counters.py)
+        remember_loaded_values(instance, '_counted_as', COUNTED_FIELDS)
+        return instance
+
+    def __str__(self):
+        return f"{self.title}"
+
+class OrderStatusCount(models.Model):
+    """
+    Number of orders per business profile and status, kept up to date by
+    orders_app.counters so the order statistics need no COUNT(*).
+    """
+    business_user = models.ForeignKey(
+        BusinessProfile,
+        on_delete=models.CASCADE,
+        related_name='order_status_counts'
+    )
+    status = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business_user', 'status'], name='order_status_count_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.business_user_id} {self.status}: {self.count}"
+
+class ArchivedOrder(models.Model):
+    """
+    Completed or cancelled order moved out of Order by the archive_orders
+    command, with its original id and timestamps. Read-only in the API.
+    Archived orders still count towards OrderStatusCount.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    customer_user = models.ForeignKey(
+        CustomerProfile,
+        on_delete=models.CASCADE,
+        related_name='archived_customer_orders',
+        null=True,
+        blank=True,
+        db_index=False
+    )
+    business_user = models.ForeignKey(
+        BusinessProfile,
+        on_delete=models.CASCADE,
+        related_name='archived_business_orders',
+        null=True,
+        blank=True,
+        db_index=False
+    )
+    offers = models.ForeignKey(
+        Offer,
+        on_delete=models.CASCADE,
+        related_name='archived_orders',
+        blank=True,
+        null=True
+    )
+    offer_detail = models.ForeignKey(
+        OfferDetail,
+        on_delete=models.CASCADE,
+        related_name='archived_orders',
+        blank=True,
+        null=True
+    )
+    title = models.CharField(max_length=255)
+    revisions = models.IntegerField(default=0)
+    delivery_time_in_days = models.IntegerField(default=0)
+    price = models.IntegerField(default=0)
+    features = models.ManyToManyField(OrderFeatures, related_name='archived_orders', blank=True)
+    offer_type = models.CharField(max_length=50)
+    status = models.CharField(max_length=50, choices=Order._meta.get_field('status').choices)
+    version = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at'], name='archived_order_customer_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='archived_order_business_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title}"
\ No newline at end of file
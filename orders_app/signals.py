@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.aggregates import remember_stored_values
+from orders_app.counters import apply_count_deltas, count_deltas, is_counting_paused
+from orders_app.models import COUNTED_FIELDS, ArchivedOrder, Order
+
+def _counter_key(order):
+    return (order.business_user_id, order.status)
+
+@receiver(pre_save, sender=Order)
+def remember_counted_status(sender, instance, **kwargs):
+    """Look up the stored business and status if the instance did not load them."""
+    remember_stored_values(instance, '_counted_as', COUNTED_FIELDS)
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    if is_counting_paused():
+        return
+    before = None if created else getattr(instance, '_counted_as', None)
+    after = _counter_key(instance)
+    apply_count_deltas(count_deltas([(before, after)]))
+    instance._counted_as = after
+
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=ArchivedOrder)
+def count_deleted_order(sender, instance, **kwargs):
+    if is_counting_paused():
+        return
+    before = getattr(instance, '_counted_as', None) or _counter_key(instance)
+    apply_count_deltas(count_deltas([(before, None)]))
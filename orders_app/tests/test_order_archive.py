@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db.models import F
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.archive import archive_chunk, get_cutoff
+from orders_app.counters import paused_counting
+from orders_app.models import ArchivedOrder, Order, OrderFeatures, OrderStatusCount
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class OrderArchiveTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.customer_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="customer"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.customer_profile = CustomerProfile.objects.create(user=self.customer_user)
+        self.feature = OrderFeatures.objects.create(feature="Logo Design")
+
+        self.orders = []
+        for index, order_status in enumerate(['completed', 'cancelled', 'completed', 'in_progress', 'completed']):
+            order = Order.objects.create(
+                customer_user=self.customer_profile,
+                business_user=self.business_profile,
+                title=f"Order {index}",
+                status=order_status
+            )
+            order.features.add(self.feature)
+            self.orders.append(order)
+
+        # All but the last order were last touched two years ago
+        old = timezone.now() - timedelta(days=730)
+        Order.objects.exclude(pk=self.orders[-1].pk).update(updated_at=old, created_at=old)
+
+    def counts(self):
+        return dict(OrderStatusCount.objects.values_list('status', 'count'))
+
+    def test_command_moves_old_final_orders_with_their_features(self):
+        counts = self.counts()
+        call_command('archive_orders', chunk_size=2, stdout=StringIO())
+
+        archived_ids = [self.orders[0].pk, self.orders[1].pk, self.orders[2].pk]
+        self.assertEqual(sorted(ArchivedOrder.objects.values_list('pk', flat=True)), archived_ids)
+        self.assertEqual(sorted(Order.objects.values_list('pk', flat=True)), [self.orders[3].pk, self.orders[4].pk])
+
+        archived = ArchivedOrder.objects.get(pk=self.orders[0].pk)
+        self.assertEqual(list(archived.features.values_list('feature', flat=True)), ["Logo Design"])
+        self.assertEqual(archived.status, 'completed')
+        self.assertFalse(Order.features.through.objects.filter(order_id__in=archived_ids).exists())
+        self.assertEqual(self.counts(), counts)
+
+    def test_chunks_are_bounded_and_resumable(self):
+        cutoff = get_cutoff(365)
+        self.assertEqual(archive_chunk(cutoff, 2), 2)
+        self.assertEqual(ArchivedOrder.objects.count(), 2)
+
+        self.assertEqual(archive_chunk(cutoff, 2), 1)
+        self.assertEqual(archive_chunk(cutoff, 2), 0)
+        self.assertEqual(ArchivedOrder.objects.count(), 3)
+
+    def test_orders_changed_while_copying_stay(self):
+        @contextmanager
+        def change_first_order():
+            # Another request updates the order after the chunk was copied
+            Order.objects.filter(pk=self.orders[0].pk).update(version=F('version') + 1)
+            with paused_counting():
+                yield
+
+        counts = self.counts()
+        with mock.patch('orders_app.archive.paused_counting', change_first_order):
+            self.assertEqual(archive_chunk(get_cutoff(365), 2), 1)
+
+        self.assertTrue(Order.objects.filter(pk=self.orders[0].pk).exists())
+        self.assertEqual(list(ArchivedOrder.objects.values_list('pk', flat=True)), [self.orders[1].pk])
+        self.assertEqual(self.counts(), counts)
+
+        # The next chunk archives it at its new version
+        self.assertEqual(archive_chunk(get_cutoff(365), 2), 2)
+        self.assertEqual(ArchivedOrder.objects.get(pk=self.orders[0].pk).version, 2)
+
+    def test_dry_run_only_counts(self):
+        stdout = StringIO()
+        call_command('archive_orders', dry_run=True, stdout=stdout)
+        self.assertIn("3 orders to archive", stdout.getvalue())
+        self.assertFalse(ArchivedOrder.objects.exists())
+
+    def test_reconcile_includes_archived_orders(self):
+        call_command('archive_orders', stdout=StringIO())
+        stdout = StringIO()
+        call_command('reconcile_order_counts', dry_run=True, stdout=stdout)
+        self.assertIn("Found 0 drifted counters", stdout.getvalue())
+
+    def test_archived_orders_are_readable_by_their_parties(self):
+        call_command('archive_orders', stdout=StringIO())
+
+        for user in (self.customer_user, self.business_user):
+            self.client.force_authenticate(user=user)
+            response = self.client.get(reverse('archived-orders-list'))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data), 3)
+            self.assertEqual(response.data[0]['features'], ["Logo Design"])
+
+        response = self.client.get(reverse('single-archived-order', kwargs={'pk': self.orders[0].pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], "Order 0")
+
+        other_user = CustomUser.objects.create_user(username="erika_muster", password="password24!", type="customer")
+        self.client.force_authenticate(user=other_user)
+        response = self.client.get(reverse('single-archived-order', kwargs={'pk': self.orders[0].pk}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_archive_endpoints_are_read_only(self):
+        call_command('archive_orders', stdout=StringIO())
+        self.client.force_authenticate(user=self.business_user)
+        url = reverse('single-archived-order', kwargs={'pk': self.orders[0].pk})
+        self.assertEqual(self.client.patch(url, {'title': "Changed"}).status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
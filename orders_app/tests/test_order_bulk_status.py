@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.models import Order, OrderStatusCount
+from profile_app.models import BusinessProfile
+from auth_app.models import CustomUser
+
+class OrderBulkStatusTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.other_business_user = CustomUser.objects.create_user(
+            username="max_muster",
+            password="password24!",
+            type="business"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.other_business_profile = BusinessProfile.objects.create(user=self.other_business_user)
+        self.orders = [
+            Order.objects.create(business_user=self.business_profile, title=f"Order {index}")
+            for index in range(30)
+        ]
+        self.client.force_authenticate(user=self.business_user)
+
+    def bulk_update(self, ids, target='completed'):
+        return self.client.post(reverse('orders-bulk-status'), {'ids': ids, 'status': target}, format='json')
+
+    def test_orders_are_updated_with_one_statement(self):
+        ids = [order.pk for order in self.orders]
+        with CaptureQueriesContext(connection) as context:
+            response = self.bulk_update(ids)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'id': pk, 'result': 'updated'} for pk in ids])
+        order_updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orders_app_order"')
+        ]
+        self.assertEqual(len(order_updates), 1)
+        self.assertEqual(Order.objects.filter(status='completed', version=2).count(), 30)
+        self.assertEqual(
+            dict(OrderStatusCount.objects.values_list('status', 'count')),
+            {'in_progress': 0, 'completed': 30}
+        )
+
+    def test_results_are_reported_per_id(self):
+        foreign = Order.objects.create(business_user=self.other_business_profile, title="Foreign")
+        self.orders[1].status = 'cancelled'
+        self.orders[1].save()
+        self.orders[2].status = 'completed'
+        self.orders[2].save()
+        missing = foreign.pk + 1
+
+        response = self.bulk_update([self.orders[0].pk, self.orders[1].pk, self.orders[2].pk, foreign.pk, missing])
+
+        self.assertEqual(response.data, {
+            'status': 'completed',
+            'results': [
+                {'id': self.orders[0].pk, 'result': 'updated'},
+                {'id': self.orders[1].pk, 'result': 'invalid_transition'},
+                {'id': self.orders[2].pk, 'result': 'unchanged'},
+                {'id': foreign.pk, 'result': 'forbidden'},
+                {'id': missing, 'result': 'not_found'},
+            ]
+        })
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, 'in_progress')
+
+    def test_invalid_payloads_are_rejected(self):
+        for payload in ({'ids': [], 'status': 'completed'}, {'ids': [1], 'status': 'shipped'}, {'status': 'completed'}):
+            with self.subTest(**payload):
+                response = self.client.post(reverse('orders-bulk-status'), payload, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.bulk_update(list(range(1, 102)))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customers_are_forbidden(self):
+        customer = CustomUser.objects.create_user(username="john_doe", password="password24!", type="customer")
+        self.client.force_authenticate(user=customer)
+        self.assertEqual(self.bulk_update([self.orders[0].pk]).status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,83 @@
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.models import Order, OrderStatusCount
+from profile_app.models import BusinessProfile
+from auth_app.models import CustomUser
+
+class OrderCountersTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.orders = [
+            Order.objects.create(business_user=self.business_profile, title=f"Order {index}")
+            for index in range(3)
+        ]
+        self.client.force_authenticate(user=self.business_user)
+
+    def counts(self):
+        return dict(
+            OrderStatusCount.objects.filter(business_user=self.business_profile).values_list('status', 'count')
+        )
+
+    def test_creating_orders_increments_the_counter(self):
+        self.assertEqual(self.counts(), {'in_progress': 3})
+
+    def test_status_changes_move_the_count(self):
+        self.orders[0].status = 'completed'
+        self.orders[0].save()
+        self.orders[0].save()
+
+        order = Order.objects.get(pk=self.orders[1].pk)
+        order.status = 'cancelled'
+        order.save()
+
+        self.assertEqual(self.counts(), {'in_progress': 1, 'completed': 1, 'cancelled': 1})
+
+    def test_saving_a_deferred_instance_looks_up_the_old_status(self):
+        order = Order.objects.only('title').get(pk=self.orders[0].pk)
+        order.status = 'completed'
+        order.save()
+        self.assertEqual(self.counts(), {'in_progress': 2, 'completed': 1})
+
+    def test_deleting_orders_decrements_the_counter(self):
+        self.orders[0].delete()
+        Order.objects.filter(pk=self.orders[1].pk).delete()
+        self.assertEqual(self.counts(), {'in_progress': 1})
+
+    def test_order_stats_reads_the_counters(self):
+        self.orders[0].status = 'completed'
+        self.orders[0].save()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-stats', kwargs={'pk': self.business_profile.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'in_progress': 2, 'completed': 1, 'cancelled': 0})
+
+    def test_count_endpoints_use_the_counters(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('in-progress-order-count', kwargs={'pk': self.business_profile.pk}))
+        self.assertEqual(response.data, {"order_count": 3})
+
+        response = self.client.get(reverse('completed-order-count', kwargs={'pk': self.business_profile.pk}))
+        self.assertEqual(response.data, {"completed_order_count": 0})
+
+    def test_reconcile_command_repairs_drift(self):
+        # Writes that bypass the signals
+        Order.objects.filter(pk=self.orders[0].pk).update(status='completed')
+        OrderStatusCount.objects.filter(status='in_progress').update(count=10)
+
+        stdout = StringIO()
+        call_command('reconcile_order_counts', dry_run=True, stdout=stdout)
+        self.assertIn("Found 2 drifted counters", stdout.getvalue())
+        self.assertEqual(self.counts(), {'in_progress': 10})
+
+        call_command('reconcile_order_counts', stdout=StringIO())
+        self.assertEqual(self.counts(), {'in_progress': 2, 'completed': 1})
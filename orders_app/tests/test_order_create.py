@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.features import feature_id_cache
+from orders_app.models import Order, OrderFeatures
+from offers_app.models import Offer, OfferDetail
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class OrderCreateTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.customer_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="customer"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.customer_profile = CustomerProfile.objects.create(user=self.customer_user)
+        self.offer = Offer.objects.create(title="Webseite Design", user=self.business_user)
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Design",
+            revisions=2,
+            delivery_time_in_days=5,
+            price=150,
+            features=["Logo Design", "Visitenkarte"],
+            offer_type="basic"
+        )
+        OrderFeatures.objects.create(feature="Logo Design")
+        feature_id_cache.clear()
+        self.client.force_authenticate(user=self.customer_user)
+
+    def create_order(self, offer_detail_id):
+        return self.client.post(reverse('orders-list'), {'offer_detail_id': offer_detail_id}, format='json')
+
+    def test_create_order_from_offer_detail(self):
+        response = self.create_order(self.offer_detail.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['customer_user'], self.customer_profile.pk)
+        self.assertEqual(response.data['business_user'], self.business_profile.pk)
+        self.assertEqual(response.data['features'], ["Logo Design", "Visitenkarte"])
+        self.assertEqual(response.data['status'], "in_progress")
+
+        order = Order.objects.get(pk=response.data['id'])
+        self.assertEqual(order.offers, self.offer)
+        self.assertEqual(order.offer_detail, self.offer_detail)
+        self.assertEqual(order.price, 150)
+        self.assertEqual(OrderFeatures.objects.filter(feature="Logo Design").count(), 1)
+
+    def test_lookups_take_one_query_and_writes_one_transaction(self):
+        with CaptureQueriesContext(connection) as context:
+            self.create_order(self.offer_detail.pk)
+
+        # The order counter updates are covered by test_order_counters
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'orders_app_orderstatuscount' not in query['sql']
+        ]
+        selects = [sql for sql in queries if sql.startswith('SELECT')]
+        # The joined lookup, existing features and the features of the response
+        self.assertEqual(len(selects), 3)
+        self.assertIn('profile_app_businessprofile', selects[0])
+        self.assertIn('profile_app_customerprofile', selects[0])
+        inserts = [sql for sql in queries if sql.startswith('INSERT')]
+        self.assertEqual(len(inserts), 3)
+        self.assertFalse([sql for sql in queries if sql.startswith('UPDATE')])
+
+    def test_missing_and_unknown_offer_detail(self):
+        self.assertEqual(self.client.post(reverse('orders-list'), {}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.create_order(self.offer_detail.pk + 1).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.create_order("abc").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_missing_profiles(self):
+        self.business_profile.delete()
+        response = self.create_order(self.offer_detail.pk)
+        self.assertEqual(response.data, {"error": "Business profile not found for offer user"})
+
+        self.customer_profile.delete()
+        response = self.create_order(self.offer_detail.pk)
+        self.assertEqual(response.data, {"error": "Customer profile not found for user"})
+        self.assertFalse(Order.objects.exists())
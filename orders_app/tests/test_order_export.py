@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.models import Order, OrderFeatures
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+def read_stream(response):
+    return b''.join(response.streaming_content).decode('utf-8')
+
+class OrderExportTestCase(APITestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            username="admin",
+            password="password24!",
+            type="business",
+            is_staff=True
+        )
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.customer_user = CustomUser.objects.create_user(
+            username="john_doe",
+            password="password24!",
+            type="customer"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.customer_profile = CustomerProfile.objects.create(user=self.customer_user)
+        self.features = [OrderFeatures.objects.create(feature=name) for name in ("Logo Design", "Flyer")]
+
+        self.orders = []
+        for index in range(4):
+            order = Order.objects.create(
+                customer_user=self.customer_profile,
+                business_user=self.business_profile,
+                title=f"Order {index}",
+                price=100 + index
+            )
+            order.features.set(self.features[:index % 2 + 1])
+            self.orders.append(order)
+        self.client.force_authenticate(user=self.admin)
+
+    def test_ndjson_export_streams_one_object_per_order(self):
+        response = self.client.get(reverse('orders-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [order.pk for order in self.orders])
+        self.assertEqual(rows[1]['business_user_id'], self.business_profile.pk)
+        self.assertEqual(rows[1]['customer_user_id'], self.customer_profile.pk)
+        self.assertEqual(rows[1]['price'], 101)
+        self.assertEqual(rows[1]['status'], 'in_progress')
+        self.assertEqual(rows[1]['version'], 1)
+
+    def test_feature_export_has_one_row_per_order_and_feature(self):
+        response = self.client.get(reverse('order-features-export'), {'output': 'csv'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        self.assertEqual(
+            sorted((int(row['order_id']), row['feature']) for row in rows),
+            sorted(
+                (order.pk, feature.feature)
+                for order in self.orders
+                for feature in order.features.all()
+            )
+        )
+
+    def test_updated_since_limits_the_rows(self):
+        cutoff = timezone.now() + timedelta(minutes=1)
+        Order.objects.filter(pk=self.orders[1].pk).update(updated_at=cutoff + timedelta(minutes=1))
+
+        response = self.client.get(reverse('orders-export'), {'updated_since': cutoff.isoformat()})
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.orders[1].pk])
+
+        response = self.client.get(reverse('order-features-export'), {'updated_since': cutoff.isoformat()})
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual(sorted(row['feature'] for row in rows), ["Flyer", "Logo Design"])
+        self.assertEqual({row['order_id'] for row in rows}, {self.orders[1].pk})
+
+    def test_updated_since_accepts_a_date(self):
+        tomorrow = (timezone.localdate() + timedelta(days=1)).isoformat()
+        response = self.client.get(reverse('orders-export'), {'updated_since': tomorrow})
+        self.assertEqual(read_stream(response), '')
+
+    def test_export_is_staff_only(self):
+        self.client.force_authenticate(user=self.business_user)
+        self.assertEqual(self.client.get(reverse('orders-export')).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get(reverse('order-features-export')).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_command(self):
+        stdout = io.StringIO()
+        call_command('export_orders', stdout=stdout)
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(rows), 4)
+
+        stdout = io.StringIO()
+        call_command('export_orders', dataset='order_features', output='csv', stdout=stdout)
+        rows = list(csv.DictReader(io.StringIO(stdout.getvalue())))
+        self.assertEqual(len(rows), 6)
@@ -0,0 +1,95 @@
+from django.db import IntegrityError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.features import FeatureIdCache, feature_id_cache, get_feature_ids
+from orders_app.models import Order, OrderFeatures, OrderStatusCount
+from offers_app.models import Offer, OfferDetail
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class FeatureIdCacheTestCase(TestCase):
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = FeatureIdCache(max_size=2)
+        cache.set_many({"Logo": 1, "Flyer": 2})
+        cache.get_many(["Logo"])
+        cache.set_many({"Banner": 3})
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_many(["Logo", "Flyer", "Banner"]), {"Logo": 1, "Banner": 3})
+
+    def test_feature_text_is_unique(self):
+        OrderFeatures.objects.create(feature="Logo Design")
+        with self.assertRaises(IntegrityError):
+            OrderFeatures.objects.create(feature="Logo Design")
+
+class GetFeatureIdsTestCase(TestCase):
+    def setUp(self):
+        feature_id_cache.clear()
+        self.addCleanup(feature_id_cache.clear)
+        self.logo = OrderFeatures.objects.create(feature="Logo Design")
+
+    def test_missing_features_are_inserted_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(2):
+                ids = get_feature_ids(["Logo Design", "Flyer", "Flyer"])
+
+        self.assertEqual(ids[0], self.logo.pk)
+        self.assertEqual(len(ids), 2)
+        self.assertEqual(OrderFeatures.objects.count(), 2)
+
+    def test_cached_features_need_no_query(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ids = get_feature_ids(["Logo Design", "Flyer"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_feature_ids(["Flyer", "Logo Design"]), ids[::-1])
+
+    def test_cache_is_only_filled_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            get_feature_ids(["Flyer"])
+        self.assertEqual(len(feature_id_cache), 0)
+
+class OrderFeatureQueryCountTestCase(APITestCase):
+    def setUp(self):
+        feature_id_cache.clear()
+        self.addCleanup(feature_id_cache.clear)
+        business_user = CustomUser.objects.create_user(username="jane_doe", password="password24!", type="business")
+        self.customer_user = CustomUser.objects.create_user(username="john_doe", password="password24!", type="customer")
+        business_profile = BusinessProfile.objects.create(user=business_user)
+        # Only the first order of a business creates its counter row
+        OrderStatusCount.objects.create(business_user=business_profile, status='in_progress')
+        CustomerProfile.objects.create(user=self.customer_user)
+        offer = Offer.objects.create(title="Webseite Design", user=business_user)
+        self.details = [
+            OfferDetail.objects.create(
+                offer=offer, title=f"Design {count}", revisions=2, delivery_time_in_days=5, price=100, offer_type="basic",
+                features=[f"Feature {index}" for index in range(count)]
+            )
+            for count in (1, 20)
+        ]
+        self.client.force_authenticate(user=self.customer_user)
+
+    def create_order(self, offer_detail):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('orders-list'), {'offer_detail_id': offer_detail.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response
+
+    def count_queries(self, offer_detail):
+        with CaptureQueriesContext(connection) as context:
+            self.create_order(offer_detail)
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_depend_on_the_number_of_features(self):
+        self.assertEqual(self.count_queries(self.details[0]), self.count_queries(self.details[1]))
+
+    def test_known_features_skip_the_feature_table(self):
+        cold = self.count_queries(self.details[1])
+        warm = self.count_queries(self.details[1])
+
+        self.assertEqual(warm, cold - 2)
+        self.assertEqual(OrderFeatures.objects.count(), 20)
+        self.assertEqual(Order.objects.last().features.count(), 20)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from rest_framework import status
+from orders_app.api.views import OrderListView
+from orders_app.models import Order, OrderFeatures
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+from core.testing import explain
+
+def create_user(username, type):
+    user = CustomUser.objects.create_user(username=username, password="password24!", type=type)
+    profile_model = BusinessProfile if type == 'business' else CustomerProfile
+    return user, profile_model.objects.create(user=user)
+
+class OrderListTestCase(APITestCase):
+    def setUp(self):
+        self.business_user, self.business_profile = create_user("jane_doe", "business")
+        self.other_business_user, self.other_business_profile = create_user("max_muster", "business")
+        self.customer_user, self.customer_profile = create_user("john_doe", "customer")
+        self.features = [OrderFeatures.objects.create(feature=name) for name in ("Logo Design", "Flyer")]
+
+        now = timezone.now()
+        self.orders = []
+        for index, (business_profile, order_status) in enumerate([
+            (self.business_profile, 'in_progress'),
+            (self.business_profile, 'completed'),
+            (self.other_business_profile, 'in_progress'),
+        ]):
+            order = Order.objects.create(
+                customer_user=self.customer_profile,
+                business_user=business_profile,
+                title=f"Order {index}",
+                status=order_status
+            )
+            order.features.set(self.features)
+            self.orders.append(order)
+        for index, order in enumerate(self.orders):
+            Order.objects.filter(pk=order.pk).update(created_at=now - timedelta(days=10 * index))
+
+    def get_orders(self, user, params=None):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse('orders-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [order['id'] for order in response.data]
+
+    def test_business_sees_only_its_orders(self):
+        self.assertEqual(self.get_orders(self.business_user), [self.orders[0].pk, self.orders[1].pk])
+        self.assertEqual(self.get_orders(self.other_business_user), [self.orders[2].pk])
+
+    def test_customer_sees_own_orders_newest_first(self):
+        self.assertEqual(self.get_orders(self.customer_user), [order.pk for order in self.orders])
+
+        other_customer, _ = create_user("erika_muster", "customer")
+        self.assertEqual(self.get_orders(other_customer), [])
+
+    def test_status_and_date_filters(self):
+        self.assertEqual(self.get_orders(self.customer_user, {'status': 'in_progress'}), [self.orders[0].pk, self.orders[2].pk])
+
+        cutoff = (timezone.now() - timedelta(days=5)).date().isoformat()
+        self.assertEqual(self.get_orders(self.customer_user, {'created_after': cutoff}), [self.orders[0].pk])
+        self.assertEqual(self.get_orders(self.customer_user, {'created_before': cutoff}), [self.orders[1].pk, self.orders[2].pk])
+
+    def test_invalid_date_is_rejected(self):
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.get(reverse('orders-list'), {'created_after': 'last week'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('created_after', response.data)
+
+    def test_features_are_prefetched(self):
+        self.client.force_authenticate(user=self.customer_user)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('orders-list'))
+        self.assertEqual(response.data[0]['features'], ["Logo Design", "Flyer"])
+
+class OrderListQueryPlanTestCase(TestCase):
+    """The scoped, filtered and ordered list is answered by an index without sorting."""
+
+    def order_list_queryset(self, user, params):
+        view = OrderListView()
+        request = APIRequestFactory().get('/api/orders/', params)
+        force_authenticate(request, user=user)
+        view.request = view.initialize_request(request)
+        view.request.user = user
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def test_every_filter_combination_uses_a_role_index(self):
+        for type in ('business', 'customer'):
+            user, _ = create_user(f"{type}_user", type)
+            for params, index in (
+                ({}, f'order_{type}_created_idx'),
+                ({'created_after': '2025-01-01'}, f'order_{type}_created_idx'),
+                ({'status': 'completed'}, f'order_{type}_status_idx'),
+                ({'status': 'completed', 'created_after': '2025-01-01'}, f'order_{type}_status_idx'),
+            ):
+                with self.subTest(type=type, **params):
+                    plan = explain(self.order_list_queryset(user, params))
+                    order_steps = [step for step in plan if 'orders_app_order ' in f'{step} ']
+                    self.assertTrue(order_steps, plan)
+                    self.assertIn(index, order_steps[0])
+                    self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
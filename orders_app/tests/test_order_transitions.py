@@ -0,0 +1,85 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from orders_app.models import Order, OrderStatusCount
+from orders_app.transitions import OrderConflict, update_order
+from profile_app.models import BusinessProfile
+from auth_app.models import CustomUser
+
+class OrderTransitionTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="jane_doe",
+            password="password24!",
+            type="business"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+        self.order = Order.objects.create(business_user=self.business_profile, title="Logo Design")
+        self.client.force_authenticate(user=self.business_user)
+
+    def patch(self, data):
+        return self.client.patch(reverse('single-order', kwargs={'pk': self.order.pk}), data, format='json')
+
+    def test_status_update_is_one_conditional_update_of_the_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.patch({'status': 'completed', 'version': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['version'], 2)
+
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orders_app_order"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"version" = ', updates[0])
+        self.assertIn('"version" = 1', updates[0].split('WHERE')[1])
+        self.assertNotIn('"title"', updates[0])
+
+        counts = dict(OrderStatusCount.objects.values_list('status', 'count'))
+        self.assertEqual(counts, {'in_progress': 0, 'completed': 1})
+
+    def test_stale_version_is_a_conflict(self):
+        self.patch({'title': "Logo Design Plus"})
+
+        response = self.patch({'status': 'cancelled', 'version': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'in_progress')
+        self.assertEqual(self.order.version, 2)
+
+    def test_concurrent_write_is_detected_without_a_client_version(self):
+        first = Order.objects.get(pk=self.order.pk)
+        second = Order.objects.get(pk=self.order.pk)
+
+        update_order(first, {'status': 'completed'})
+        with self.assertRaises(OrderConflict):
+            update_order(second, {'status': 'cancelled'})
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'completed')
+
+    def test_final_statuses_cannot_be_left(self):
+        self.assertEqual(self.patch({'status': 'completed'}).status_code, status.HTTP_200_OK)
+
+        for target in ('in_progress', 'cancelled'):
+            with self.subTest(target=target):
+                response = self.patch({'status': target})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('status', response.data)
+
+    def test_unknown_status_is_rejected(self):
+        response = self.patch({'status': 'shipped'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unchanged_values_write_nothing(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.patch({'status': 'in_progress', 'title': "Logo Design"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([query for query in context.captured_queries if query['sql'].startswith('UPDATE')])
+        self.assertEqual(response.data['version'], 1)
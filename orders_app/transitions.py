@@ -0,0 +1,132 @@
+"""
+Optimistic concurrency for order updates.
+
+Every order carries a ``version``. An update is applied as one
+``UPDATE ... WHERE id = ? AND version = ?`` that writes only the changed
+columns and increments the version. If another request changed the order
+in the meantime no row matches and the update is rejected with 409
+instead of silently overwriting the other write. No row locks are held.
+``bulk_transition()`` does the same for many orders with one UPDATE.
+"""
+import operator
+from functools import reduce
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework.exceptions import APIException, ValidationError
+from .counters import apply_count_deltas, count_deltas
+from .models import ORDER_TRANSITIONS, Order
+
+
+class OrderConflict(APIException):
+    status_code = 409
+    default_detail = 'The order was changed by someone else. Reload it and try again.'
+    default_code = 'conflict'
+
+
+def can_transition(current, target):
+    return current == target or target in ORDER_TRANSITIONS.get(current, ())
+
+
+def source_statuses(target):
+    """Return the statuses an order may be moved to ``target`` from."""
+    return [status for status, targets in ORDER_TRANSITIONS.items() if target in targets]
+
+
+def validate_transition(current, target):
+    if not can_transition(current, target):
+        raise ValidationError({'status': f"Cannot change the status from '{current}' to '{target}'."})
+
+
+@transaction.atomic
+def update_order(order, changes, version=None, features=None):
+    """
+    Apply ``changes`` (field name -> value) to ``order`` if it is still at
+    the version it was loaded with, and at ``version`` if the client sent
+    one. Unchanged fields are skipped; ``features`` replaces the feature
+    links. Raises OrderConflict if the stored version differs.
+    """
+    if version is not None and version != order.version:
+        raise OrderConflict()
+    if 'status' in changes:
+        validate_transition(order.status, changes['status'])
+
+    changes = {
+        field: value for field, value in changes.items()
+        if getattr(order, order._meta.get_field(field).attname) != getattr(value, 'pk', value)
+    }
+    if not changes and features is None:
+        return order
+
+    now = timezone.now()
+    updated = Order.objects.filter(pk=order.pk, version=order.version).update(
+        **changes, version=F('version') + 1, updated_at=now
+    )
+    if not updated:
+        raise OrderConflict()
+
+    before = (order.business_user_id, order.status)
+    for field, value in changes.items():
+        setattr(order, field, value)
+    order.version += 1
+    order.updated_at = now
+    order._counted_as = (order.business_user_id, order.status)
+
+    # QuerySet.update() bypasses the counter signals
+    apply_count_deltas(count_deltas([(before, order._counted_as)]))
+    if features is not None:
+        order.features.set(features)
+    return order
+
+
+@transaction.atomic
+def bulk_transition(user, ids, target):
+    """
+    Move the orders ``ids`` of business ``user`` to status ``target``.
+    Ownership and current status are read with one query and all eligible
+    orders are changed with one UPDATE that is conditional on the version
+    each order was read with. Returns ``{id: result}`` where result is one
+    of updated, unchanged, not_found, forbidden, invalid_transition and
+    conflict.
+    """
+    rows = {
+        row['pk']: row for row in Order.objects.filter(pk__in=ids).values(
+            'pk', 'status', 'version', 'business_user_id', 'business_user__user_id'
+        )
+    }
+    results = {}
+    eligible = {}
+    for pk in ids:
+        row = rows.get(pk)
+        if row is None:
+            results[pk] = 'not_found'
+        elif row['business_user__user_id'] != user.pk:
+            results[pk] = 'forbidden'
+        elif row['status'] == target:
+            results[pk] = 'unchanged'
+        elif not can_transition(row['status'], target):
+            results[pk] = 'invalid_transition'
+        else:
+            eligible[pk] = row
+    if not eligible:
+        return results
+
+    now = timezone.now()
+    Order.objects.filter(
+        reduce(operator.or_, (Q(pk=pk, version=row['version']) for pk, row in eligible.items()))
+    ).update(status=target, version=F('version') + 1, updated_at=now)
+
+    # Orders another request changed after they were read did not match;
+    # the ones this UPDATE changed carry the next version and its timestamp
+    updated = set(Order.objects.filter(
+        reduce(operator.or_, (Q(pk=pk, version=row['version'] + 1) for pk, row in eligible.items())),
+        updated_at=now
+    ).values_list('pk', flat=True))
+
+    for pk in eligible:
+        results[pk] = 'updated' if pk in updated else 'conflict'
+    apply_count_deltas(count_deltas(
+        ((row['business_user_id'], row['status']), (row['business_user_id'], target))
+        for pk, row in eligible.items() if pk in updated
+    ))
+    return results
@@ -1,11 +1,13 @@
 from rest_framework import serializers
 from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.summaries import serialize_summary
 
 class BusinessSerializer(serializers.ModelSerializer):
     
     user = serializers.IntegerField(source="user.id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     type = serializers.CharField(source="user.type", read_only=True)
+    rating_summary = serializers.SerializerMethodField()
 
     class Meta:
         model = BusinessProfile
@@ -19,10 +21,15 @@ class BusinessSerializer(serializers.ModelSerializer):
             "tel",
             "description",
             "working_hours",
-            "type"
+            "type",
+            "rating_summary"
         ]
         read_only_fields = fields
 
+    def get_rating_summary(self, obj):
+        # Business profiles without reviews have no summary row yet
+        return serialize_summary(getattr(obj, 'rating_summary', None))
+
 class CustomerSerializer(serializers.ModelSerializer):
 
     user = serializers.IntegerField(source="user.id", read_only=True)
@@ -11,7 +11,10 @@ from .serializer import(
     CustomerProfileUpdateSerializer
 )
 from auth_app.models import CustomUser
+from core.conditional import conditional_response, latest, make_etag
+from profile_app.loaders import ProfileLoader
 from profile_app.models import BusinessProfile, CustomerProfile
+from reviews_app.summaries import serialize_summary
 from django.shortcuts import get_object_or_404
 
 class BusinessListView(generics.ListAPIView):
@@ -24,7 +27,7 @@ class BusinessListView(generics.ListAPIView):
     authentication_classes = [TokenAuthentication]
 
     def get_queryset(self):
-        return BusinessProfile.objects.all()
+        return BusinessProfile.objects.select_related('rating_summary')
 
 class CustomerListView(generics.ListAPIView):
     """
@@ -46,54 +49,71 @@ class ProfileView(APIView):
     permission_classes = [IsAuthenticated]
     authentication_classes = [TokenAuthentication]
 
+    def get_profile(self, request, user):
+        """
+        Return the profile matching the user's type through the request's
+        profile loader, or None if there is no such user or profile.
+        """
+        user_obj = CustomUser.objects.filter(pk=user).first()
+        if user_obj is None:
+            return None
+        model = BusinessProfile if user_obj.type == 'business' else CustomerProfile
+        return ProfileLoader.for_request(request).get(user_obj, model)
+
+    def profile_not_found(self):
+        return Response(
+            {'detail': 'Profile not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
     def get(self, request, user=None):
         """
         Handle GET requests to retrieve a specific profile by ID.
+        Answers If-None-Match / If-Modified-Since with 304 Not Modified.
         """
-        try:
-            user_obj = CustomUser.objects.get(pk=user)
-            if user_obj.type == 'business':
-                profile = BusinessProfile.objects.get(user=user_obj)
-                serializer = BusinessSerializer(profile)
-            else:
-                profile = CustomerProfile.objects.get(user=user_obj)
-                serializer = CustomerSerializer(profile)
-            return Response(serializer.data)
-        except (BusinessProfile.DoesNotExist, CustomerProfile.DoesNotExist):
-            return Response(
-                {'detail': 'Profile not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
+        profile = self.get_profile(request, user)
+        if profile is None:
+            return self.profile_not_found()
+
+        serializer_class = BusinessSerializer if isinstance(profile, BusinessProfile) else CustomerSerializer
+        last_modified = profile.updated_at
+        etag_parts = [profile.pk, profile.updated_at, profile.user.username, profile.user.type]
+        if isinstance(profile, BusinessProfile):
+            # New reviews change the embedded rating summary
+            summary = getattr(profile, 'rating_summary', None)
+            if summary is not None:
+                last_modified = latest(last_modified, summary.updated_at)
+                etag_parts.append(serialize_summary(summary))
+        etag = make_etag(*etag_parts)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: Response(serializer_class(profile).data)
+        )
+
     def patch(self, request, user=None):
         """
         Handle PATCH requests to update the authenticated user's profile.
         """
-        try:
-            user_obj = CustomUser.objects.get(pk=user)
-            if user_obj.type == 'business':
-                profile = BusinessProfile.objects.get(user=user_obj)
-                serializer = BusinessProfileUpdateSerializer(profile, data=request.data, partial=True)
-            else:
-                profile = CustomerProfile.objects.get(user=user_obj)
-                serializer = CustomerProfileUpdateSerializer(profile, data=request.data, partial=True)
-            
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
-            else: 
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except(BusinessProfile.DoesNotExist, CustomerProfile.DoesNotExist):
-            return Response(
-                {'detail': 'Profile not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        profile = self.get_profile(request, user)
+        if profile is None:
+            return self.profile_not_found()
+
+        if isinstance(profile, BusinessProfile):
+            serializer = BusinessProfileUpdateSerializer(profile, data=request.data, partial=True)
+        else:
+            serializer = CustomerProfileUpdateSerializer(profile, data=request.data, partial=True)
+
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data)
+        else: 
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class BusinessProfileDetailView(generics.RetrieveAPIView):
     """
     Retrieve a specific business profile by ID.
     """
-    queryset = BusinessProfile.objects.all()
+    queryset = BusinessProfile.objects.select_related('rating_summary')
     serializer_class = BusinessSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [TokenAuthentication]
@@ -0,0 +1,109 @@
+"""
+Request-scoped profile resolution.
+
+Permissions, views and serializers frequently need the profile of the same
+user within one request. ``ProfileLoader`` keeps an identity map of the
+profiles resolved so far and loads missing ones in batches, one query per
+profile model.
+"""
+from collections import defaultdict
+from rest_framework import serializers
+from profile_app.models import BusinessProfile, CustomerProfile
+
+PROFILE_MODELS = {
+    'business': BusinessProfile,
+    'customer': CustomerProfile,
+}
+
+
+class ProfileLoader:
+    """
+    Identity map of ``(profile model, user id) -> profile or None``.
+    Use ``ProfileLoader.for_request()`` to share one instance per request.
+    """
+
+    def __init__(self):
+        self._profiles = {}
+
+    @classmethod
+    def for_request(cls, request):
+        """Return the loader of this request, creating it on first use."""
+        # Stored on the underlying HttpRequest, so DRF's Request wrapper and
+        # the plain request share the same loader.
+        http_request = getattr(request, '_request', request)
+        loader = getattr(http_request, '_profile_loader', None)
+        if loader is None:
+            loader = http_request._profile_loader = cls()
+        return loader
+
+    @classmethod
+    def for_context(cls, context):
+        """Return the request's loader, or a private one without a request."""
+        request = context.get('request')
+        return cls.for_request(request) if request is not None else cls()
+
+    @staticmethod
+    def get_model(user):
+        return PROFILE_MODELS.get(getattr(user, 'type', None))
+
+    def get(self, user, model=None):
+        """
+        Return the profile of ``user``, by default the one matching the
+        user's type, or None if there is none.
+        """
+        model = model or self.get_model(user)
+        if model is None or user is None or user.pk is None:
+            return None
+        if (model, user.pk) not in self._profiles:
+            self.prime([user], model)
+        return self._profiles[(model, user.pk)]
+
+    def prime(self, users, model=None):
+        """
+        Resolve the profiles of all ``users`` that are not known yet, reusing
+        profiles fetched through ``select_related`` and loading the rest
+        with one query per profile model.
+        """
+        pending = defaultdict(dict)
+        for user in users:
+            user_model = model or self.get_model(user)
+            if user_model is None or user.pk is None or (user_model, user.pk) in self._profiles:
+                continue
+            cached, profile = self._get_cached(user, user_model)
+            if cached:
+                self._profiles[(user_model, user.pk)] = profile
+            else:
+                pending[user_model][user.pk] = user
+
+        for user_model, users_by_id in pending.items():
+            profiles = {
+                profile.user_id: profile
+                for profile in user_model.objects.filter(user_id__in=users_by_id)
+            }
+            for user_id, user in users_by_id.items():
+                profile = profiles.get(user_id)
+                if profile is not None:
+                    profile.user = user
+                self._profiles[(user_model, user_id)] = profile
+
+    @staticmethod
+    def _get_cached(user, model):
+        """Return ``(True, profile)`` if the profile came with the user already."""
+        accessor = model._meta.get_field('user').remote_field.get_accessor_name()
+        if not getattr(type(user), accessor).is_cached(user):
+            return False, None
+        return True, getattr(user, accessor, None)
+
+
+class ProfilePrimingListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves the profiles of all serialized objects'
+    ``user`` in one batch before the children look them up one by one.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        ProfileLoader.for_context(self.context).prime(
+            item.user for item in items if item.user is not None
+        )
+        return super().to_representation(items)
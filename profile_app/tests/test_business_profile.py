@@ -62,6 +62,7 @@ class BusinessProfileTests(APITestCase):
             "description",
             "working_hours",
             "type",
+            "rating_summary",
         }
 
         for item in data:
@@ -79,6 +80,8 @@ class BusinessProfileTests(APITestCase):
             self.assertEqual(item["description"], "Business description")
             self.assertEqual(item["working_hours"], "9-17")
             self.assertEqual(item["type"], "business")
+            self.assertEqual(item["rating_summary"]["review_count"], 0)
+            self.assertIsNone(item["rating_summary"]["average_rating"])
 
     def test_unauthenticated_user_gets_401(self):
         """
@@ -0,0 +1,43 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from auth_app.models import CustomUser
+from profile_app.models import BusinessProfile
+
+class ProfileConditionalGetTests(APITestCase):
+    """
+    Test ETag / Last-Modified handling of the single profile endpoint.
+    """
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="max_business",
+            password="secret123",
+            type="business"
+        )
+        self.business_profile = BusinessProfile.objects.create(
+            user=self.business_user,
+            first_name="Max",
+            location="Berlin"
+        )
+        self.client.force_authenticate(user=self.business_user)
+        self.url = reverse('user-profile', kwargs={'user': self.business_user.pk})
+
+    def test_profile_sends_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_profile_update_changes_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(self.url, {'location': 'Hamburg'}, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['location'], 'Hamburg')
@@ -0,0 +1,58 @@
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+from auth_app.models import CustomUser
+from profile_app.loaders import ProfileLoader
+from profile_app.models import BusinessProfile, CustomerProfile
+
+class ProfileLoaderTests(TestCase):
+    """
+    Test the request-scoped identity map of user profiles.
+    """
+    def setUp(self):
+        self.business_users = [
+            CustomUser.objects.create_user(username=f"business_{index}", password="secret123", type="business")
+            for index in range(3)
+        ]
+        self.customer_user = CustomUser.objects.create_user(
+            username="customer", password="secret123", type="customer"
+        )
+        for user in self.business_users:
+            BusinessProfile.objects.create(user=user, first_name=user.username)
+        CustomerProfile.objects.create(user=self.customer_user, first_name="Erika")
+
+        # Fresh instances without the profiles cached by the creation above
+        self.business_users = list(CustomUser.objects.filter(type="business").order_by('pk'))
+        self.customer_user = CustomUser.objects.get(pk=self.customer_user.pk)
+
+    def test_profile_is_loaded_once(self):
+        loader = ProfileLoader()
+        with self.assertNumQueries(1):
+            first = loader.get(self.customer_user)
+            second = loader.get(self.customer_user)
+        self.assertIs(first, second)
+        self.assertEqual(first.first_name, "Erika")
+
+    def test_prime_batches_per_profile_model(self):
+        loader = ProfileLoader()
+        with self.assertNumQueries(2):
+            loader.prime([*self.business_users, self.customer_user])
+        with self.assertNumQueries(0):
+            names = [loader.get(user).first_name for user in self.business_users]
+        self.assertEqual(names, ["business_0", "business_1", "business_2"])
+
+    def test_missing_profiles_are_remembered(self):
+        loader = ProfileLoader()
+        with self.assertNumQueries(1):
+            self.assertIsNone(loader.get(self.customer_user, BusinessProfile))
+            self.assertIsNone(loader.get(self.customer_user, BusinessProfile))
+
+    def test_select_related_profiles_are_reused(self):
+        user = CustomUser.objects.select_related('businessprofile_profile').get(pk=self.business_users[0].pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(ProfileLoader().get(user).first_name, "business_0")
+
+    def test_loader_is_shared_per_request(self):
+        http_request = RequestFactory().get('/')
+        request = Request(http_request)
+        self.assertIs(ProfileLoader.for_request(request), ProfileLoader.for_request(http_request))
+        self.assertIsNot(ProfileLoader.for_request(request), ProfileLoader.for_request(RequestFactory().get('/')))
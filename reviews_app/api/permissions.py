@@ -1,6 +1,6 @@
 from rest_framework import permissions
+from profile_app.loaders import ProfileLoader
 from profile_app.models import CustomerProfile
-from reviews_app.models import Review
 from rest_framework import serializers
 
 class IsUserWarranted(permissions.BasePermission):
@@ -10,30 +10,12 @@ class IsUserWarranted(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return request.user.is_authenticated
         
-        # Auth and role check
-        if not self._is_customer(request.user):
-            return False
-        
-        # Prevent duplicate review
-        business_id = request.data.get("business_user")
-        if business_id and self._has_reviewed(request.user, business_id):
-            raise serializers.ValidationError(
-                "You have already reviewed this business user."
-            )
-        return True
+        # Auth and role check. Duplicate reviews are rejected by the
+        # database, see ReviewListView.perform_create.
+        return self._is_customer(request.user)
     
     def _is_customer(self, user) -> bool:
         return user.is_authenticated and getattr(user, "type", None) == "customer"
-    
-    def _has_reviewed(self, user, business_id: int) -> bool:
-        try:
-            profile = CustomerProfile.objects.get(user=user)
-        except CustomerProfile.DoesNotExist:
-            return False
-        return Review.objects.filter(
-            reviewer=profile,
-            business_user=business_id
-        ).exists()
 
 class IsValidRating(permissions.BasePermission):
     """Reject non-int ratings or out-of-range values."""
@@ -64,12 +46,11 @@ class IsUserCreator(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj) -> bool:
         if request.method in ("PATCH", "DELETE"):
-            return self._is_creator(request.user, obj)
+            return self._is_creator(request, obj)
         return True
     
-    def _is_creator(self, user, obj):
-        try:
-            profile = CustomerProfile.objects.get(user=user)
-        except CustomerProfile.DoesNotExist:
+    def _is_creator(self, request, obj):
+        profile = ProfileLoader.for_request(request).get(request.user, CustomerProfile)
+        if profile is None:
             return False
-        return obj.reviewer == profile
\ No newline at end of file
+        return obj.reviewer_id == profile.pk
\ No newline at end of file
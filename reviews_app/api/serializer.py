@@ -6,6 +6,8 @@ class SingleReviewSerializer(serializers.ModelSerializer):
         model = Review
         fields = ['id', 'business_user', 'reviewer', 'rating', 'description', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
+        # Uniqueness of (reviewer, business_user) is left to the database
+        validators = []
 
     def validate_description(self, value):
         if 'description' in self.initial_data and not isinstance(self.initial_data['description'], str):
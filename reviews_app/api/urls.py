@@ -1,7 +1,9 @@
 from django.urls import path
-from .views import ReviewListView, SingleReviewView
+from .views import ReviewListView, SingleReviewView, ReviewExportView, ReviewSummaryView
 
 urlpatterns = [
     path('reviews/', ReviewListView.as_view(), name='review-list'),
+    path('reviews/export/', ReviewExportView.as_view(), name='review-export'),
+    path('reviews/summary/', ReviewSummaryView.as_view(), name='review-summary'),
     path('reviews/<int:pk>/', SingleReviewView.as_view(), name="single-review")
 ]
\ No newline at end of file
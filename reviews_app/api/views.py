@@ -1,13 +1,76 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.shortcuts import get_object_or_404
 from reviews_app.models import Review
-from profile_app.models import CustomerProfile
+from reviews_app.exports import ReviewExporter
+from reviews_app.summaries import get_rating_summary, serialize_summary
+from profile_app.loaders import ProfileLoader
+from profile_app.models import BusinessProfile, CustomerProfile
 from rest_framework import generics
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import ValidationError
 from .serializer import ReviewListSerializer, SingleReviewSerializer
 from .permissions import IsUserWarranted, IsUserCreator, IsValidRating
+from core.exports import ExportView
+from core.pagination import KeysetPagination, KeysetPaginationMixin
 
-class ReviewListView(generics.ListCreateAPIView):
+DUPLICATE_REVIEW_MESSAGE = "You have already reviewed this business user."
+
+def is_duplicate_review(serializer, **kwargs):
+    """
+    Return True if another review of the same customer and business exists,
+    i.e. if saving the serializer violated review_reviewer_business_unique.
+    """
+    instance = serializer.instance
+    fields = {**serializer.validated_data, **kwargs}
+    reviewer = fields.get('reviewer', instance.reviewer if instance else None)
+    business_user = fields.get('business_user', instance.business_user if instance else None)
+    if reviewer is None or business_user is None:
+        return False
+    duplicates = Review.objects.filter(reviewer=reviewer, business_user=business_user)
+    if instance is not None:
+        duplicates = duplicates.exclude(pk=instance.pk)
+    return duplicates.exists()
+
+def save_review(serializer, **kwargs):
+    """
+    Save the review in a transaction, which also covers the rating summary
+    update. A second review of the same business violates the unique
+    constraint on (reviewer, business_user) and is reported as before;
+    any other integrity error is raised unchanged.
+    """
+    try:
+        with transaction.atomic():
+            serializer.save(**kwargs)
+    except IntegrityError:
+        if not is_duplicate_review(serializer, **kwargs):
+            raise
+        raise ValidationError(DUPLICATE_REVIEW_MESSAGE)
+
+class ReviewPageSizeMixin:
+    page_size = 10
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, 'REVIEWS_MAX_PAGE_SIZE', 100)
+
+class ReviewPageNumberPagination(ReviewPageSizeMixin, PageNumberPagination):
+    pass
+
+class ReviewKeysetPagination(ReviewPageSizeMixin, KeysetPagination):
+    pass
+
+class ReviewListView(KeysetPaginationMixin, generics.ListCreateAPIView):
     permission_classes = [IsUserWarranted, IsValidRating]
+    pagination_class = ReviewPageNumberPagination
+    keyset_pagination_class = ReviewKeysetPagination
+    # Only orderings backed by an index on Review may be requested, see Review.Meta.indexes
+    ordering_fields = ['updated_at', 'rating']
+    default_ordering = '-updated_at'
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -25,21 +88,50 @@ class ReviewListView(generics.ListCreateAPIView):
         if reviewer_id is not None:
             queryset = queryset.filter(reviewer=reviewer_id)
 
-        ordering = self.request.query_params.get('ordering')
-        if ordering is not None:
-            queryset = queryset.order_by(ordering)
+        ordering = self.validate_ordering(self.request.query_params.get('ordering') or self.default_ordering)
+        # id in the same direction breaks ties and keeps the index order usable
+        return queryset.order_by(ordering, '-pk' if ordering.startswith('-') else 'pk')
 
-        return queryset
+    def validate_ordering(self, ordering):
+        if ordering.lstrip('-') not in self.ordering_fields:
+            allowed = ', '.join(self.ordering_fields)
+            raise ValidationError({'ordering': f"Invalid ordering '{ordering}'. Allowed fields: {allowed}."})
+        return ordering
     
     def perform_create(self, serializer):
-        try:
-            customer_profile = CustomerProfile.objects.get(user=self.request.user)
-        except CustomerProfile.DoesNotExist:
+        # The only profile lookup of the request
+        customer_profile = ProfileLoader.for_request(self.request).get(self.request.user, CustomerProfile)
+        if customer_profile is None:
             raise ValidationError("The user does not have an associated customer profile.")
-        serializer.save(reviewer=customer_profile)
+        save_review(serializer, reviewer=customer_profile)
 
 class SingleReviewView(generics.RetrieveUpdateDestroyAPIView):
     
     queryset = Review.objects.all()
     serializer_class = SingleReviewSerializer
-    permission_classes = [IsAuthenticated, IsUserWarranted, IsUserCreator, IsValidRating]
\ No newline at end of file
+    permission_classes = [IsAuthenticated, IsUserWarranted, IsUserCreator, IsValidRating]
+
+    def perform_update(self, serializer):
+        save_review(serializer)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+
+class ReviewSummaryView(APIView):
+    """
+    Review count, average rating and rating histogram of the business
+    profile given by ``?business_user=``, read from its rating summary.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        business_user_id = request.query_params.get('business_user')
+        if not business_user_id or not business_user_id.isdigit():
+            raise ValidationError({'business_user': "A business profile id is required."})
+        business_profile = get_object_or_404(BusinessProfile, pk=business_user_id)
+        summary = get_rating_summary(business_profile.pk)
+        return Response({'business_user': business_profile.pk, **serialize_summary(summary)})
+
+class ReviewExportView(ExportView):
+    exporter_class = ReviewExporter
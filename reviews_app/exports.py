@@ -0,0 +1,7 @@
+from core.exports import Exporter
+from .models import Review
+
+class ReviewExporter(Exporter):
+    name = 'reviews'
+    model = Review
+    fields = ['id', 'business_user_id', 'reviewer_id', 'rating', 'description', 'created_at', 'updated_at']
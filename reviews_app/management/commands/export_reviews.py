@@ -0,0 +1,9 @@
+from core.exports import ExportCommand
+from reviews_app.exports import ReviewExporter
+
+class Command(ExportCommand):
+    """
+    Stream reviews as NDJSON or CSV.
+    """
+    help = "Export reviews as NDJSON or CSV."
+    exporters = [ReviewExporter]
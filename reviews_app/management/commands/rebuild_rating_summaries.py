@@ -0,0 +1,24 @@
+from core.aggregates import ReconcileCommand
+from reviews_app.models import BusinessRatingSummary
+from reviews_app.summaries import SUMMARY_FIELDS, compute_rating_summaries
+
+class Command(ReconcileCommand):
+    """
+    Recompute the per-business rating summaries from the reviews table, e.g.
+    after writes that bypassed the signals. All summaries are recomputed
+    with one GROUP BY and rewritten in one transaction.
+    """
+    help = "Rebuild the per-business rating summaries from the reviews."
+    model = BusinessRatingSummary
+    key_fields = ('business_user_id',)
+    value_fields = SUMMARY_FIELDS
+    noun = 'summaries'
+
+    def compute_expected(self):
+        return {(business_user_id,): fields for business_user_id, fields in compute_rating_summaries().items()}
+
+    def describe(self, key, stored, expected):
+        return (
+            f"business profile {key[0]}: {stored['review_count']} reviews, "
+            f"sum {stored['rating_sum']} -> {expected['review_count']} reviews, sum {expected['rating_sum']}"
+        )
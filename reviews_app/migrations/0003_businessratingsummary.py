@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0003_profile_updated_at'),
+        ('reviews_app', '0002_alter_review_created_at_alter_review_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_1', models.IntegerField(default=0)),
+                ('rating_2', models.IntegerField(default=0)),
+                ('rating_3', models.IntegerField(default=0)),
+                ('rating_4', models.IntegerField(default=0)),
+                ('rating_5', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rating_summary', to='profile_app.businessprofile')),
+            ],
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO reviews_app_businessratingsummary
+                (business_user_id, review_count, rating_sum,
+                 rating_1, rating_2, rating_3, rating_4, rating_5, updated_at)
+            SELECT business_user_id, COUNT(*), SUM(rating),
+                   SUM(CASE WHEN rating = 1 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN rating = 2 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN rating = 3 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN rating = 4 THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN rating = 5 THEN 1 ELSE 0 END),
+                   CURRENT_TIMESTAMP
+            FROM reviews_app_review
+            WHERE business_user_id IS NOT NULL
+            GROUP BY business_user_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.8 on 2026-10-18 20:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+def drop_duplicate_reviews(apps, schema_editor):
+    """
+    Keep the latest review of each customer for a business, delete the
+    others and recompute the rating summaries of the affected businesses.
+    """
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessRatingSummary = apps.get_model('reviews_app', 'BusinessRatingSummary')
+
+    duplicates = (
+        Review.objects
+        .filter(reviewer__isnull=False, business_user__isnull=False)
+        .values('reviewer_id', 'business_user_id')
+        .annotate(review_count=Count('pk'), keep=Max('pk'))
+        .filter(review_count__gt=1)
+        .order_by()
+    )
+    business_user_ids = set()
+    for row in duplicates:
+        Review.objects.filter(
+            reviewer_id=row['reviewer_id'], business_user_id=row['business_user_id']
+        ).exclude(pk=row['keep']).delete()
+        business_user_ids.add(row['business_user_id'])
+
+    for business_user_id in business_user_ids:
+        totals = Review.objects.filter(business_user_id=business_user_id).aggregate(
+            review_count=Count('pk'),
+            rating_sum=Sum('rating'),
+            **{f'rating_{rating}': Count('pk', filter=Q(rating=rating)) for rating in range(1, 6)}
+        )
+        totals['rating_sum'] = totals['rating_sum'] or 0
+        BusinessRatingSummary.objects.update_or_create(business_user_id=business_user_id, defaults=totals)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0003_profile_updated_at'),
+        ('reviews_app', '0003_businessratingsummary'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_reviews, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('reviewer', 'business_user'), name='review_reviewer_business_unique'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='reviewer',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='assigned_customer_reviewer', to='profile_app.customerprofile'),
+        ),
+    ]
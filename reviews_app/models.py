@@ -1,25 +1,89 @@
 from django.db import models
+from core.aggregates import remember_loaded_values
 from profile_app.models import CustomerProfile, BusinessProfile
 
+# Review fields that decide how a review counts towards BusinessRatingSummary
+SUMMARIZED_FIELDS = ('business_user_id', 'rating')
+
 class Review(models.Model):
     business_user = models.ForeignKey(
         BusinessProfile, 
         on_delete=models.CASCADE, 
         related_name='assigned_business_user', 
         null=True, 
-        blank=True
+        blank=True,
+        db_index=False
     )
     reviewer = models.ForeignKey(
         CustomerProfile, 
         on_delete=models.CASCADE, 
         related_name='assigned_customer_reviewer', 
         null=True, 
-        blank=True
+        blank=True,
+        db_index=False
     )
     rating = models.IntegerField()
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            # One review per customer and business; its index also serves
+            # lookups by reviewer alone
+            models.UniqueConstraint(fields=['reviewer', 'business_user'], name='review_reviewer_business_unique'),
+        ]
+        # One index per filter and ordering of GET /api/reviews/, so every
+        # page is read in index order. They also cover lookups by business.
+        indexes = [
+            models.Index(fields=['business_user', 'updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', 'updated_at'], name='review_reviewer_updated_idx'),
+            models.Index(fields=['updated_at'], name='review_updated_idx'),
+            models.Index(fields=['rating'], name='review_rating_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the stored row counts towards in the rating summary,
+        # so saving a changed rating needs no extra query (see reviews_app/summaries.py)
+        remember_loaded_values(instance, '_summarized_as', SUMMARIZED_FIELDS)
+        return instance
+
     def __str__(self):
         return f"{self.rating}"
+
+RATINGS = (1, 2, 3, 4, 5)
+
+class BusinessRatingSummary(models.Model):
+    """
+    Review count, rating sum and rating histogram of one business profile,
+    kept up to date by the signals in reviews_app/signals.py.
+    """
+    business_user = models.OneToOneField(
+        BusinessProfile,
+        on_delete=models.CASCADE,
+        related_name='rating_summary'
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+    @property
+    def histogram(self):
+        return {str(rating): getattr(self, f'rating_{rating}') for rating in RATINGS}
+
+    def __str__(self):
+        return f"{self.business_user_id}: {self.review_count}"
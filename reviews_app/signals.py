@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.aggregates import remember_stored_values
+from reviews_app.models import SUMMARIZED_FIELDS, Review
+from reviews_app.summaries import apply_summary_deltas, summary_deltas
+
+def _summary_key(review):
+    return (review.business_user_id, review.rating)
+
+@receiver(pre_save, sender=Review)
+def remember_summarized_rating(sender, instance, **kwargs):
+    """Look up the stored business and rating if the instance did not load them."""
+    remember_stored_values(instance, '_summarized_as', SUMMARIZED_FIELDS)
+
+@receiver(post_save, sender=Review)
+def summarize_saved_review(sender, instance, created, **kwargs):
+    before = None if created else getattr(instance, '_summarized_as', None)
+    after = _summary_key(instance)
+    apply_summary_deltas(summary_deltas([(before, after)]))
+    instance._summarized_as = after
+
+@receiver(post_delete, sender=Review)
+def summarize_deleted_review(sender, instance, **kwargs):
+    before = getattr(instance, '_summarized_as', None) or _summary_key(instance)
+    apply_summary_deltas(summary_deltas([(before, None)]))
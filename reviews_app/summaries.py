@@ -0,0 +1,85 @@
+"""
+Materialized rating summaries per business profile.
+
+BusinessRatingSummary holds the review count, the rating sum and a 1-5
+rating histogram of every business profile. Saving or deleting a review
+adjusts the affected rows with ``field = field + delta`` through the
+signals in reviews_app/signals.py, inside the transaction of the write.
+Writes that bypass the signals, like ``QuerySet.update()``, report their
+changes with ``apply_summary_deltas()``; ``rebuild_rating_summaries``
+repairs any drift.
+"""
+from collections import Counter, defaultdict
+from django.db.models import Count, Q, Sum
+from core.aggregates import apply_deltas
+from .models import RATINGS, BusinessRatingSummary, Review
+
+SUMMARY_FIELDS = ('review_count', 'rating_sum') + tuple(f'rating_{rating}' for rating in RATINGS)
+
+
+def summary_deltas(changes):
+    """
+    Turn ``(before, after)`` pairs of ``(business_user_id, rating)`` keys
+    into per-business deltas of the summary fields. ``None`` stands for no
+    review.
+    """
+    deltas = defaultdict(Counter)
+    for before, after in changes:
+        if before == after:
+            continue
+        for key, sign in ((before, -1), (after, 1)):
+            if key is None or not key[0]:
+                continue
+            business_user_id, rating = key
+            deltas[business_user_id]['review_count'] += sign
+            deltas[business_user_id]['rating_sum'] += sign * rating
+            if rating in RATINGS:
+                deltas[business_user_id][f'rating_{rating}'] += sign
+    return deltas
+
+
+def apply_summary_deltas(deltas):
+    """Add the deltas to the summaries, creating rows that are incremented for the first time."""
+    apply_deltas(
+        BusinessRatingSummary,
+        ('business_user_id',),
+        {(business_user_id,): fields for business_user_id, fields in deltas.items()}
+    )
+
+
+def serialize_summary(summary):
+    """Return the API representation of a summary, or of an empty one for None."""
+    if summary is None:
+        summary = BusinessRatingSummary()
+    return {
+        'review_count': summary.review_count,
+        'average_rating': summary.average_rating,
+        'rating_histogram': summary.histogram,
+    }
+
+
+def get_rating_summary(business_user_id):
+    """Return the summary of one business profile, or None if it has no reviews yet."""
+    return BusinessRatingSummary.objects.filter(business_user_id=business_user_id).first()
+
+
+def compute_rating_summaries():
+    """Aggregate all reviews into summary field values per business profile."""
+    rows = (
+        Review.objects
+        .filter(business_user__isnull=False)
+        .values('business_user_id')
+        .annotate(
+            review_count=Count('pk'),
+            rating_sum=Sum('rating'),
+            **{
+                f'rating_{rating}': Count('pk', filter=Q(rating=rating))
+                for rating in RATINGS
+            }
+        )
+        .order_by()
+    )
+    return {
+        row['business_user_id']: {name: row[name] for name in SUMMARY_FIELDS}
+        for row in rows
+    }
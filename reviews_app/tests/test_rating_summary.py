@@ -0,0 +1,151 @@
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from reviews_app.models import BusinessRatingSummary, Review
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class RatingSummaryTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="testbusiness",
+            password="testpass123",
+            type='business'
+        )
+        self.business_profile = BusinessProfile.objects.create(user=self.business_user)
+
+        self.customer_profiles = []
+        for index in range(3):
+            customer_user = CustomUser.objects.create_user(
+                username=f"testcustomer{index}",
+                password="testpass123",
+                type='customer'
+            )
+            self.customer_profiles.append(CustomerProfile.objects.create(user=customer_user))
+
+        self.reviews = [
+            Review.objects.create(
+                business_user=self.business_profile,
+                reviewer=self.customer_profiles[index],
+                rating=rating,
+                description=f"Review {index}"
+            )
+            for index, rating in enumerate((5, 4))
+        ]
+        self.client.force_authenticate(user=self.customer_profiles[0].user)
+
+    def summary(self):
+        return BusinessRatingSummary.objects.get(business_user=self.business_profile)
+
+    def assertSummary(self, review_count, rating_sum, histogram):
+        summary = self.summary()
+        self.assertEqual(summary.review_count, review_count)
+        self.assertEqual(summary.rating_sum, rating_sum)
+        self.assertEqual(summary.histogram, histogram)
+
+    def test_creating_reviews_updates_the_summary(self):
+        self.assertSummary(2, 9, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1})
+        self.assertEqual(self.summary().average_rating, 4.5)
+
+    def test_rating_changes_move_the_histogram(self):
+        self.reviews[0].rating = 2
+        self.reviews[0].save()
+        self.reviews[0].save()
+
+        review = Review.objects.only('description').get(pk=self.reviews[1].pk)
+        review.rating = 1
+        review.save()
+
+        self.assertSummary(2, 3, {'1': 1, '2': 1, '3': 0, '4': 0, '5': 0})
+
+    def test_deleting_reviews_updates_the_summary(self):
+        self.reviews[0].delete()
+        self.assertSummary(1, 4, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 0})
+
+        Review.objects.all().delete()
+        self.assertSummary(0, 0, {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0})
+        self.assertIsNone(self.summary().average_rating)
+
+    def test_api_writes_update_the_summary(self):
+        customer_user = self.customer_profiles[2].user
+        self.client.force_authenticate(user=customer_user)
+        response = self.client.post(
+            reverse('review-list'),
+            {'business_user': self.business_profile.pk, 'rating': 3, 'description': "Okay"},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertSummary(3, 12, {'1': 0, '2': 0, '3': 1, '4': 1, '5': 1})
+
+        url = reverse('single-review', kwargs={'pk': response.data['id']})
+        self.client.patch(url, {'rating': 5}, format='json')
+        self.assertSummary(3, 14, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 2})
+
+        self.client.delete(url)
+        self.assertSummary(2, 9, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1})
+
+    def test_summary_endpoint(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('review-summary'), {'business_user': self.business_profile.pk})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'business_user': self.business_profile.pk,
+            'review_count': 2,
+            'average_rating': 4.5,
+            'rating_histogram': {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1},
+        })
+
+    def test_summary_endpoint_validates_the_business_user(self):
+        url = reverse('review-summary')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'business_user': 'abc'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'business_user': 9999}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_business_without_reviews_has_an_empty_summary(self):
+        other_user = CustomUser.objects.create_user(username="otherbusiness", password="testpass123", type='business')
+        other_profile = BusinessProfile.objects.create(user=other_user)
+
+        response = self.client.get(reverse('review-summary'), {'business_user': other_profile.pk})
+        self.assertEqual(response.data['review_count'], 0)
+        self.assertIsNone(response.data['average_rating'])
+
+    def test_business_profiles_embed_the_summary(self):
+        response = self.client.get(reverse('user-profile', kwargs={'user': self.business_user.pk}))
+        self.assertEqual(response.data['rating_summary']['review_count'], 2)
+        self.assertEqual(response.data['rating_summary']['average_rating'], 4.5)
+
+    def test_new_reviews_change_the_profile_etag(self):
+        url = reverse('user-profile', kwargs={'user': self.business_user.pk})
+        etag = self.client.get(url)['ETag']
+        Review.objects.create(
+            business_user=self.business_profile, reviewer=self.customer_profiles[2], rating=1, description="Meh"
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rating_summary']['review_count'], 3)
+
+    def test_base_info_reads_the_summaries(self):
+        response = self.client.get(reverse('base-info'))
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertEqual(response.data['average_rating'], 4.5)
+
+    def test_rebuild_command_repairs_drift(self):
+        # Drift introduced by writes that bypass the signals
+        Review.objects.filter(pk=self.reviews[0].pk).update(rating=1)
+        BusinessRatingSummary.objects.create(
+            business_user=BusinessProfile.objects.create(
+                user=CustomUser.objects.create_user(username="ghost", password="testpass123", type='business')
+            ),
+            review_count=7
+        )
+
+        output = StringIO()
+        call_command('rebuild_rating_summaries', stdout=output)
+
+        self.assertIn("Fixed 2 drifted summaries.", output.getvalue())
+        self.assertSummary(2, 5, {'1': 1, '2': 0, '3': 0, '4': 1, '5': 0})
+        self.assertEqual(BusinessRatingSummary.objects.count(), 1)
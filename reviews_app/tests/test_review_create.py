@@ -0,0 +1,89 @@
+from unittest import mock
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from reviews_app.api.serializer import SingleReviewSerializer
+from reviews_app.models import BusinessRatingSummary, Review
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class ReviewCreateTestCase(APITestCase):
+    def setUp(self):
+        self.business_profiles = []
+        for index in range(2):
+            business_user = CustomUser.objects.create_user(
+                username=f"testbusiness{index}",
+                password="testpass123",
+                type='business'
+            )
+            self.business_profiles.append(BusinessProfile.objects.create(user=business_user))
+
+        self.customer_user = CustomUser.objects.create_user(
+            username="testcustomer",
+            password="testpass123",
+            type='customer'
+        )
+        self.customer_profile = CustomerProfile.objects.create(user=self.customer_user)
+        self.client.force_authenticate(user=self.customer_user)
+
+    def post_review(self, business_profile, rating=5):
+        return self.client.post(
+            reverse('review-list'),
+            {'business_user': business_profile.pk, 'rating': rating, 'description': "Great service!"},
+            format='json'
+        )
+
+    def test_database_rejects_a_second_review(self):
+        Review.objects.create(
+            business_user=self.business_profiles[0], reviewer=self.customer_profile, rating=5, description="First"
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Review.objects.create(
+                business_user=self.business_profiles[0], reviewer=self.customer_profile, rating=1, description="Second"
+            )
+
+    def test_post_takes_one_profile_lookup_and_one_insert(self):
+        # The summary row exists already, so the signal only updates it
+        BusinessRatingSummary.objects.create(business_user=self.business_profiles[0])
+        # A user without the profile cached, as loaded by the authentication
+        self.client.force_authenticate(user=CustomUser.objects.get(pk=self.customer_user.pk))
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.post_review(self.business_profiles[0])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        statements = [query['sql'] for query in context.captured_queries]
+        self.assertEqual(len([sql for sql in statements if 'profile_app_customerprofile' in sql]), 1)
+        self.assertEqual(len([sql for sql in statements if sql.startswith('INSERT INTO "reviews_app_review"')]), 1)
+        self.assertFalse([sql for sql in statements if sql.startswith('SELECT') and 'reviews_app_review' in sql])
+
+    def test_duplicate_post_keeps_the_summary(self):
+        self.post_review(self.business_profiles[0], rating=5)
+        response = self.post_review(self.business_profiles[0], rating=1)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, ["You have already reviewed this business user."])
+        summary = BusinessRatingSummary.objects.get(business_user=self.business_profiles[0])
+        self.assertEqual((summary.review_count, summary.rating_sum), (1, 5))
+
+    def test_moving_a_review_onto_a_reviewed_business_is_rejected(self):
+        self.post_review(self.business_profiles[0])
+        review_id = self.post_review(self.business_profiles[1]).data['id']
+
+        response = self.client.patch(
+            reverse('single-review', kwargs={'pk': review_id}),
+            {'business_user': self.business_profiles[0].pk},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, ["You have already reviewed this business user."])
+        self.assertEqual(Review.objects.get(pk=review_id).business_user, self.business_profiles[1])
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        error = IntegrityError("NOT NULL constraint failed: reviews_app_review.rating")
+        with mock.patch.object(SingleReviewSerializer, 'save', side_effect=error):
+            with self.assertRaises(IntegrityError):
+                self.post_review(self.business_profiles[0])
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from reviews_app.models import Review
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+def read_stream(response):
+    return b''.join(response.streaming_content).decode('utf-8')
+
+class ReviewExportTestCase(APITestCase):
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(
+            username="admin",
+            password="testpass123",
+            type="customer",
+            is_staff=True
+        )
+        business_user = CustomUser.objects.create_user(
+            username="testbusiness",
+            password="testpass123",
+            type="business"
+        )
+        self.business_profile = BusinessProfile.objects.create(user=business_user)
+
+        self.reviews = []
+        for index in range(3):
+            customer_user = CustomUser.objects.create_user(
+                username=f"testcustomer{index}",
+                password="testpass123",
+                type="customer"
+            )
+            self.reviews.append(Review.objects.create(
+                business_user=self.business_profile,
+                reviewer=CustomerProfile.objects.create(user=customer_user),
+                rating=index + 3,
+                description=f"Review {index}"
+            ))
+        self.client.force_authenticate(user=self.admin)
+
+    def test_ndjson_export_streams_one_object_per_review(self):
+        response = self.client.get(reverse('review-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [review.pk for review in self.reviews])
+        self.assertEqual(rows[0]['business_user_id'], self.business_profile.pk)
+        self.assertEqual(rows[0]['reviewer_id'], self.reviews[0].reviewer_id)
+        self.assertEqual(rows[2]['rating'], 5)
+        self.assertEqual(rows[2]['description'], "Review 2")
+
+    def test_csv_export(self):
+        response = self.client.get(reverse('review-export'), {'output': 'csv'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('reviews.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+        self.assertEqual([row['rating'] for row in rows], ['3', '4', '5'])
+
+    def test_updated_since_limits_the_rows(self):
+        cutoff = timezone.now() + timedelta(minutes=1)
+        Review.objects.filter(pk=self.reviews[0].pk).update(updated_at=cutoff + timedelta(minutes=1))
+
+        response = self.client.get(reverse('review-export'), {'updated_since': cutoff.isoformat()})
+        rows = [json.loads(line) for line in read_stream(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.reviews[0].pk])
+
+    def test_export_is_staff_only(self):
+        self.client.force_authenticate(user=self.reviews[0].reviewer.user)
+        response = self.client.get(reverse('review-export'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_command(self):
+        stdout = io.StringIO()
+        call_command('export_reviews', output='csv', stdout=stdout)
+        rows = list(csv.DictReader(io.StringIO(stdout.getvalue())))
+        self.assertEqual(len(rows), 3)
@@ -0,0 +1,102 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from rest_framework import status
+from reviews_app.api.views import ReviewListView
+from reviews_app.models import Review
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+from core.testing import explain
+
+def create_user(username, type):
+    user = CustomUser.objects.create_user(username=username, password="testpass123", type=type)
+    profile_model = BusinessProfile if type == 'business' else CustomerProfile
+    return user, profile_model.objects.create(user=user)
+
+class ReviewListTestCase(APITestCase):
+    def setUp(self):
+        self.business_user, self.business_profile = create_user("testbusiness", "business")
+        _, self.other_business_profile = create_user("otherbusiness", "business")
+        self.customers = [create_user(f"testcustomer{index}", "customer") for index in range(12)]
+        for index, (_, customer_profile) in enumerate(self.customers):
+            Review.objects.create(
+                business_user=self.business_profile if index < 10 else self.other_business_profile,
+                reviewer=customer_profile,
+                rating=index % 5 + 1,
+                description=f"Review {index}"
+            )
+        self.client.force_authenticate(user=self.customers[0][0])
+
+    def get_reviews(self, **params):
+        return self.client.get(reverse('review-list'), params)
+
+    def test_list_is_paginated_newest_first(self):
+        response = self.get_reviews()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertIsNotNone(response.data['next'])
+        expected = list(Review.objects.order_by('-updated_at', '-pk').values_list('pk', flat=True)[:10])
+        self.assertEqual([review['id'] for review in response.data['results']], expected)
+
+    def test_filters_and_ordering(self):
+        response = self.get_reviews(business_user=self.business_profile.pk, ordering='rating', page_size=20)
+
+        self.assertEqual(response.data['count'], 10)
+        ratings = [review['rating'] for review in response.data['results']]
+        self.assertEqual(ratings, sorted(ratings))
+
+    @override_settings(REVIEWS_MAX_PAGE_SIZE=5)
+    def test_page_size_is_capped(self):
+        self.assertEqual(len(self.get_reviews(page_size=1000).data['results']), 5)
+        self.assertEqual(len(self.get_reviews(pagination='cursor', page_size=1000).data['results']), 5)
+
+    def test_unindexed_ordering_is_rejected(self):
+        for ordering in ('description', '-created_at', 'reviewer__user__password'):
+            with self.subTest(ordering=ordering):
+                response = self.get_reviews(ordering=ordering)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('ordering', response.data)
+
+class ReviewListQueryPlanTestCase(TestCase):
+    """Every filter and ordering combination is answered by an index."""
+
+    def setUp(self):
+        self.user, _ = create_user("testcustomer", "customer")
+
+    def review_list_queryset(self, params):
+        view = ReviewListView()
+        request = APIRequestFactory().get('/api/reviews/', params)
+        force_authenticate(request, user=self.user)
+        view.request = view.initialize_request(request)
+        view.request.user = self.user
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def test_every_combination_uses_an_index(self):
+        business = {'business_user': 1}
+        reviewer = {'reviewer_user': 1}
+        # Filters and the index that serves them per ordering field
+        for filters, indexes in (
+            ({}, {'updated_at': 'review_updated_idx', 'rating': 'review_rating_idx'}),
+            (business, {'updated_at': 'review_business_updated_idx', 'rating': 'review_business_rating_idx'}),
+            (reviewer, {'updated_at': 'review_reviewer_updated_idx', 'rating': None}),
+            # At most one row, found through the unique constraint
+            ({**business, **reviewer}, {'updated_at': None, 'rating': None}),
+        ):
+            for field, index in indexes.items():
+                for ordering in (field, f'-{field}'):
+                    with self.subTest(ordering=ordering, **filters):
+                        plan = explain(self.review_list_queryset({**filters, 'ordering': ordering}))
+                        review_steps = [step for step in plan if 'reviews_app_review ' in f'{step} ']
+                        self.assertTrue(review_steps, plan)
+                        self.assertIn('USING INDEX', review_steps[0])
+                        if index is not None:
+                            self.assertIn(index, review_steps[0])
+                            self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
+
+    def test_default_ordering_reads_the_index(self):
+        plan = explain(self.review_list_queryset({}))
+        self.assertIn('review_updated_idx', plan[0])
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
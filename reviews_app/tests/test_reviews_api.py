@@ -47,9 +47,19 @@ class ReviewAPITestCase(APITestCase):
             description="Sehr professioneller Service"
         )
 
+        # A customer can review a business only once
+        other_customer_user = CustomUser.objects.create_user(
+            username="testcustomer2",
+            password="testpass123",
+            type='customer'
+        )
+        other_customer_profile = CustomerProfile.objects.create(
+            user=other_customer_user,
+            username="test_customer2"
+        )
         Review.objects.create(
             business_user=self.business_profile,
-            reviewer=self.customer_profile,
+            reviewer=other_customer_profile,
             rating=5,
             description="Top Qualität und schnelle Lieferung!"
         )
@@ -62,15 +72,16 @@ class ReviewAPITestCase(APITestCase):
         # Check if the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Check if the response data is a list
-        self.assertIsInstance(response.data, list)
+        # Check if the response data is a page of reviews
+        self.assertEqual(set(response.data.keys()), {"count", "next", "previous", "results"})
+        self.assertIsInstance(response.data["results"], list)
 
         # Check if each review in the response has the required fields
         required_fields = {
             "id", "business_user", "reviewer", "rating", "description", "created_at", "updated_at"
         }
 
-        for review in response.data:
+        for review in response.data["results"]:
             self.assertTrue(required_fields.issubset(review.keys()))
 
             # Check the data types of the fields
@@ -274,6 +285,8 @@ class ReviewAPITestCase(APITestCase):
         }
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, ["You have already reviewed this business user."])
+        self.assertEqual(Review.objects.filter(business_user=new_business_profile).count(), 1)
 
     def test_post_review_with_string_numeric_rating(self):
         """Posting a review with rating as a numeric string should be rejected."""
@@ -0,0 +1,54 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from reviews_app.models import Review
+from profile_app.models import BusinessProfile, CustomerProfile
+from auth_app.models import CustomUser
+
+class ReviewKeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.business_user = CustomUser.objects.create_user(
+            username="testbusiness",
+            password="testpass123",
+            type='business'
+        )
+        self.business_profile = BusinessProfile.objects.create(
+            user=self.business_user,
+            username="test_business"
+        )
+
+        self.customer_users = []
+        for index in range(7):
+            customer_user = CustomUser.objects.create_user(
+                username=f"testcustomer{index}",
+                password="testpass123",
+                type='customer'
+            )
+            customer_profile = CustomerProfile.objects.create(
+                user=customer_user,
+                username=f"test_customer{index}"
+            )
+            Review.objects.create(
+                business_user=self.business_profile,
+                reviewer=customer_profile,
+                rating=index % 3 + 1,
+                description=f"Review {index}"
+            )
+            self.customer_users.append(customer_user)
+
+        self.client.force_authenticate(user=self.customer_users[0])
+
+    def test_walk_by_rating(self):
+        url = reverse('review-list')
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 3, 'ordering': '-rating'})
+
+        ids = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [review['id'] for review in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        expected = list(Review.objects.order_by('-rating', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)